@@ -2,10 +2,34 @@
 import google.generativeai as genai
 from pathlib import Path
 import csv
+import re
 import time
 from PIL import Image
 import json
 
+from ecommerce_scraper.screenshot_store import load_screenshot
+
+# Formats de capture, par ordre de préférence quand une page en a plusieurs
+SCREENSHOT_PATTERNS = ("page_*.png", "page_*.jpg", "page_*.webp", "page_*.json")
+# page_07_laptops.png, page_07_w2_laptops.webp (worker du pool)...
+PAGE_FILE = re.compile(r"page_(\d+)_")
+
+
+def screenshots_by_page(folder):
+    """
+    Une capture par page, numéro lu dans le nom du fichier
+    
+    Returns:
+        list: Tuples (numéro de page, chemin) triés par page
+    """
+    pages = {}
+    for pattern in SCREENSHOT_PATTERNS:
+        for path in sorted(folder.glob(pattern)):
+            match = PAGE_FILE.match(path.name)
+            if match:
+                pages.setdefault(int(match.group(1)), path)
+    return sorted(pages.items())
+
 class ScreenshotAnalyzer:
     def __init__(self, api_key):
         """Initialise l'analyseur avec l'API Gemini"""
@@ -30,8 +54,8 @@ class ScreenshotAnalyzer:
         try:
             print(f"🔍 Analyse de la page {page_number}...")
             
-            # Charger l'image
-            img = Image.open(image_path)
+            # Charger l'image (fichier image ou manifeste de tuiles)
+            img = load_screenshot(image_path)
             
             # Prompt pour Gemini
             prompt = """
@@ -111,8 +135,9 @@ class ScreenshotAnalyzer:
             print(f"❌ Le dossier {screenshots_folder} n'existe pas!")
             return
         
-        # Récupérer tous les fichiers PNG
-        screenshot_files = sorted(screenshots_path.glob("page_*.png"))
+        # Récupérer les captures (PNG, JPEG, WebP ou manifestes de tuiles),
+        # une seule par page si une page a été capturée dans plusieurs formats
+        screenshot_files = screenshots_by_page(screenshots_path)
         
         if not screenshot_files:
             print(f"❌ Aucune capture d'écran trouvée dans {screenshots_folder}")
@@ -126,10 +151,8 @@ class ScreenshotAnalyzer:
         all_results = []
         
         # Analyser chaque capture
-        for idx, screenshot_file in enumerate(screenshot_files, 1):
-            page_num = idx
-            
-            print(f"\n📄 PAGE {page_num}/{len(screenshot_files)}")
+        for idx, (page_num, screenshot_file) in enumerate(screenshot_files, 1):
+            print(f"\n📄 PAGE {page_num} ({idx}/{len(screenshot_files)})")
             print("-" * 70)
             
             analysis = self.analyze_screenshot(screenshot_file, page_num)
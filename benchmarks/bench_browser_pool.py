@@ -0,0 +1,54 @@
+# benchmarks/bench_browser_pool.py
+"""
+Benchmark du pool de navigateurs: pages/minute en fonction de N
+
+Chaque mesure lance `scrapy crawl laptops -a workers=N` dans un dossier
+temporaire contre la copie locale du site (benchmarks/fixture_site.py).
+
+Usage:
+    python benchmarks/bench_browser_pool.py --workers 1 2 4 --delay 0.2
+"""
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from crawl_runner import run_crawl  # noqa: E402
+from fixture_site import FixtureSite  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du pool de navigateurs")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2, help="Latence simulée par requête (s)")
+    args = parser.parse_args()
+
+    site = FixtureSite(delay=args.delay)
+    url = site.start()
+    print(f"🌐 Site de test local: {url}")
+
+    results = []
+    try:
+        for workers in args.workers:
+            print(f"⏱️ Crawl avec {workers} navigateur(s)...")
+            result = run_crawl('laptops', {
+                'workers': workers,
+                'max_pages': args.max_pages,
+                'start_url': url,
+            })
+            results.append((workers, result['elapsed'], result['pages'], result['items']))
+    finally:
+        site.stop()
+
+    baseline = results[0][2] / results[0][1] if results else 0
+    print(f"\n{'N':>3} | {'durée (s)':>10} | {'pages':>5} | {'items':>5} | {'pages/min':>9} | {'gain':>5}")
+    print("-" * 52)
+    for workers, elapsed, pages, items in results:
+        rate = pages / elapsed
+        gain = rate / baseline if baseline else 0
+        print(f"{workers:>3} | {elapsed:>10.1f} | {pages:>5} | {items:>5} | {rate * 60:>9.1f} | {gain:>4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/bench_browser_profile.py
+"""
+Temps de chargement et mémoire du navigateur avec et sans blocage réseau
+
+Charge plusieurs fois le listing de la copie locale du site (images, police
+web et script d'analytics compris) avec le profil allégé, une fois sans
+blocage et une fois avec les catégories de BROWSER_BLOCK, puis compare:
+    - le temps de chargement (navigationStart -> loadEventEnd)
+    - le nombre de requêtes servies par le site
+    - la mémoire du renderer (tas JS via Performance.getMetrics) et la RSS
+      de l'arbre de processus Chrome
+
+Usage:
+    python benchmarks/bench_browser_profile.py --loads 10 --delay 0.05
+"""
+from pathlib import Path
+import argparse
+import statistics
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from crawl_runner import tree_rss_kb  # noqa: E402
+from fixture_site import FixtureSite  # noqa: E402
+from ecommerce_scraper.browser import blocked_url_patterns, create_driver  # noqa: E402
+
+LOAD_TIME_JS = """
+var timing = performance.getEntriesByType('navigation')[0];
+return timing ? timing.loadEventEnd - timing.startTime : null;
+"""
+
+
+def measure(site, url, loads, profile, headless, blocked):
+    """Charge `loads` fois le listing et renvoie les mesures du navigateur"""
+    driver = create_driver(profile=profile, headless=headless, blocked_patterns=blocked)
+    site.asset_requests = dict.fromkeys(site.asset_requests, 0)
+    try:
+        timings = []
+        for _ in range(loads):
+            driver.get(url)
+            timings.append(driver.execute_script(LOAD_TIME_JS) or 0)
+
+        driver.execute_cdp_cmd('Performance.enable', {})
+        metrics = {
+            metric['name']: metric['value']
+            for metric in driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+        }
+        return {
+            'load_ms': statistics.median(timings),
+            'requests': dict(site.asset_requests),
+            'js_heap_mb': metrics.get('JSHeapUsedSize', 0) / 1024 / 1024,
+            'rss_mb': tree_rss_kb(driver.service.process.pid) / 1024,
+        }
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du profil navigateur allégé")
+    parser.add_argument("--loads", type=int, default=10, help="Chargements du listing par profil")
+    parser.add_argument("--delay", type=float, default=0.05, help="Latence ajoutée par requête (s)")
+    parser.add_argument("--block", default="images,fonts,analytics",
+                        help="Catégories bloquées (comme BROWSER_BLOCK)")
+    parser.add_argument("--with-default", action="store_true",
+                        help="Mesurer aussi le profil par défaut (fenêtre visible)")
+    args = parser.parse_args()
+
+    blocked = blocked_url_patterns(args.block.split(','))
+    runs = [
+        ("lean sans blocage", "lean", True, []),
+        ("lean + blocage", "lean", True, blocked),
+    ]
+    if args.with_default:
+        runs.insert(0, ("default", "default", False, []))
+
+    site = FixtureSite(delay=args.delay)
+    url = site.start()
+    print(f"🌐 Site de test local: {url}")
+
+    results = {}
+    try:
+        for label, profile, headless, patterns in runs:
+            print(f"⏱️ {label}: {args.loads} chargements...")
+            results[label] = measure(site, url, args.loads, profile, headless, patterns)
+    finally:
+        site.stop()
+
+    print(f"\n{'profil':<18} | {'chargement (ms)':>15} | {'images':>6} | {'polices':>7} | "
+          f"{'analytics':>9} | {'tas JS (Mo)':>11} | {'RSS (Mo)':>8}")
+    print("-" * 93)
+    for label, result in results.items():
+        requests = result['requests']
+        print(f"{label:<18} | {result['load_ms']:>15.0f} | {requests['images']:>6} | "
+              f"{requests['fonts']:>7} | {requests['analytics']:>9} | "
+              f"{result['js_heap_mb']:>11.1f} | {result['rss_mb']:>8.0f}")
+
+    full, lean = results["lean sans blocage"], results["lean + blocage"]
+    if lean['load_ms']:
+        print(f"\n🚀 Chargement: {full['load_ms'] / lean['load_ms']:.1f}x plus rapide avec blocage")
+    if full['rss_mb']:
+        print(f"💾 Mémoire Chrome: {lean['rss_mb'] - full['rss_mb']:+.0f} Mo avec blocage")
+
+
+if __name__ == "__main__":
+    main()
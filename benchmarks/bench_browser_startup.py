@@ -0,0 +1,91 @@
+# benchmarks/bench_browser_startup.py
+"""
+Démarrage du navigateur: à froid, profil persistant, Chrome attaché
+
+Mesure, pour des runs courts répétés, le temps entre l'appel à
+create_driver() et le premier listing affiché:
+    - à froid: recherche de Chrome, Selenium Manager, profil vide
+    - chemins en cache + profil persistant (cache HTTP chaud)
+    - attaché au démon Chrome (browser_daemon), déjà lancé et chaud
+
+Usage:
+    python benchmarks/bench_browser_startup.py --runs 5 --delay 0.05
+"""
+from pathlib import Path
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from fixture_site import FixtureSite  # noqa: E402
+from ecommerce_scraper.browser import close_driver, create_driver, resolve_browser_paths  # noqa: E402
+from ecommerce_scraper.browser_daemon import BrowserDaemon  # noqa: E402
+
+
+def measure(url, runs, **options):
+    """Lance `runs` fois un driver, charge le listing et renvoie les temps (ms)"""
+    startups, firsts = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        driver = create_driver(profile="lean", headless=True, **options)
+        startups.append(driver.startup_time * 1000)
+        try:
+            driver.get(url)
+            firsts.append((time.perf_counter() - started) * 1000)
+        finally:
+            close_driver(driver)
+    return {'startup_ms': statistics.median(startups), 'first_page_ms': statistics.median(firsts)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage à chaud du navigateur")
+    parser.add_argument("--runs", type=int, default=5, help="Démarrages par mode")
+    parser.add_argument("--delay", type=float, default=0.05, help="Latence ajoutée par requête (s)")
+    parser.add_argument("--port", type=int, default=9333, help="Port DevTools du démon de test")
+    args = parser.parse_args()
+
+    site = FixtureSite(delay=args.delay)
+    url = site.start()
+    print(f"🌐 Site de test local: {url}")
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench_startup_"))
+    daemon = BrowserDaemon(workdir / "daemon.json", port=args.port, profile_dir=workdir / "daemon")
+    results = {}
+    try:
+        print(f"⏱️ À froid: {args.runs} démarrages...")
+        results["à froid"] = measure(url, args.runs)
+
+        paths = resolve_browser_paths(workdir / "paths.json")
+        print(f"⏱️ Chemins en cache + profil persistant: {args.runs} démarrages...")
+        results["profil chaud"] = measure(
+            url, args.runs, chrome_binary=paths['chrome_binary'],
+            chromedriver_path=paths['chromedriver_path'], profile_dir=workdir / "profile",
+        )
+
+        address = daemon.ensure_running(paths['chrome_binary'])
+        print(f"⏱️ Attaché au démon: {args.runs} démarrages...")
+        results["attaché"] = measure(
+            url, args.runs, chromedriver_path=paths['chromedriver_path'], debugger_address=address,
+        )
+    finally:
+        daemon.stop()
+        site.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n{'mode':<14} | {'démarrage (ms)':>14} | {'1re page (ms)':>13}")
+    print("-" * 47)
+    for label, result in results.items():
+        print(f"{label:<14} | {result['startup_ms']:>14.0f} | {result['first_page_ms']:>13.0f}")
+
+    cold, attached = results["à froid"], results["attaché"]
+    if attached['startup_ms']:
+        print(f"\n🚀 Démarrage: {cold['startup_ms'] / attached['startup_ms']:.1f}x plus rapide attaché au démon")
+
+
+if __name__ == "__main__":
+    main()
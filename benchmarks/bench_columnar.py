@@ -0,0 +1,127 @@
+# benchmarks/bench_columnar.py
+"""
+Instantanés Parquet/Arrow typés vs CSV texte
+
+Écrit N produits (laptops répétés, prix et avis variables) avec
+ColumnarWriter pour plusieurs tailles de run et vérifie que le pic
+mémoire Python (tracemalloc) ne dépend que de la taille des row groups,
+puis compare taille sur disque et temps de relecture du prix moyen:
+CSV (csv.DictReader + float) vs colonne typée (pyarrow).
+
+Usage:
+    python benchmarks/bench_columnar.py --rows 200000 --row-group-rows 10000
+"""
+from pathlib import Path
+import argparse
+import csv
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from ecommerce_scraper.columnar import FORMATS, ColumnarWriter, read_batches  # noqa: E402
+from ecommerce_scraper.sinks import EXPORT_FIELDS  # noqa: E402
+from fixture_site import load_products  # noqa: E402
+
+
+def make_rows(products, rows):
+    for index in range(rows):
+        product = products[index % len(products)]
+        yield {
+            'page': index // 6 + 1,
+            'title': product['title'],
+            'price': f"{float(product['price']) + index % 50:.2f}",
+            'description': product['description'],
+            'reviews': f"{index % 15} reviews",
+            'rating': product['rating'],
+            'link': f"https://webscraper.io/test-sites/e-commerce/ajax/product/{index}",
+            'screenshot': "",
+        }
+
+
+def write_snapshot(path, products, rows, file_format, row_group_rows):
+    tracemalloc.start()
+    started = time.perf_counter()
+    writer = ColumnarWriter(path, EXPORT_FIELDS, file_format, row_group_rows)
+    writer.write_rows(make_rows(products, rows))
+    writer.close()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def csv_mean_price(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        prices = [float(row['price']) for row in csv.DictReader(f)]
+    return sum(prices) / len(prices)
+
+
+def columnar_mean_price(path):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    if path.suffix == FORMATS['parquet']:
+        return pc.mean(pq.read_table(path, columns=['price'])['price']).as_py()
+    with pa.ipc.open_stream(str(path)) as reader:
+        return pc.mean(reader.read_all()['price']).as_py()
+
+
+def check_roundtrip(path, products, rows):
+    """Relecture par row group: mêmes prix que les lignes écrites"""
+    expected = (float(row['price']) for row in make_rows(products, rows))
+    return all(row['price'] == price for batch in read_batches(path) for row, price in zip(batch, expected))
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return (time.perf_counter() - started) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des instantanés colonnaires")
+    parser.add_argument("--rows", type=int, default=200000, help="Lignes du plus gros run")
+    parser.add_argument("--row-group-rows", type=int, default=10000, help="Lignes par row group")
+    args = parser.parse_args()
+
+    products = load_products()
+    workdir = Path(tempfile.mkdtemp(prefix="bench_columnar_"))
+    try:
+        print(f"{'lignes':>8} | {'format':<7} | {'écriture (s)':>12} | {'pic mémoire (Mo)':>16}")
+        print("-" * 54)
+        for rows in (args.rows // 10, args.rows // 2, args.rows):
+            for file_format in ('parquet', 'arrow'):
+                path = workdir / f"run_{rows}{FORMATS[file_format]}"
+                elapsed, peak = write_snapshot(path, products, rows, file_format, args.row_group_rows)
+                print(f"{rows:>8} | {file_format:<7} | {elapsed:>12.2f} | {peak:>16.1f}")
+
+        csv_path = workdir / "run.csv"
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(make_rows(products, args.rows))
+
+        print(f"\n{'fichier':<8} | {'taille (Mo)':>11} | {'prix moyen (ms)':>15}")
+        print("-" * 42)
+        for label, path, reader in (
+            ('csv', csv_path, csv_mean_price),
+            ('parquet', workdir / f"run_{args.rows}{FORMATS['parquet']}", columnar_mean_price),
+            ('arrow', workdir / f"run_{args.rows}{FORMATS['arrow']}", columnar_mean_price),
+        ):
+            elapsed, _ = timed(reader, path)
+            print(f"{label:<8} | {path.stat().st_size / 1024 / 1024:>11.1f} | {elapsed:>15.0f}")
+
+        small = args.rows // 10
+        intact = all(check_roundtrip(workdir / f"run_{small}{suffix}", products, small) for suffix in FORMATS.values())
+        print(f"\n{'✅' if intact else '❌'} Relecture par row group ({small} lignes): prix identiques")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
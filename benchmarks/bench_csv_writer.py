@@ -0,0 +1,111 @@
+# benchmarks/bench_csv_writer.py
+"""
+Débit d'écriture du CSV par niveau de durabilité (disque local)
+
+Écrit N lignes de produit avec DurableCsvWriter en durabilité per-row
+(ancien flush + fsync par ligne), batch (group commit + journal) et none,
+puis vérifie la reprise après crash: un processus fils écrit en batch et
+meurt sans fermer le CSV; le journal est rejoué à la réouverture.
+
+Usage:
+    python benchmarks/bench_csv_writer.py --rows 2000
+    python benchmarks/bench_csv_writer.py --dir /chemin/vers/disque --batch-rows 100
+"""
+from pathlib import Path
+import argparse
+import csv
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from ecommerce_scraper.csv_writer import DURABILITY_LEVELS, DurableCsvWriter  # noqa: E402
+from ecommerce_scraper.extraction import CSV_FIELDS  # noqa: E402
+
+
+def make_row(index):
+    return {
+        'page': index // 6 + 1,
+        'title': f"Laptop {index}",
+        'price': f"{300 + index % 900}.99",
+        'description': "15.6\", Core i5-7200U, 8GB, 256GB SSD, Windows 10 Home",
+        'reviews': index % 15,
+        'rating': index % 5 + 1,
+        'link': f"https://webscraper.io/test-sites/e-commerce/ajax/product/{index}",
+        'screenshot': "",
+    }
+
+
+def measure(path, rows, durability, batch_rows, batch_interval):
+    writer = DurableCsvWriter(path, CSV_FIELDS, durability=durability,
+                              batch_rows=batch_rows, batch_interval=batch_interval)
+    started = time.perf_counter()
+    for index in range(rows):
+        writer.writerow(make_row(index))
+    writer.close()
+    elapsed = time.perf_counter() - started
+    return {'elapsed': elapsed, 'rows_per_s': rows / elapsed, **writer.stats}
+
+
+def crash_writer(path, rows, batch_rows):
+    """Processus fils: écrit en batch puis meurt sans commit ni fermeture"""
+    writer = DurableCsvWriter(path, CSV_FIELDS, durability='batch',
+                              batch_rows=batch_rows, batch_interval=0)
+    for index in range(rows):
+        writer.writerow(make_row(index))
+    os._exit(1)
+
+
+def check_recovery(path, rows, batch_rows):
+    process = multiprocessing.Process(target=crash_writer, args=(path, rows, batch_rows))
+    process.start()
+    process.join()
+    with open(path, encoding='utf-8', newline='') as f:
+        before = sum(1 for _ in csv.DictReader(f))
+    DurableCsvWriter(path, CSV_FIELDS, append=True).close()
+    with open(path, encoding='utf-8', newline='') as f:
+        after = [row for row in csv.DictReader(f)]
+    intact = [row['link'] for row in after] == [make_row(index)['link'] for index in range(rows)]
+    return before, len(after), intact
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du CSV par durabilité")
+    parser.add_argument("--rows", type=int, default=2000, help="Lignes écrites par mode")
+    parser.add_argument("--batch-rows", type=int, default=50, help="Lignes par commit (batch)")
+    parser.add_argument("--batch-interval", type=float, default=1.0, help="Âge maximal d'un lot (s)")
+    parser.add_argument("--dir", help="Dossier de test (défaut: dossier temporaire)")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench_csv_", dir=args.dir))
+    print(f"💾 Dossier de test: {workdir}")
+    results = {}
+    try:
+        for durability in reversed(DURABILITY_LEVELS):
+            print(f"⏱️ {durability}: {args.rows} lignes...")
+            results[durability] = measure(
+                workdir / f"{durability}.csv", args.rows, durability, args.batch_rows, args.batch_interval
+            )
+        crash_rows = args.batch_rows * 3 + args.batch_rows // 2
+        before, after, intact = check_recovery(workdir / "crash.csv", crash_rows, args.batch_rows)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n{'durabilité':<10} | {'durée (s)':>9} | {'lignes/s':>9} | {'commits':>7} | {'fsyncs':>6}")
+    print("-" * 55)
+    for durability, result in results.items():
+        print(f"{durability:<10} | {result['elapsed']:>9.2f} | {result['rows_per_s']:>9.0f} | "
+              f"{result['commits']:>7} | {result['fsyncs']:>6}")
+
+    per_row, batch = results['per-row'], results['batch']
+    print(f"\n🚀 batch: {batch['rows_per_s'] / per_row['rows_per_s']:.1f}x plus rapide que per-row")
+    print(f"{'✅' if intact and after == crash_rows else '❌'} Crash en batch: {before} ligne(s) validées "
+          f"sur {crash_rows}, {after} après rejeu du journal")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_extraction.py
+"""
+Latence d'extraction par page: execute_script unique vs appels par champ
+
+Lance deux crawls Selenium contre la copie locale du site, l'un avec
+-a extraction=legacy et l'autre avec -a extraction=js, puis relit les
+temps d'extraction par page affichés par le spider.
+
+Usage:
+    python benchmarks/bench_extraction.py --max-pages 5
+"""
+from pathlib import Path
+import argparse
+import re
+import statistics
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from crawl_runner import run_crawl  # noqa: E402
+from fixture_site import FixtureSite  # noqa: E402
+
+TIMING_RE = re.compile(r"Extraction \((\w+)\): (\d+) ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'extraction par page")
+    parser.add_argument("--max-pages", type=int, default=5)
+    args = parser.parse_args()
+
+    site = FixtureSite()
+    url = site.start()
+    print(f"🌐 Site de test local: {url}")
+
+    results = {}
+    try:
+        for mode in ('legacy', 'js'):
+            print(f"⏱️ Crawl avec extraction={mode}...")
+            result = run_crawl('laptops', {
+                'max_pages': args.max_pages,
+                'start_url': url,
+                'extraction': mode,
+            })
+            timings = [int(ms) for found_mode, ms in TIMING_RE.findall(result['output'])
+                       if found_mode == mode]
+            results[mode] = (timings, result)
+    finally:
+        site.stop()
+
+    print(f"\n{'mode':<7} | {'pages':>5} | {'items':>5} | {'médiane (ms)':>12} | {'max (ms)':>8}")
+    print("-" * 50)
+    for mode, (timings, result) in results.items():
+        median = statistics.median(timings) if timings else 0
+        worst = max(timings) if timings else 0
+        print(f"{mode:<7} | {len(timings):>5} | {result['items']:>5} | {median:>12.0f} | {worst:>8}")
+
+    legacy, js = (statistics.median(results[m][0] or [0]) for m in ('legacy', 'js'))
+    if js:
+        print(f"\n🚀 Gain par page: {legacy / js:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
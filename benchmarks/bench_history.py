@@ -0,0 +1,118 @@
+# benchmarks/bench_history.py
+"""
+Historique des prix: requêtes SQLite vs relecture des CSV
+
+Remplit une base PriceHistory avec R runs de N produits (quelques prix et
+avis modifiés à chaque run) et écrit le CSV de chaque run, puis compare:
+    - « ce qui a changé depuis le run précédent »: requête vs diff de deux CSV
+    - l'historique d'un produit: requête vs lecture de tous les CSV
+
+Usage:
+    python benchmarks/bench_history.py --runs 30 --products 5000
+"""
+from pathlib import Path
+import argparse
+import csv
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from ecommerce_scraper.extraction import CSV_FIELDS  # noqa: E402
+from ecommerce_scraper.history import PriceHistory  # noqa: E402
+
+
+def make_runs(runs, products, changed):
+    """Génère les items de chaque run (prix/avis modifiés pour `changed` produits)"""
+    random.seed(0)
+    current = {
+        index: {'price': round(random.uniform(300, 1800), 2), 'reviews': random.randint(0, 15)}
+        for index in range(products)
+    }
+    for run in range(runs):
+        for index in random.sample(range(products), changed):
+            current[index] = {'price': round(current[index]['price'] * random.uniform(0.9, 1.1), 2),
+                              'reviews': current[index]['reviews'] + 1}
+        yield [{
+            'page': index // 6 + 1,
+            'title': f"Laptop {index}",
+            'price': f"{values['price']:.2f}",
+            'description': "15.6\", Core i5, 8GB, 256GB SSD",
+            'reviews': str(values['reviews']),
+            'rating': 4,
+            'link': f"https://webscraper.io/test-sites/e-commerce/ajax/product/{index}",
+            'screenshot': "",
+        } for index, values in current.items()]
+
+
+def csv_changes(previous_path, current_path):
+    def load(path):
+        with open(path, newline='', encoding='utf-8') as f:
+            return {row['link']: (row['price'], row['reviews'], row['rating']) for row in csv.DictReader(f)}
+    previous, current = load(previous_path), load(current_path)
+    return [link for link in current.keys() | previous.keys() if current.get(link) != previous.get(link)]
+
+
+def csv_history(paths, link):
+    history = []
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            history.extend(row['price'] for row in csv.DictReader(f) if row['link'] == link)
+    return history
+
+
+def timed(function, *args, repeat=5):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = function(*args)
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'historique des prix")
+    parser.add_argument("--runs", type=int, default=30, help="Runs enregistrés")
+    parser.add_argument("--products", type=int, default=5000, help="Produits par run")
+    parser.add_argument("--changed", type=int, default=50, help="Produits modifiés par run")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench_history_"))
+    try:
+        history = PriceHistory(workdir / "history.sqlite")
+        csv_paths = []
+        started = time.perf_counter()
+        for run, rows in enumerate(make_runs(args.runs, args.products, args.changed)):
+            run_id = history.start_run('bench', 'laptops')
+            history.record(run_id, rows)
+            history.finish_run(run_id)
+            path = workdir / f"run_{run:03d}.csv"
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
+            csv_paths.append(path)
+        load_time = time.perf_counter() - started
+        print(f"💾 {args.runs} runs x {args.products} produits enregistrés en {load_time:.1f} s "
+              f"({args.runs * args.products / load_time:.0f} observations/s, CSV compris)")
+
+        link = f"https://webscraper.io/test-sites/e-commerce/ajax/product/{args.products // 2}"
+        sql_changes_ms, sql_changes = timed(history.changes, 'laptops')
+        csv_changes_ms, csv_changed = timed(csv_changes, csv_paths[-2], csv_paths[-1])
+        sql_history_ms, sql_history = timed(history.price_history, link)
+        csv_history_ms, csv_prices = timed(csv_history, csv_paths, link, repeat=1)
+        history.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n{'requête':<28} | {'SQLite (ms)':>11} | {'CSV (ms)':>9} | {'résultats':>9}")
+    print("-" * 66)
+    print(f"{'changements vs run précédent':<28} | {sql_changes_ms:>11.2f} | {csv_changes_ms:>9.1f} | "
+          f"{len(sql_changes):>4} / {len(csv_changed):<4}")
+    print(f"{'historique d un produit':<28} | {sql_history_ms:>11.2f} | {csv_history_ms:>9.1f} | "
+          f"{len(sql_history):>4} / {len(csv_prices):<4}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_http_vs_selenium.py
+"""
+Comparaison du chemin HTTP (laptops_http) et du chemin Selenium (laptops)
+
+Mesure items/s, temps CPU et RSS maximal (arbre de processus) contre la
+copie locale du site, et vérifie que les deux chemins produisent les mêmes
+lignes page/title/price/description/reviews/rating/link.
+
+Usage:
+    python benchmarks/bench_http_vs_selenium.py --delay 0.2
+"""
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from crawl_runner import run_crawl  # noqa: E402
+from fixture_site import FixtureSite  # noqa: E402
+
+COMPARED_FIELDS = ['page', 'title', 'price', 'description', 'reviews', 'rating', 'link']
+
+
+def row_keys(rows):
+    return sorted(tuple(row[field] for field in COMPARED_FIELDS) for row in rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP vs Selenium")
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2, help="Latence simulée par requête (s)")
+    args = parser.parse_args()
+
+    site = FixtureSite(delay=args.delay)
+    url = site.start()
+    print(f"🌐 Site de test local: {url}")
+
+    runs = [
+        ('selenium', 'laptops', {}, 'laptops_progressive.csv'),
+        ('http', 'laptops_http', {}, 'laptops_http_progressive.csv'),
+        ('http + captures', 'laptops_http', {'screenshots': 'true'}, 'laptops_http_progressive.csv'),
+    ]
+
+    results = []
+    try:
+        for label, spider, extra, csv_name in runs:
+            print(f"⏱️ Crawl {label}...")
+            result = run_crawl(spider, {'max_pages': args.max_pages, 'start_url': url, **extra}, csv_name)
+            results.append((label, result))
+    finally:
+        site.stop()
+
+    print(f"\n{'mode':<16} | {'durée (s)':>9} | {'items':>5} | {'items/s':>8} | {'CPU (s)':>7} | {'RSS (Mo)':>8}")
+    print("-" * 70)
+    for label, result in results:
+        rate = result['items'] / result['elapsed']
+        print(f"{label:<16} | {result['elapsed']:>9.1f} | {result['items']:>5} | {rate:>8.1f} | "
+              f"{result['cpu']:>7.1f} | {result['peak_rss_mb']:>8.0f}")
+
+    reference = row_keys(results[0][1]['rows'])
+    for label, result in results[1:]:
+        same = row_keys(result['rows']) == reference
+        print(f"{'✅' if same else '❌'} Lignes {label} identiques au chemin Selenium: {same}")
+
+
+if __name__ == "__main__":
+    main()
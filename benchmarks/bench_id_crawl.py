@@ -0,0 +1,70 @@
+# benchmarks/bench_id_crawl.py
+"""
+Rafraîchissement complet du catalogue: pagination vs crawl direct par identifiant
+
+Compare le spider Selenium (pagination dans le navigateur), le chemin HTTP
+du listing (laptops_http) et le crawl direct des pages produit
+(laptops_ids, plage découverte ou donnée), et vérifie que les liens
+obtenus sont les mêmes.
+
+Usage:
+    python benchmarks/bench_id_crawl.py --delay 0.2
+    python benchmarks/bench_id_crawl.py --skip-selenium
+"""
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from crawl_runner import run_crawl  # noqa: E402
+from fixture_site import SITE_PATH, FixtureSite  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du crawl par identifiant")
+    parser.add_argument("--delay", type=float, default=0.2, help="Latence simulée par requête (s)")
+    parser.add_argument("--misses", type=int, default=10, help="Absences consécutives avant arrêt")
+    parser.add_argument("--skip-selenium", action="store_true", help="Sans le crawl Selenium (pas de Chrome)")
+    args = parser.parse_args()
+
+    site = FixtureSite(delay=args.delay)
+    url = site.start()
+    base_url = site.url(SITE_PATH)
+    ids = sorted(product['id'] for product in site.products)
+    print(f"🌐 Site de test local: {url} (identifiants {ids[0]} → {ids[-1]})")
+
+    runs = [
+        ('http listing', 'laptops_http', {'start_url': url}, 'laptops_http_progressive.csv'),
+        ('ids découverts', 'laptops_ids', {'start_url': url, 'misses': args.misses},
+         'laptops_ids_progressive.csv'),
+        ('ids plage connue', 'laptops_ids', {'base_url': base_url, 'first_id': ids[0], 'last_id': ids[-1]},
+         'laptops_ids_progressive.csv'),
+    ]
+    if not args.skip_selenium:
+        runs.insert(0, ('selenium', 'laptops', {'start_url': url}, 'laptops_progressive.csv'))
+
+    results = []
+    try:
+        for label, spider, spider_args, csv_name in runs:
+            print(f"⏱️ Crawl {label}...")
+            # Sans enrichissement: on compare le seul coût de la découverte des produits
+            result = run_crawl(spider, spider_args, csv_name=csv_name, settings={'ENRICH_DETAILS': 'false'})
+            results.append((label, result))
+    finally:
+        site.stop()
+
+    print(f"\n{'mode':<18} | {'durée (s)':>9} | {'items':>5} | {'items/s':>8} | {'CPU (s)':>7} | {'RSS (Mo)':>8}")
+    print("-" * 72)
+    for label, result in results:
+        rate = result['items'] / result['elapsed']
+        print(f"{label:<18} | {result['elapsed']:>9.1f} | {result['items']:>5} | {rate:>8.1f} | "
+              f"{result['cpu']:>7.1f} | {result['peak_rss_mb']:>8.0f}")
+
+    reference = sorted(row['link'].rsplit('/', 1)[-1] for row in results[0][1]['rows'])
+    for label, result in results[1:]:
+        same = sorted(row['link'].rsplit('/', 1)[-1] for row in result['rows']) == reference
+        print(f"{'✅' if same else '❌'} Produits {label} identiques à {results[0][0]}: {same}")
+
+
+if __name__ == "__main__":
+    main()
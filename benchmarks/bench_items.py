@@ -0,0 +1,96 @@
+# benchmarks/bench_items.py
+"""
+Mémoire des items et débit de la normalisation
+
+Construit N produits (laptops de référence répétés, textes bruts comme à
+la sortie de build_item) puis mesure avec tracemalloc la mémoire des
+dicts bruts (prix et avis en texte) et des dicts normalisés
+(normalize_item, comme le pipeline d'export), et le débit de
+normalize_item. Titres et descriptions restent partagés avec le catalogue
+(comme les chaînes du DOM réutilisées): seuls comptent l'item et ce qu'il
+possède en propre.
+
+Usage:
+    python benchmarks/bench_items.py --products 10000
+"""
+from pathlib import Path
+import argparse
+import sys
+import time
+import tracemalloc
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from ecommerce_scraper.extraction import build_item  # noqa: E402
+from ecommerce_scraper.items import normalize_item  # noqa: E402
+from fixture_site import PER_PAGE, load_products  # noqa: E402
+
+
+def raw_items(products, count):
+    items = []
+    for index in range(count):
+        product = products[index % len(products)]
+        items.append(build_item(
+            index // PER_PAGE + 1,
+            product['title'],
+            f"${float(product['price']) + index % 100:,.2f}",
+            product['description'],
+            f"{index % 15} reviews",
+            product['rating'],
+            f"https://webscraper.io/test-sites/e-commerce/ajax/product/{index}",
+        ))
+    return items
+
+
+def measure(build):
+    """Octets alloués par build() et encore vivants à la fin"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size, result
+
+
+def throughput(normalize, products, count, repeat=3):
+    """Produits normalisés par seconde (meilleur de `repeat` essais, copies fraîches)"""
+    best = None
+    for _ in range(repeat):
+        items = raw_items(products, count)
+        started = time.perf_counter()
+        normalize(items)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du modèle d'item et de la normalisation")
+    parser.add_argument("--products", type=int, default=10000, help="Nombre de produits")
+    args = parser.parse_args()
+    count = args.products
+    products = load_products()
+
+    raw_size, _ = measure(lambda: raw_items(products, count))
+    normalized_size, _ = measure(lambda: [normalize_item(item) for item in raw_items(products, count)])
+
+    print(f"{'modèle':<22} | {f'Mo / {count} produits':>18} | {'octets / produit':>16}")
+    print("-" * 62)
+    for label, size in (
+        ('dict brut (texte)', raw_size),
+        ('dict normalisé', normalized_size),
+    ):
+        print(f"{label:<22} | {size / 1024 / 1024:>18.2f} | {size / count:>16.0f}")
+
+    per_item = throughput(lambda items: [normalize_item(item) for item in items], products, count)
+    print(f"\n⚡ normalize_item: {per_item:.0f} produits/s")
+
+    invalid = raw_items(products, 600)
+    for index in range(0, 600, 50):
+        invalid[index]['price'] = "N/A"
+    flagged = sum(1 for item in invalid if normalize_item(item)['invalid'])
+    print(f"\n{'✅' if flagged == 12 else '❌'} {flagged} prix illisibles signalés sur 12 injectés")
+
+
+if __name__ == "__main__":
+    main()
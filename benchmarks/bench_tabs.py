@@ -0,0 +1,61 @@
+# benchmarks/bench_tabs.py
+"""
+Débit par Go de mémoire: 1 navigateur à K onglets vs K navigateurs
+
+Trois crawls de la copie locale du site (benchmarks/fixture_site.py):
+    - crawl actuel: un navigateur, un onglet
+    - K navigateurs (-a workers=K)
+    - un navigateur à K onglets (-a tabs=K)
+Pour chacun: durée, pages/min, RSS maximale de l'arbre de processus
+(scrapy + chromedriver + Chrome) et pages/min par Go de RSS.
+
+Usage:
+    python benchmarks/bench_tabs.py --k 4 --delay 0.2
+"""
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from crawl_runner import run_crawl  # noqa: E402
+from fixture_site import FixtureSite  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark onglets vs navigateurs")
+    parser.add_argument("--k", type=int, default=4, help="Nombre d'onglets / de navigateurs")
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2, help="Latence simulée par requête (s)")
+    args = parser.parse_args()
+
+    setups = [
+        ("1 onglet", {}),
+        (f"{args.k} navigateurs", {'workers': args.k}),
+        (f"1 nav. x {args.k} onglets", {'tabs': args.k}),
+    ]
+
+    site = FixtureSite(delay=args.delay)
+    url = site.start()
+    print(f"🌐 Site de test local: {url}")
+
+    results = []
+    try:
+        for label, spider_args in setups:
+            print(f"⏱️ Crawl: {label}...")
+            result = run_crawl('laptops', dict(spider_args, max_pages=args.max_pages, start_url=url))
+            results.append((label, result))
+    finally:
+        site.stop()
+
+    print(f"\n{'mode':<20} | {'durée (s)':>9} | {'pages':>5} | {'pages/min':>9} | "
+          f"{'RSS max (Mo)':>12} | {'pages/min/Go':>12}")
+    print("-" * 82)
+    for label, result in results:
+        rate = result['pages'] / result['elapsed'] * 60
+        per_gb = rate / (result['peak_rss_mb'] / 1024) if result['peak_rss_mb'] else 0
+        print(f"{label:<20} | {result['elapsed']:>9.1f} | {result['pages']:>5} | {rate:>9.1f} | "
+              f"{result['peak_rss_mb']:>12.0f} | {per_gb:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# benchmarks/crawl_runner.py
+"""
+Lance un `scrapy crawl` isolé et mesure durée, CPU et mémoire
+
+Le crawl tourne dans un dossier temporaire (CSV et captures n'écrasent pas
+ceux du dépôt). Le RSS est la somme de l'arbre de processus (spider,
+chromedriver, Chrome), échantillonnée via /proc sous Linux.
+"""
+from pathlib import Path
+import csv
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from fixture_site import ROOT  # noqa: E402
+
+
+def _children(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+
+def tree_rss_kb(pid):
+    """RSS total (Ko) d'un processus et de tous ses descendants"""
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+        stack.extend(_children(current))
+    return total
+
+
+def run_crawl(spider, args=None, csv_name='laptops_progressive.csv', settings=None):
+    """
+    Lance `scrapy crawl <spider> -a k=v ...` et renvoie les mesures
+
+    Returns:
+        dict: elapsed, cpu, peak_rss_mb, pages, items, rows, output
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ)
+        env['PYTHONPATH'] = str(ROOT) + os.pathsep + env.get('PYTHONPATH', '')
+        env['SCRAPY_SETTINGS_MODULE'] = 'ecommerce_scraper.settings'
+        env['PYTHONIOENCODING'] = 'utf-8'
+
+        command = [sys.executable, '-m', 'scrapy', 'crawl', spider]
+        for key, value in (args or {}).items():
+            command += ['-a', f'{key}={value}']
+        for key, value in (settings or {}).items():
+            command += ['-s', f'{key}={value}']
+
+        usage_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        started = time.perf_counter()
+        log_path = Path(workdir) / 'crawl.log'
+        log_file = open(log_path, 'w', encoding='utf-8')
+        process = subprocess.Popen(command, cwd=workdir, env=env,
+                                   stdout=log_file, stderr=subprocess.STDOUT)
+
+        peak = [0]
+
+        def sample():
+            while process.poll() is None:
+                peak[0] = max(peak[0], tree_rss_kb(process.pid))
+                time.sleep(0.1)
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        returncode = process.wait()
+        elapsed = time.perf_counter() - started
+        sampler.join()
+        usage_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        log_file.close()
+        output = log_path.read_text(encoding='utf-8', errors='replace')
+
+        if returncode != 0:
+            raise RuntimeError(f"Crawl {spider} en échec (code {returncode})")
+
+        if not peak[0]:
+            # Pas de /proc: maximum d'un seul processus enfant
+            peak[0] = usage_after.ru_maxrss
+
+        with open(Path(workdir) / csv_name, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+
+    cpu = ((usage_after.ru_utime - usage_before.ru_utime)
+           + (usage_after.ru_stime - usage_before.ru_stime))
+    return {
+        'elapsed': elapsed,
+        'cpu': cpu,
+        'peak_rss_mb': peak[0] / 1024,
+        'pages': len({row['page'] for row in rows}),
+        'items': len(rows),
+        'rows': rows,
+        'output': output,
+    }
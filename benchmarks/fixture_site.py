@@ -0,0 +1,468 @@
+# benchmarks/fixture_site.py
+"""
+Copie locale du site de test webscraper.io (laptops, tablettes, téléphones)
+
+Les produits sont relus depuis laptops_progressive.csv, la pagination ajax
+est reproduite en JavaScript et chaque page peut être ralentie pour simuler
+la latence réseau. Comme le vrai site, chaque page charge aussi des images
+produit, une police web et un script d'analytics (pour mesurer le blocage
+réseau du profil navigateur allégé).
+
+Usage:
+    python benchmarks/fixture_site.py --port 8000 --delay 0.2
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+import argparse
+import csv
+import html
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+
+ROOT = Path(__file__).resolve().parent.parent
+PRODUCTS_CSV = ROOT / "laptops_progressive.csv"
+PER_PAGE = 6
+SITE_PATH = "/test-sites/e-commerce"
+LISTING_PATH = f"{SITE_PATH}/ajax/computers/laptops"
+VARIANTS = ('static', 'ajax', 'scroll', 'more')
+IMAGE_PATH = "/images/test-sites/e-commerce/items/"
+FONT_PATH = "/font/site-font.woff2"
+ANALYTICS_PATH = "/js/analytics.js"
+
+
+def make_png(width, height, seed):
+    """PNG RGB de bruit (incompressible, poids comparable à une vraie photo)"""
+    rng = random.Random(seed)
+    raw = b''.join(b'\x00' + rng.randbytes(width * 3) for _ in range(height))
+
+    def chunk(kind, data):
+        return (struct.pack('>I', len(data)) + kind + data
+                + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw, 1))
+            + chunk(b'IEND', b''))
+
+
+def full_title(title, description):
+    """Nom complet d'un produit: début de la description s'il prolonge le titre tronqué"""
+    name = description.split(',')[0].strip()
+    return name if name.startswith(title.strip()) else title
+
+
+def load_products(csv_path=PRODUCTS_CSV):
+    """Charge les produits de référence depuis le CSV du spider"""
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+
+    products = []
+    for row in rows:
+        product_id = int(row['link'].rstrip('/').rsplit('/', 1)[-1])
+        products.append({
+            'id': product_id,
+            'title': row['title'],
+            # Le titre du CSV est tronqué comme sur la grille du site; le
+            # nom complet ouvre souvent la description
+            'full_title': full_title(row['title'], row['description']),
+            'price': row['price'],
+            'description': row['description'],
+            'reviews': int(row['reviews'] or 0),
+            'rating': int(row['rating'] or 0),
+        })
+    return products
+
+
+def synthetic_products(kind, count, first_id):
+    """Produits générés (tablettes, téléphones) avec un contenu stable"""
+    rng = random.Random(first_id)
+    return [
+        {
+            'id': first_id + index,
+            'title': f"{kind} {index + 1:02d}",
+            'full_title': f"{kind} {index + 1:02d} {rng.choice(['Lite', 'Plus', 'Pro', 'Max'])}",
+            'price': f"{rng.randint(50, 900)}.{rng.randint(0, 99):02d}",
+            'description': f"{kind} {index + 1}, {rng.choice([16, 32, 64, 128])}GB, {rng.choice(['Black', 'White', 'Gold'])}",
+            'reviews': rng.randint(0, 15),
+            'rating': rng.randint(1, 5),
+        }
+        for index in range(count)
+    ]
+
+
+def render_product(product):
+    """Rend une carte produit avec les mêmes classes que le vrai site"""
+    stars = '<span class="ws-icon ws-icon-star"></span>' * product['rating']
+    return f"""
+    <div class="col-md-4 col-xl-4 col-lg-4">
+      <div class="card thumbnail">
+        <img class="img-fluid card-img-top image img-responsive" alt="item"
+             src="{IMAGE_PATH}{product['id']}.png">
+        <div class="card-body">
+          <h4 class="price float-end card-title pull-right">${product['price']}</h4>
+          <h4><a href="/test-sites/e-commerce/ajax/product/{product['id']}" class="title"
+                 title="{html.escape(product['title'])}">{html.escape(product['title'])}</a></h4>
+          <p class="description card-text">{html.escape(product['description'])}</p>
+        </div>
+        <div class="ratings">
+          <p class="review-count float-end">{product['reviews']} reviews</p>
+          <p data-rating="{product['rating']}">{stars}</p>
+        </div>
+      </div>
+    </div>"""
+
+
+def render_pagination(page, pages):
+    """Rend la barre de pagination (boutons numérotés + 'Next >')"""
+    buttons = []
+    prev_disabled = ' disabled' if page <= 1 else ''
+    buttons.append(f'<button class="btn btn-default page-link prev" data-id="{page - 1}"{prev_disabled}>&lt; Prev</button>')
+    for number in range(1, pages + 1):
+        active = ' active' if number == page else ''
+        buttons.append(f'<button class="btn btn-default page-link{active}" data-id="{number}">{number}</button>')
+    next_disabled = ' disabled' if page >= pages else ''
+    buttons.append(f'<button class="btn btn-default page-link next" data-id="{page + 1}"{next_disabled}>Next &gt;</button>')
+    return '<div class="pagination">' + ''.join(buttons) + '</div>'
+
+
+def render_static_pagination(page, pages):
+    """Pagination de la variante static: liens <a> vers ?page=N"""
+    links = []
+    prev_state = ' disabled' if page <= 1 else ''
+    links.append(f'<li class="page-item{prev_state}"><a class="page-link" href="?page={page - 1}" rel="prev">‹</a></li>')
+    for number in range(1, pages + 1):
+        active = ' active' if number == page else ''
+        links.append(f'<li class="page-item{active}"><a class="page-link" href="?page={number}">{number}</a></li>')
+    next_state = ' disabled' if page >= pages else ''
+    links.append(f'<li class="page-item{next_state}"><a class="page-link" href="?page={page + 1}" rel="next">›</a></li>')
+    return '<ul class="pagination">' + ''.join(links) + '</ul>'
+
+
+def render_detail(product):
+    """Page produit: titre complet, options de capacité, avis"""
+    stars = '<span class="ws-icon ws-icon-star"></span>' * product['rating']
+    swatches = ''.join(f'<button type="button" class="btn swatch" value="{size}">{size}</button>'
+                       for size in (128, 256, 512, 1024))
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{html.escape(product['full_title'])} | Web Scraper Test Sites</title></head>
+<body>
+  <div class="container">
+    <div class="card thumbnail product-wrapper">
+      <img class="img-fluid image img-responsive" alt="item" src="{IMAGE_PATH}{product['id']}.png">
+      <div class="caption card-body">
+        <h4 class="price float-end pull-right">${product['price']}</h4>
+        <h4 class="title card-title">{html.escape(product['full_title'])}</h4>
+        <p class="description card-text">{html.escape(product['description'])}</p>
+        <div class="swatches">{swatches}</div>
+      </div>
+      <div class="ratings">
+        <p class="review-count float-end">{product['reviews']} reviews</p>
+        <p>{stars}</p>
+      </div>
+    </div>
+  </div>
+</body>
+</html>"""
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8"><title>{title} | Web Scraper Test Sites</title>
+  <style>
+    @font-face {{ font-family: "SiteFont"; src: url("{font}") format("woff2"); }}
+    body {{ font-family: "SiteFont", sans-serif; }}
+    .thumbnail img {{ width: 242px; height: 180px; }}
+  </style>
+  <script src="{analytics}" async></script>
+</head>
+<body>
+  <header class="navbar"><h1>Web Scraper Test Sites</h1></header>
+  <div class="container">
+    <div class="sidebar"><a href="{listing}">{category}</a></div>
+    <div class="row ecomerce-items ecomerce-items-{variant}" id="products">{products}</div>
+    <div id="pagination">{pagination}</div>
+  </div>
+  <script>
+    var LISTING = "{listing}", PAGES = {pages};
+    function loadPage(page, callback) {{
+      var xhr = new XMLHttpRequest();
+      xhr.open('GET', LISTING + '?page=' + page);
+      xhr.setRequestHeader('X-Requested-With', 'XMLHttpRequest');
+      xhr.onload = function () {{ callback(JSON.parse(xhr.responseText)); }};
+      xhr.send();
+    }}
+    {script}
+  </script>
+</body>
+</html>"""
+
+# Pagination ajax: la grille est remplacée par celle de la page demandée
+AJAX_SCRIPT = """
+    function bind() {
+      document.querySelectorAll('#pagination button').forEach(function (button) {
+        button.addEventListener('click', function () {
+          if (button.disabled) { return; }
+          loadPage(button.dataset.id, function (data) {
+            document.getElementById('products').innerHTML = data.html;
+            document.getElementById('pagination').innerHTML = data.pagination;
+            bind();
+          });
+        });
+      });
+    }
+    bind();
+"""
+
+# Défilement infini: la page suivante s'ajoute quand on atteint le bas
+SCROLL_SCRIPT = """
+    var loaded = 1, loading = false;
+    window.addEventListener('scroll', function () {
+      if (loading || loaded >= PAGES) { return; }
+      if (window.innerHeight + window.scrollY < document.body.scrollHeight - 100) { return; }
+      loading = true;
+      loadPage(loaded + 1, function (data) {
+        document.getElementById('products').insertAdjacentHTML('beforeend', data.html);
+        loaded += 1;
+        loading = false;
+      });
+    });
+"""
+
+# Bouton "More": ajoute la page suivante, masqué après la dernière
+MORE_SCRIPT = """
+    var loaded = 1;
+    var more = document.querySelector('.ecomerce-items-scroll-more');
+    more.addEventListener('click', function () {
+      loadPage(loaded + 1, function (data) {
+        document.getElementById('products').insertAdjacentHTML('beforeend', data.html);
+        loaded += 1;
+        if (loaded >= PAGES) { more.style.display = 'none'; }
+      });
+    });
+"""
+
+MORE_BUTTON = '<a class="btn btn-primary ecomerce-items-scroll-more" href="#" onclick="return false;">More</a>'
+
+
+class FixtureServer(ThreadingHTTPServer):
+    # File d'attente de connexions assez longue pour les crawls très
+    # concurrents (au-delà de 5, le noyau fait attendre 1 s le SYN suivant)
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FixtureSite:
+    """
+    Serveur HTTP local qui imite le catalogue du site de test
+
+    Les laptops (relus depuis le CSV), tablettes et téléphones sont servis
+    dans les quatre variantes: SITE_PATH/<variante>/<catégorie>.
+    """
+
+    def __init__(self, products=None, delay=0.0, per_page=PER_PAGE):
+        self.products = products if products is not None else load_products()
+        self.catalog = {
+            'computers/laptops': self.products,
+            'computers/tablets': synthetic_products("Tablet", 21, 1000),
+            'phones/touch': synthetic_products("Phone", 9, 2000),
+        }
+        self.delay = delay
+        self.per_page = per_page
+        self.server = None
+        self.thread = None
+        self.image_cache = {}
+        self.font = random.Random(0).randbytes(60 * 1024)
+        self.asset_requests = {'images': 0, 'fonts': 0, 'analytics': 0}
+
+    @property
+    def pages(self):
+        return max(1, -(-len(self.products) // self.per_page))
+
+    def page_products(self, page):
+        start = (page - 1) * self.per_page
+        return self.products[start:start + self.per_page]
+
+    def product(self, product_id):
+        for products in self.catalog.values():
+            for product in products:
+                if product['id'] == product_id:
+                    return product
+        return None
+
+    def listing_path(self, category='computers/laptops', variant='ajax'):
+        return f"{SITE_PATH}/{variant}/{category}"
+
+    def parse_listing(self, path):
+        """
+        Returns:
+            tuple ou None: (variante, catégorie) si path est un listing
+        """
+        if not path.startswith(SITE_PATH + "/"):
+            return None
+        variant, _, category = path[len(SITE_PATH) + 1:].partition('/')
+        if variant in VARIANTS and category in self.catalog:
+            return variant, category
+        return None
+
+    def parse_product(self, path):
+        """
+        Returns:
+            int ou None: identifiant si path est une page produit
+                (SITE_PATH/<variante>/product/<id>)
+        """
+        if not path.startswith(SITE_PATH + "/"):
+            return None
+        variant, _, rest = path[len(SITE_PATH) + 1:].partition('/')
+        kind, _, product_id = rest.partition('/')
+        if variant in VARIANTS and kind == 'product' and product_id.isdigit():
+            return int(product_id)
+        return None
+
+    def render_listing(self, variant, category, page):
+        """Page HTML complète d'un listing (page 1 sauf pour la variante static)"""
+        products = self.catalog[category]
+        pages = max(1, -(-len(products) // self.per_page))
+        shown = page if variant == 'static' else 1
+        grid = ''.join(render_product(p) for p in products[(shown - 1) * self.per_page:shown * self.per_page])
+        pagination, script = {
+            'static': (render_static_pagination(shown, pages), ""),
+            'ajax': (render_pagination(1, pages), AJAX_SCRIPT),
+            'scroll': ("", SCROLL_SCRIPT),
+            'more': (MORE_BUTTON if pages > 1 else "", MORE_SCRIPT if pages > 1 else ""),
+        }[variant]
+        return PAGE_TEMPLATE.format(
+            title=category.rsplit('/', 1)[-1].capitalize(),
+            category=category,
+            variant=variant,
+            listing=self.listing_path(category, variant),
+            pages=pages,
+            font=FONT_PATH,
+            analytics=ANALYTICS_PATH,
+            products=grid,
+            pagination=pagination,
+            script=script,
+        )
+
+    def image(self, product_id):
+        if product_id not in self.image_cache:
+            self.image_cache[product_id] = make_png(242, 180, product_id)
+        return self.image_cache[product_id]
+
+    def make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def send_body(self, body, content_type="text/html; charset=utf-8", status=200):
+                payload = body.encode('utf-8') if isinstance(body, str) else body
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                # Pas de cache: chaque chargement de page refait toutes les requêtes
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                if site.delay:
+                    time.sleep(site.delay)
+
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+
+                listing = site.parse_listing(url.path)
+                if listing:
+                    variant, category = listing
+                    products = site.catalog[category]
+                    pages = max(1, -(-len(products) // site.per_page))
+                    page = min(max(int(query.get('page', ['1'])[0]), 1), pages)
+
+                    if self.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                        start = (page - 1) * site.per_page
+                        body = json.dumps({
+                            'currentPage': page,
+                            'pages': pages,
+                            'html': ''.join(render_product(p) for p in products[start:start + site.per_page]),
+                            'pagination': render_pagination(page, pages),
+                        })
+                        self.send_body(body, "application/json")
+                    else:
+                        # Comme sur le vrai site, le HTML initial montre la page 1
+                        # (sauf la variante static, paginée côté serveur)
+                        self.send_body(site.render_listing(variant, category, page))
+                    return
+
+                product_id = site.parse_product(url.path)
+                if product_id is not None:
+                    product = site.product(product_id)
+                    if product is None:
+                        self.send_body("<h1>404</h1>", status=404)
+                    else:
+                        self.send_body(render_detail(product))
+                    return
+
+                if url.path.startswith(IMAGE_PATH) and url.path.endswith('.png'):
+                    site.asset_requests['images'] += 1
+                    product_id = int(url.path[len(IMAGE_PATH):-len('.png')])
+                    self.send_body(site.image(product_id), "image/png")
+                    return
+
+                if url.path == FONT_PATH:
+                    site.asset_requests['fonts'] += 1
+                    self.send_body(site.font, "font/woff2")
+                    return
+
+                if url.path == ANALYTICS_PATH:
+                    site.asset_requests['analytics'] += 1
+                    self.send_body("window.__analytics = (window.__analytics || 0) + 1;",
+                                   "application/javascript")
+                    return
+
+                self.send_body("<h1>404</h1>", status=404)
+
+        return Handler
+
+    def start(self, host="127.0.0.1", port=0):
+        """Démarre le serveur dans un thread et renvoie l'URL du listing"""
+        self.server = FixtureServer((host, port), self.make_handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url(LISTING_PATH)
+
+    def url(self, path):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Site de test local (catalogue webscraper.io)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--delay", type=float, default=0.0, help="Latence ajoutée par requête (s)")
+    args = parser.parse_args()
+
+    site = FixtureSite(delay=args.delay)
+    url = site.start(port=args.port)
+    print(f"🌐 Site de test local: {url} ({len(site.products)} produits, {site.pages} pages)")
+    try:
+        site.thread.join()
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
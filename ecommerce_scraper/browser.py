@@ -0,0 +1,269 @@
+# ecommerce_scraper/browser.py
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.driver_finder import DriverFinder
+from pathlib import Path
+import json
+import os
+import time
+
+CHROME_PATHS = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    r"C:\Users\MARCOM\AppData\Local\Google\Chrome\Application\chrome.exe",
+]
+
+CHROMEDRIVER_PATH = r"C:\chromedriver\chromedriver.exe"
+
+
+def find_chrome_binary():
+    """Cherche l'exécutable Chrome aux emplacements standards"""
+    for path in CHROME_PATHS:
+        if os.path.exists(path):
+            print(f"✅ Chrome trouvé à: {path}")
+            return path
+
+    print("⚠️ Chrome non trouvé aux emplacements standards")
+    print("💡 Veuillez installer Chrome ou spécifier le chemin manuellement")
+    return None
+
+
+def resolve_browser_paths(cache_path=None):
+    """
+    Chemins de Chrome et de chromedriver, résolus une fois puis mis en cache
+
+    Sans cache, chaque lancement refait la recherche de Chrome et passe par
+    Selenium Manager pour trouver le driver. Le fichier JSON `cache_path`
+    garde le résultat; il est ignoré si un des fichiers a disparu (mise à
+    jour de Chrome).
+
+    Returns:
+        dict: chrome_binary et chromedriver_path (None si non trouvé)
+    """
+    cache_path = Path(cache_path) if cache_path else None
+    if cache_path and cache_path.exists():
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                paths = json.load(f)
+            if all(path and os.path.exists(path) for path in paths.values()):
+                return paths
+        except (OSError, ValueError):
+            pass
+
+    chrome_binary = find_chrome_binary()
+    chromedriver_path = CHROMEDRIVER_PATH if os.path.exists(CHROMEDRIVER_PATH) else None
+    if chromedriver_path is None or chrome_binary is None:
+        # Selenium Manager: driver (et navigateur) adaptés à la version installée
+        options = Options()
+        if chrome_binary:
+            options.binary_location = chrome_binary
+        try:
+            finder = DriverFinder(Service(chromedriver_path), options)
+            chromedriver_path = finder.get_driver_path()
+            chrome_binary = chrome_binary or finder.get_browser_path() or None
+        except Exception as e:
+            print(f"⚠️ Selenium Manager n'a pas résolu le driver: {str(e)[:100]}")
+
+    paths = {'chrome_binary': chrome_binary, 'chromedriver_path': chromedriver_path}
+    if cache_path and all(paths.values()):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(paths, f, indent=2)
+        print(f"💾 Chemins Chrome/chromedriver mis en cache: {cache_path}")
+    return paths
+
+
+# Motifs bloqués par catégorie (syntaxe Network.setBlockedURLs: * = joker)
+BLOCK_CATEGORIES = {
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico'],
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.mp3'],
+    'analytics': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*facebook.net*', '*hotjar.com*', '*analytics.js*',
+    ],
+}
+
+# Catégories dont le blocage fausse le rendu d'une capture d'écran
+RENDER_CATEGORIES = ('images', 'fonts', 'media')
+
+
+def blocked_url_patterns(categories=(), extra_patterns=(), allow=()):
+    """
+    Construit la liste des motifs d'URL à bloquer
+
+    Args:
+        categories: Catégories de BLOCK_CATEGORIES à bloquer
+        extra_patterns: Motifs supplémentaires
+        allow: Catégories ou motifs exemptés pour ce run
+
+    Returns:
+        list: Motifs pour Network.setBlockedURLs
+    """
+    patterns = []
+    for category in categories:
+        if category in allow:
+            continue
+        patterns.extend(BLOCK_CATEGORIES.get(category, []))
+    patterns.extend(extra_patterns)
+    return [pattern for pattern in dict.fromkeys(patterns) if pattern not in allow]
+
+
+def apply_request_blocking(driver, patterns):
+    """Active (ou désactive avec une liste vide) le blocage réseau via DevTools"""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+
+
+def build_chrome_options(chrome_binary=None, profile="default", headless=False, profile_dir=None):
+    """
+    Construit les options Chrome utilisées par le spider
+
+    Args:
+        chrome_binary: Chemin de l'exécutable Chrome
+        profile: "default" (navigateur visible, maximisé) ou "lean"
+            (allégé pour un crawl de données)
+        headless: Lancer Chrome sans fenêtre
+        profile_dir: Dossier de profil réutilisé d'un run à l'autre (cache
+            HTTP chaud); None = profil vide temporaire
+    """
+    chrome_options = Options()
+
+    if chrome_binary:
+        chrome_options.binary_location = chrome_binary
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={Path(profile_dir).absolute()}")
+
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    if profile != "lean":
+        chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if profile == "lean":
+        # Pas de services d'arrière-plan inutiles pour un crawl
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-component-update")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--no-first-run")
+    return chrome_options
+
+
+def create_driver(chromedriver_path=CHROMEDRIVER_PATH, profile="default", headless=False,
+                  blocked_patterns=(), chrome_binary=None, profile_dir=None, debugger_address=None):
+    """
+    Lance un navigateur Chrome piloté par Selenium, ou s'attache à un Chrome
+    déjà lancé avec --remote-debugging-port (démarrage à chaud)
+
+    Args:
+        chromedriver_path: Chemin vers chromedriver (Selenium Manager le
+            résout lui-même si le fichier n'existe pas)
+        profile: Profil du navigateur ("default" ou "lean")
+        headless: Lancer Chrome sans fenêtre
+        blocked_patterns: Motifs d'URL bloqués dès le lancement
+        chrome_binary: Chemin de Chrome déjà résolu (resolve_browser_paths);
+            None = recherche aux emplacements standards
+        profile_dir: Dossier de profil persistant (cache HTTP chaud)
+        debugger_address: "hôte:port" d'un Chrome déjà lancé: pas de
+            nouveau navigateur, le driver s'y attache
+
+    Returns:
+        webdriver.Chrome: Driver prêt à l'emploi; driver.startup_time (s)
+        et driver.startup_mode ("cold", "profile" ou "attached") mesurent
+        le démarrage
+    """
+    started = time.perf_counter()
+    if debugger_address:
+        # Les options de lancement ne s'appliquent pas à un navigateur existant
+        chrome_options = Options()
+        chrome_options.debugger_address = debugger_address
+        mode = "attached"
+    else:
+        chrome_options = build_chrome_options(
+            chrome_binary or find_chrome_binary(), profile, headless, profile_dir
+        )
+        mode = "profile" if profile_dir else "cold"
+
+    if chromedriver_path and os.path.exists(chromedriver_path):
+        service = Service(chromedriver_path)
+    else:
+        service = Service()
+
+    try:
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if debugger_address:
+            # Onglets laissés par le run précédent: on ne garde que le premier
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+        # Appliqué à chaque document chargé ensuite (et pas seulement à la page vide)
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        })
+        if blocked_patterns:
+            apply_request_blocking(driver, blocked_patterns)
+            print(f"🚫 {len(blocked_patterns)} motifs d'URL bloqués (profil {profile})")
+        driver.attached = bool(debugger_address)
+        driver.startup_mode = mode
+        driver.startup_time = time.perf_counter() - started
+        if debugger_address:
+            print(f"✅ Driver attaché au Chrome déjà lancé ({debugger_address})")
+        else:
+            print("✅ Driver Chrome initialisé avec succès!")
+        return driver
+    except Exception as e:
+        print(f"❌ Erreur lors de l'initialisation du driver: {e}")
+        print("\n💡 SOLUTION:")
+        print("   1. Vérifiez votre version de Chrome: chrome://version/")
+        print("   2. Téléchargez ChromeDriver: https://googlechromelabs.github.io/chrome-for-testing/")
+        print(f"   3. Placez chromedriver.exe à: {chromedriver_path}")
+        raise
+
+
+def close_driver(driver):
+    """
+    Ferme un driver: quit() pour un navigateur lancé par le crawl, simple
+    arrêt de chromedriver pour un Chrome attaché (il reste ouvert, chaud,
+    pour le run suivant)
+    """
+    if getattr(driver, 'attached', False):
+        driver.service.stop()
+    else:
+        driver.quit()
+
+
+def browser_options_from_settings(settings):
+    """Paramètres de create_driver() lus depuis les settings BROWSER_*"""
+    profile = settings.get('BROWSER_PROFILE', 'default')
+    # None (défaut): headless pour le profil lean, fenêtre visible sinon
+    headless = settings.get('BROWSER_HEADLESS')
+    headless = profile == 'lean' if headless is None else settings.getbool('BROWSER_HEADLESS')
+    blocked = []
+    if profile == 'lean':
+        blocked = blocked_url_patterns(
+            settings.getlist('BROWSER_BLOCK', ['images', 'fonts', 'analytics']),
+            settings.getlist('BROWSER_BLOCK_PATTERNS'),
+            settings.getlist('BROWSER_ALLOW'),
+        )
+    return {'profile': profile, 'headless': headless, 'blocked_patterns': blocked}
+
+
+def render_patterns(patterns):
+    """Motifs à garder bloqués pendant une capture (rendu complet requis)"""
+    render_blocked = {
+        pattern for category in RENDER_CATEGORIES for pattern in BLOCK_CATEGORIES[category]
+    }
+    return [pattern for pattern in patterns if pattern not in render_blocked]
@@ -0,0 +1,164 @@
+# ecommerce_scraper/browser_daemon.py
+"""
+Chrome persistant entre deux runs (démarrage à chaud)
+
+Le démon est un Chrome lancé avec --remote-debugging-port et un profil
+persistant: les crawls s'y attachent (create_driver(debugger_address=...))
+au lieu de lancer un navigateur neuf, et retrouvent son cache HTTP.
+L'état (pid, adresse, profil) est gardé dans un fichier JSON.
+
+    python -m ecommerce_scraper.browser_daemon start
+    python -m ecommerce_scraper.browser_daemon status
+    python -m ecommerce_scraper.browser_daemon stop
+"""
+from pathlib import Path
+from urllib.request import urlopen
+import argparse
+import json
+import os
+import signal
+import subprocess
+import time
+
+from ecommerce_scraper.browser import build_chrome_options, resolve_browser_paths
+
+
+class BrowserDaemon:
+    """Lance, retrouve et arrête le Chrome persistant décrit par `state_file`"""
+
+    def __init__(self, state_file, port=9222, profile_dir="browser_profiles/daemon",
+                 host="127.0.0.1", startup_timeout=15):
+        """
+        Args:
+            state_file: Fichier JSON de l'état du démon
+            port: Port DevTools (--remote-debugging-port)
+            profile_dir: Profil persistant du démon (distinct de ceux des
+                navigateurs lancés par le crawl: Chrome verrouille un profil)
+            host: Interface d'écoute de DevTools
+            startup_timeout: Attente maximale de DevTools au lancement (s)
+        """
+        self.state_file = Path(state_file)
+        self.port = int(port)
+        self.profile_dir = Path(profile_dir)
+        self.host = host
+        self.startup_timeout = startup_timeout
+
+    @classmethod
+    def from_settings(cls, settings):
+        profile_root = Path(settings.get('BROWSER_PROFILE_DIR') or 'browser_profiles')
+        return cls(
+            state_file=settings.get('BROWSER_DAEMON_STATE', 'browser_daemon.json'),
+            port=settings.getint('BROWSER_DAEMON_PORT', 9222),
+            profile_dir=profile_root / 'daemon',
+        )
+
+    @property
+    def address(self):
+        return f"{self.host}:{self.port}"
+
+    def load_state(self):
+        if not self.state_file.exists():
+            return None
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_alive(self):
+        """Vrai si DevTools répond à l'adresse du démon"""
+        try:
+            with urlopen(f"http://{self.address}/json/version", timeout=1) as response:
+                return response.status == 200
+        except OSError:
+            return False
+
+    def start(self, chrome_binary=None, profile="lean", headless=True):
+        """
+        Lance Chrome en arrière-plan (survit à la fin du crawl)
+
+        Returns:
+            str: Adresse DevTools à passer à create_driver(debugger_address=...)
+        """
+        chrome_binary = chrome_binary or resolve_browser_paths()['chrome_binary']
+        if not chrome_binary:
+            raise RuntimeError("Chrome introuvable: impossible de lancer le démon")
+
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        options = build_chrome_options(chrome_binary, profile, headless, self.profile_dir)
+        command = [chrome_binary, *options.arguments,
+                   f"--remote-debugging-port={self.port}",
+                   f"--remote-debugging-address={self.host}", "about:blank"]
+        process = subprocess.Popen(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+        deadline = time.perf_counter() + self.startup_timeout
+        while not self.is_alive():
+            if process.poll() is not None or time.perf_counter() > deadline:
+                process.kill()
+                raise RuntimeError(f"Le démon Chrome n'a pas ouvert DevTools sur {self.address}")
+            time.sleep(0.1)
+
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'pid': process.pid,
+                'address': self.address,
+                'chrome_binary': chrome_binary,
+                'profile_dir': str(self.profile_dir),
+                'started_at': time.time(),
+            }, f, indent=2)
+        print(f"🔥 Démon Chrome lancé (pid {process.pid}) sur {self.address}")
+        return self.address
+
+    def ensure_running(self, chrome_binary=None, profile="lean", headless=True):
+        """Réutilise le démon s'il répond, sinon le lance"""
+        if self.is_alive():
+            print(f"♨️ Démon Chrome déjà lancé: {self.address}")
+            return self.address
+        return self.start(chrome_binary, profile, headless)
+
+    def stop(self):
+        """Arrête le démon (SIGTERM) et supprime son fichier d'état"""
+        state = self.load_state()
+        if state:
+            try:
+                os.kill(state['pid'], signal.SIGTERM)
+                print(f"✅ Démon Chrome arrêté (pid {state['pid']})")
+            except OSError:
+                print(f"ℹ️ Démon Chrome déjà arrêté (pid {state['pid']})")
+        else:
+            print("ℹ️ Aucun démon Chrome enregistré")
+        self.state_file.unlink(missing_ok=True)
+
+
+def main():
+    from scrapy.utils.project import get_project_settings
+
+    from ecommerce_scraper.browser import browser_options_from_settings
+
+    parser = argparse.ArgumentParser(description="Chrome persistant pour les démarrages à chaud")
+    parser.add_argument("action", choices=["start", "stop", "status"])
+    parser.add_argument("--port", type=int, help="Port DevTools (BROWSER_DAEMON_PORT)")
+    args = parser.parse_args()
+
+    settings = get_project_settings()
+    daemon = BrowserDaemon.from_settings(settings)
+    if args.port:
+        daemon.port = args.port
+
+    if args.action == "start":
+        options = browser_options_from_settings(settings)
+        daemon.ensure_running(options.get('chrome_binary'), options['profile'], options['headless'])
+    elif args.action == "stop":
+        daemon.stop()
+    else:
+        state = daemon.load_state() or {}
+        alive = daemon.is_alive()
+        print(f"{'✅' if alive else '❌'} Démon Chrome {'actif' if alive else 'inactif'} sur {daemon.address}"
+              + (f" (pid {state['pid']}, profil {state['profile_dir']})" if state and alive else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# ecommerce_scraper/browser_pool.py
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+
+from ecommerce_scraper.browser import close_driver
+from ecommerce_scraper.pagination import split_pages
+
+_DONE = object()
+
+
+class BrowserPool:
+    """
+    Pool de N navigateurs Selenium qui se partagent la pagination.
+
+    Chaque worker reçoit une plage de pages contiguë et la parcourt avec son
+    propre driver. Les résultats sont fusionnés dans l'ordre des pages.
+    """
+
+    def __init__(self, size, driver_factory, drivers=None):
+        """
+        Args:
+            size: Nombre de navigateurs
+            driver_factory: Fonction sans argument qui lance un driver
+            drivers: Drivers déjà lancés à réutiliser (ex: celui du spider)
+        """
+        self.size = max(1, int(size))
+        self.driver_factory = driver_factory
+        self.drivers = list(drivers or [])[:self.size]
+        # Threads des workers d'imap_ordered, arrêtés et attendus par close()
+        self.threads = []
+        self.stop = threading.Event()
+
+    def start(self):
+        """Lance en parallèle les navigateurs manquants"""
+        missing = self.size - len(self.drivers)
+        if missing <= 0:
+            return self.drivers
+
+        print(f"🚀 Lancement de {missing} navigateur(s) supplémentaire(s)...")
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self.driver_factory) for _ in range(missing)]
+            for future in futures:
+                try:
+                    self.drivers.append(future.result())
+                except Exception as e:
+                    print(f"⚠️ Navigateur non lancé: {str(e)[:100]}")
+
+        if not self.drivers:
+            raise RuntimeError("Aucun navigateur disponible dans le pool")
+
+        self.size = len(self.drivers)
+        print(f"✅ Pool prêt: {self.size} navigateur(s)")
+        return self.drivers
+
+    def imap_ordered(self, first_page, last_page, crawl_range):
+        """
+        Parcourt les pages avec tous les navigateurs et renvoie les
+        résultats dans l'ordre des pages.
+
+        Args:
+            first_page: Première page à scraper
+            last_page: Dernière page à scraper
+            crawl_range: Générateur crawl_range(driver, pages, worker_id)
+                qui produit des tuples (page, items) et renvoie True si le
+                listing se termine à sa dernière page
+
+        Yields:
+            tuple: (page, items) dans l'ordre croissant des pages
+
+        Returns:
+            bool: True si la dernière page fusionnée termine le listing
+            (valeur renvoyée par le worker qui l'a produite)
+        """
+        self.start()
+        ranges = split_pages(first_page, last_page, self.size)
+        owner = {page: worker_id for worker_id, pages in enumerate(ranges) for page in pages}
+        results = queue.Queue()
+        stop = self.stop
+
+        def worker(worker_id, driver, pages):
+            # Fin de plage renvoyée avec le marqueur _DONE: aucun état partagé
+            # n'est écrit par les workers
+            last, end = None, False
+            try:
+                shard = crawl_range(driver, pages, worker_id)
+                while not stop.is_set():
+                    try:
+                        page, items = next(shard)
+                    except StopIteration as done:
+                        end = bool(done.value)
+                        break
+                    last = page
+                    results.put((worker_id, page, items))
+            except Exception as e:
+                print(f"   ❌ Worker {worker_id}: erreur critique: {str(e)[:100]}")
+            finally:
+                results.put((worker_id, _DONE, (last, end)))
+
+        print(f"🧩 Répartition des pages sur {len(ranges)} navigateur(s):")
+        for worker_id, pages in enumerate(ranges):
+            print(f"   Worker {worker_id}: pages {pages[0]} → {pages[-1]}")
+
+        for worker_id, pages in enumerate(ranges):
+            thread = threading.Thread(
+                target=worker,
+                args=(worker_id, self.drivers[worker_id], pages),
+                name=f"browser-worker-{worker_id}",
+                daemon=True,
+            )
+            thread.start()
+            self.threads.append(thread)
+
+        pending = {}
+        # worker_id -> (dernière page produite, fin du listing atteinte)
+        finished = {}
+        next_page = first_page
+        merged = None
+        try:
+            while next_page <= last_page:
+                if next_page in pending:
+                    yield next_page, pending.pop(next_page)
+                    merged = next_page
+                    next_page += 1
+                    continue
+
+                # Le worker propriétaire s'est arrêté avant cette page
+                if owner[next_page] in finished:
+                    next_page += 1
+                    continue
+
+                worker_id, page, items = results.get()
+                if page is _DONE:
+                    finished[worker_id] = items
+                else:
+                    pending[page] = items
+
+            # Le worker de la dernière page fusionnée a produit sa dernière
+            # page: son marqueur de fin arrive aussitôt
+            while merged is not None and owner[merged] not in finished:
+                worker_id, page, items = results.get()
+                if page is _DONE:
+                    finished[worker_id] = items
+        finally:
+            # Pas de join ici: un générateur abandonné peut être finalisé dans
+            # le thread du reactor. Les workers s'arrêtent après leur page en
+            # cours et sont attendus par close()
+            stop.set()
+
+        if merged is None:
+            return False
+        last, end = finished[owner[merged]]
+        return end and last == merged
+
+    def close(self):
+        """
+        Arrête les workers puis ferme proprement chaque navigateur du pool
+
+        Bloquant (attente des threads, arrêt de Chrome): à appeler hors du
+        thread du reactor
+        """
+        self.stop.set()
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        for worker_id, driver in enumerate(self.drivers):
+            try:
+                close_driver(driver)
+                print(f"✅ Navigateur du worker {worker_id} fermé")
+            except Exception as e:
+                print(f"⚠️ Erreur à la fermeture du worker {worker_id}: {str(e)[:80]}")
+        self.drivers = []
@@ -0,0 +1,81 @@
+# ecommerce_scraper/catalog.py
+"""
+Catalogue du site de test webscraper.io: catégories et variantes
+
+Chaque variante du site présente les mêmes produits avec une navigation
+différente:
+    static  pages servies par le serveur (?page=N, liens <a>)
+    ajax    pagination par boutons, grille remplacée en ajax
+    scroll  défilement infini (les produits s'ajoutent en bas de page)
+    more    bouton "More" qui ajoute les produits suivants
+"""
+from pathlib import Path
+import csv
+
+BASE_URL = "https://webscraper.io/test-sites/e-commerce"
+
+VARIANTS = ('static', 'ajax', 'scroll', 'more')
+
+# Variantes paginées (une page = une grille distincte); les autres font
+# grossir une seule page
+PAGINATED_VARIANTS = ('static', 'ajax')
+
+# Nombre de produits attendus par catégorie (estimation pour la priorité)
+CATEGORIES = {
+    'computers/laptops': 117,
+    'computers/tablets': 21,
+    'phones/touch': 9,
+}
+
+
+def listing_url(category, variant='ajax', base_url=BASE_URL):
+    """URL du listing d'une catégorie dans une variante du site"""
+    if variant not in VARIANTS:
+        raise ValueError(f"Variante inconnue: {variant} (attendu: {', '.join(VARIANTS)})")
+    return f"{base_url.rstrip('/')}/{variant}/{category}"
+
+
+def product_url(product_id, variant='ajax', base_url=BASE_URL):
+    """URL de la page produit d'un identifiant (.../ajax/product/60)"""
+    return f"{base_url.rstrip('/')}/{variant}/product/{int(product_id)}"
+
+
+def product_id(link):
+    """
+    Identifiant numérique d'un lien produit
+
+    Returns:
+        int ou None: None si le lien ne finit pas par /product/<id>
+    """
+    head, _, tail = (link or "").rstrip('/').rpartition('/')
+    if head.endswith('/product') and tail.isdigit():
+        return int(tail)
+    return None
+
+
+def partition_name(category, variant='ajax'):
+    """
+    Nom court d'une partition de sortie: "laptops", "tablets_static"...
+
+    La variante ajax (historique) garde le nom de la catégorie seul, ce qui
+    conserve laptops_progressive.csv pour le spider laptops.
+    """
+    name = category.rstrip('/').rsplit('/', 1)[-1]
+    return name if variant == 'ajax' else f"{name}_{variant}"
+
+
+def estimated_size(category, variant='ajax', output_dir='.'):
+    """
+    Taille estimée d'une catégorie: lignes du CSV du dernier run s'il existe,
+    sinon l'estimation du catalogue
+    """
+    path = Path(output_dir) / f"{partition_name(category, variant)}_progressive.csv"
+    if path.exists():
+        try:
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = sum(1 for _ in csv.DictReader(f))
+            if rows:
+                return rows
+        except (OSError, csv.Error):
+            pass
+    return CATEGORIES.get(category, 0)
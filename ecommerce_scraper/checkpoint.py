@@ -0,0 +1,54 @@
+# ecommerce_scraper/checkpoint.py
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+
+
+class Checkpoint:
+    """
+    Point de reprise du crawl multi-pages.
+
+    Quand tous les items d'une page ont été validés par les sorties du
+    pipeline, on enregistre la dernière page terminée et le nombre d'items.
+    En cas de crash, la reprise ne garde dans les sorties que les lignes des
+    pages terminées (page incomplète supprimée) et repart à la page suivante.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def load(self):
+        """
+        Returns:
+            dict ou None: Dernier état enregistré
+        """
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Checkpoint illisible ({self.path}): {e}")
+            return None
+
+    def save(self, last_page, items, **extra):
+        """Enregistre l'état de façon atomique (fichier temporaire + rename)"""
+        state = {
+            'last_page': last_page,
+            'items': items,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            **extra,
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        return state
+
+    def clear(self):
+        """Supprime le checkpoint (crawl terminé)"""
+        if self.path.exists():
+            self.path.unlink()
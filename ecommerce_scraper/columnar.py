@@ -0,0 +1,284 @@
+# ecommerce_scraper/columnar.py
+"""
+Instantanés colonnaires (Parquet / Arrow IPC) des sorties du crawl
+
+Les CSV relus par l'analyse gardent tout en texte (prix "295.99", avis
+"12 reviews"). Ici chaque run est écrit avec des colonnes typées:
+
+    page, product_index, reviews, detail_*   int32
+    price                                    float64 (null si illisible)
+    rating                                   int8
+    title, description, stock_status...      dictionnaire (int32 → string)
+
+et rangé par date de run et catégorie (partitionnement « hive »):
+
+    <racine>/run_date=2025-12-02/category=laptops/laptops_progressive-113528-402117.parquet
+
+L'écriture est en flux: les lignes sont tamponnées jusqu'à `row_group_rows`
+puis écrites en un row group (Parquet) ou un record batch (Arrow), la
+mémoire reste donc constante quel que soit le nombre de pages. Une valeur
+hors type (entier hors int32, texte dans une colonne numérique) devient
+null au lieu de faire échouer le row group.
+
+Nécessite pyarrow (pip install pyarrow). Conversion des CSV existants:
+
+    python -m ecommerce_scraper.columnar laptops.csv laptops_progressive.csv gemini_analysis.csv
+    python -m ecommerce_scraper.columnar gemini_analysis.csv --format arrow --category laptops
+"""
+from datetime import datetime
+from pathlib import Path
+import argparse
+import csv
+
+from ecommerce_scraper.history import to_float, to_int
+
+FORMATS = {'parquet': '.parquet', 'arrow': '.arrows'}
+
+# Colonnes numériques (les autres sont du texte)
+INT32_FIELDS = ('page', 'product_index', 'reviews', 'detail_reviews')
+INT8_FIELDS = ('rating', 'detail_rating')
+FLOAT_FIELDS = ('price',)
+# Texte très répété d'un run à l'autre: encodé en dictionnaire
+DICTIONARY_FIELDS = (
+    'title', 'full_title', 'description', 'detail_description',
+    'stock_status', 'promotions', 'visual_quality', 'page_layout',
+)
+# Bornes des colonnes entières: hors bornes, la cellule est écrite à null
+INT_RANGES = {
+    field: bounds
+    for fields, bounds in ((INT32_FIELDS, (-2 ** 31, 2 ** 31 - 1)), (INT8_FIELDS, (-128, 127)))
+    for field in fields
+}
+# Valeurs écrites par l'analyse Gemini quand un champ manque
+MISSING_VALUES = ('', 'N/A')
+
+
+def arrow_schema(fields):
+    """Schéma Arrow typé des colonnes `fields` (ordre conservé)"""
+    import pyarrow as pa
+
+    columns = []
+    for field in fields:
+        if field in INT32_FIELDS:
+            columns.append((field, pa.int32()))
+        elif field in INT8_FIELDS:
+            columns.append((field, pa.int8()))
+        elif field in FLOAT_FIELDS:
+            columns.append((field, pa.float64()))
+        elif field in DICTIONARY_FIELDS:
+            columns.append((field, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            columns.append((field, pa.string()))
+    return pa.schema(columns)
+
+
+def convert_value(field, value):
+    """Valeur typée d'une cellule (None si absente ou illisible)"""
+    if value is None or (isinstance(value, str) and value.strip() in MISSING_VALUES):
+        return None
+    if field in INT_RANGES:
+        number = to_int(value)
+        # Hors bornes (note ou nombre d'avis illisible): null plutôt qu'une
+        # erreur d'écriture
+        low, high = INT_RANGES[field]
+        if number is not None and not low <= number <= high:
+            return None
+        return number
+    if field in FLOAT_FIELDS:
+        return to_float(value)
+    return str(value)
+
+
+def partition_dir(root, run_date, category):
+    """Dossier de la partition (run_date=AAAA-MM-JJ/category=...)"""
+    return Path(root) / f"run_date={run_date}" / f"category={category}"
+
+
+class ColumnarWriter:
+    """
+    Écriture en flux d'un run dans un fichier Parquet ou un flux Arrow IPC
+
+    Les lignes (dicts de texte ou de valeurs déjà typées) sont converties
+    colonne par colonne au moment d'écrire un row group; seules les
+    `row_group_rows` dernières lignes sont gardées en mémoire.
+    """
+
+    def __init__(self, path, fields, file_format='parquet', row_group_rows=10000, compression='zstd'):
+        """
+        Args:
+            path: Fichier de sortie (dossiers parents créés)
+            fields: Colonnes écrites, dans l'ordre
+            file_format: "parquet" ou "arrow" (flux Arrow IPC: un dictionnaire
+                par record batch, ce que le format fichier n'autorise pas)
+            row_group_rows: Lignes par row group / record batch
+            compression: Codec ("zstd", "snappy", "none"...)
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if file_format not in FORMATS:
+            raise ValueError(f"Format inconnu: {file_format} (choix: {', '.join(FORMATS)})")
+        self.pa = pa
+        self.path = Path(path)
+        self.fields = list(fields)
+        self.schema = arrow_schema(self.fields)
+        self.row_group_rows = max(1, int(row_group_rows))
+        self.buffer = []
+        self.rows = 0
+        self.row_groups = 0
+        # Cellules écrites à null faute de tenir dans le type de leur colonne
+        self.invalid_cells = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        codec = None if compression == 'none' else compression
+        if file_format == 'parquet':
+            self.writer = pq.ParquetWriter(
+                self.path, self.schema, compression=codec or 'none',
+                use_dictionary=[field for field in self.fields if field in DICTIONARY_FIELDS],
+            )
+        else:
+            self.writer = pa.ipc.new_stream(
+                str(self.path), self.schema, options=pa.ipc.IpcWriteOptions(compression=codec),
+            )
+
+    def write(self, row):
+        self.buffer.append(row)
+        if len(self.buffer) >= self.row_group_rows:
+            self.flush()
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def flush(self):
+        """Écrit les lignes tamponnées en un row group"""
+        if not self.buffer:
+            return
+        pa = self.pa
+        arrays = []
+        for field in self.schema:
+            values = [convert_value(field.name, row.get(field.name)) for row in self.buffer]
+            arrays.append(self.column_array(field, values))
+        self.writer.write(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.rows += len(self.buffer)
+        self.row_groups += 1
+        self.buffer = []
+
+    def column_array(self, field, values):
+        """
+        Colonne Arrow d'un row group; si une valeur ne tient pas dans le type,
+        seules les cellules fautives passent à null (le row group est écrit)
+        """
+        pa = self.pa
+        value_type = pa.string() if pa.types.is_dictionary(field.type) else field.type
+        try:
+            array = pa.array(values, value_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            cells = []
+            for value in values:
+                try:
+                    pa.array([value], value_type)
+                except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                    value = None
+                    self.invalid_cells += 1
+                cells.append(value)
+            print(f"   ⚠️ {self.path.name}: valeurs hors type dans {field.name}, écrites à null")
+            array = pa.array(cells, value_type)
+        return array.dictionary_encode() if pa.types.is_dictionary(field.type) else array
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def snapshot_path(root, dataset, category, run_at=None, file_format='parquet'):
+    """
+    Fichier d'un run: <root>/run_date=.../category=.../<dataset>-HHMMSS-ffffff.<ext>
+
+    Les microsecondes distinguent deux runs (ou deux sinks) lancés dans la
+    même seconde.
+
+    Args:
+        root: Racine du jeu de données partitionné
+        dataset: Nom de la sortie (laptops_progressive, gemini_analysis...)
+        category: Partition catégorie (laptops, tablets_static...)
+        run_at: Date du run (défaut: maintenant)
+    """
+    run_at = run_at or datetime.now()
+    return partition_dir(root, run_at.date().isoformat(), category) / (
+        f"{dataset}-{run_at:%H%M%S-%f}{FORMATS[file_format]}"
+    )
+
+
+def latest_snapshot(root, dataset, category, file_format='parquet'):
+    """Dernier instantané de `dataset` dans la catégorie (toutes dates), ou None"""
+    paths = Path(root).glob(f"run_date=*/category={category}/{dataset}-*{FORMATS[file_format]}")
+    return max(paths, key=lambda path: path.stat().st_mtime, default=None)
+
+
+def read_batches(path, file_format=None):
+    """
+    Relit un instantané Parquet ou Arrow par row group
+
+    Args:
+        file_format: "parquet" ou "arrow" (défaut: d'après l'extension)
+
+    Yields:
+        list: Lignes (dicts) d'un row group
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    if (file_format or ('arrow' if path.suffix == FORMATS['arrow'] else 'parquet')) == 'arrow':
+        with pa.ipc.open_stream(str(path)) as reader:
+            for batch in reader:
+                yield batch.to_pylist()
+    else:
+        for batch in pq.ParquetFile(path).iter_batches():
+            yield batch.to_pylist()
+
+
+def convert_csv(csv_path, root, category='laptops', run_at=None, file_format='parquet', row_group_rows=10000):
+    """
+    Convertit un CSV (laptops.csv, gemini_analysis.csv...) en instantané typé,
+    lu et écrit en flux
+
+    Args:
+        run_at: Date du run (défaut: date de modification du CSV)
+
+    Returns:
+        ColumnarWriter: Writer fermé (path, rows, row_groups)
+    """
+    csv_path = Path(csv_path)
+    run_at = run_at or datetime.fromtimestamp(csv_path.stat().st_mtime)
+    path = snapshot_path(root, csv_path.stem, category, run_at, file_format)
+    with open(csv_path, encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        writer = ColumnarWriter(path, reader.fieldnames, file_format, row_group_rows)
+        try:
+            writer.write_rows(reader)
+        finally:
+            writer.close()
+    return writer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conversion des CSV en instantanés Parquet/Arrow typés")
+    parser.add_argument("csv", nargs="+", help="CSV à convertir (laptops.csv, gemini_analysis.csv...)")
+    parser.add_argument("--root", default="columnar", help="Racine du jeu de données partitionné")
+    parser.add_argument("--category", default="laptops", help="Partition catégorie")
+    parser.add_argument("--run-date", help="Date du run AAAA-MM-JJ (défaut: date du CSV)")
+    parser.add_argument("--format", choices=list(FORMATS), default="parquet")
+    parser.add_argument("--row-group-rows", type=int, default=10000, help="Lignes par row group")
+    args = parser.parse_args()
+
+    run_at = datetime.fromisoformat(args.run_date) if args.run_date else None
+    for csv_path in args.csv:
+        writer = convert_csv(csv_path, args.root, args.category, run_at, args.format, args.row_group_rows)
+        size = writer.path.stat().st_size
+        print(f"✅ {csv_path} → {writer.path} ({writer.rows} lignes, {writer.row_groups} row group(s), "
+              f"{size / 1024:.1f} Ko)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+# ecommerce_scraper/csv_writer.py
+from pathlib import Path
+import csv
+import io
+import os
+import threading
+import time
+
+DURABILITY_LEVELS = ('none', 'batch', 'per-row')
+
+
+class DurableCsvWriter:
+    """
+    CSV écrit par lots (group commit) au lieu d'un fsync par ligne
+
+    Niveaux de durabilité:
+        none     lignes dans le tampon du fichier, vidé à la fermeture et
+                 aux commits explicites (pas de fsync)
+        batch    lignes accumulées puis écrites avec un seul fsync quand
+                 `batch_rows` lignes ou `batch_interval` secondes sont
+                 atteints; chaque ligne est d'abord ajoutée au journal
+        per-row  flush + fsync après chaque ligne (ancien comportement)
+
+    Le journal (<csv>.journal) commence par la taille du CSV validé, suivie
+    des lignes du lot en cours. Un crash du processus ne perd rien: à la
+    réouverture, le CSV est tronqué à cette taille et le lot rejoué. Une
+    panne de la machine perd au plus le lot en cours (la fenêtre configurée).
+    """
+
+    def __init__(self, path, fieldnames, append=False,
+                 durability='batch', batch_rows=50, batch_interval=1.0):
+        """
+        Args:
+            path: Chemin du CSV
+            fieldnames: Colonnes (les clés en plus dans les items sont ignorées)
+            append: Rouvrir un CSV existant (après rejeu du journal) au lieu de le recréer
+            durability: "none", "batch" ou "per-row"
+            batch_rows: Lignes par commit (batch)
+            batch_interval: Âge maximal d'un lot avant son commit (s, batch)
+        """
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + '.journal')
+        self.fieldnames = fieldnames
+        self.lock = threading.RLock()
+        self.configure(durability, batch_rows, batch_interval)
+
+        self.pending = []
+        self.pending_bytes = 0
+        self.timer = None
+        self.journal = None
+        self.batch_open = False
+        self.rows = 0
+        self.commits = 0
+        self.fsyncs = 0
+        self.commit_time = 0.0
+
+        if append:
+            self.recover()
+            self.file = open(self.path, 'ab')
+        else:
+            self.journal_path.unlink(missing_ok=True)
+            self.file = open(self.path, 'wb')
+            self.file.write(self.encode(dict(zip(fieldnames, fieldnames))))
+            self.file.flush()
+        self.committed = self.file.tell()
+
+    def configure(self, durability='batch', batch_rows=50, batch_interval=1.0):
+        """Change le niveau de durabilité (avant la première ligne)"""
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Durabilité CSV inconnue: {durability!r} (choix: {', '.join(DURABILITY_LEVELS)})")
+        self.durability = durability
+        self.batch_rows = max(1, int(batch_rows))
+        self.batch_interval = batch_interval
+
+    def encode(self, row):
+        """Ligne CSV encodée (mêmes règles que csv.DictWriter)"""
+        buffer = io.StringIO(newline='')
+        csv.DictWriter(buffer, fieldnames=self.fieldnames, extrasaction='ignore').writerow(row)
+        return buffer.getvalue().encode('utf-8')
+
+    def recover(self):
+        """Rejoue le journal d'un lot non validé (crash pendant le run précédent)"""
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, 'rb') as f:
+            header = f.readline()
+            rows = f.read()
+        if header.strip().isdigit() and rows:
+            count = rows.count(b'\n')
+            with open(self.path, 'r+b') as f:
+                f.truncate(int(header))
+                f.seek(0, os.SEEK_END)
+                f.write(rows)
+                f.flush()
+                os.fsync(f.fileno())
+            print(f"♻️ Journal rejoué: {count} ligne(s) non validées récupérées dans {self.path}")
+        self.journal_path.unlink()
+
+    def writerow(self, row):
+        data = self.encode(row)
+        with self.lock:
+            self.rows += 1
+            if self.durability == 'batch':
+                if not self.batch_open:
+                    self.open_batch()
+                self.journal.write(data)
+                self.journal.flush()
+            self.pending.append(data)
+            self.pending_bytes += len(data)
+
+            if self.durability == 'per-row':
+                self.commit()
+            elif self.durability == 'batch':
+                if len(self.pending) >= self.batch_rows:
+                    self.commit()
+                elif self.timer is None and self.batch_interval:
+                    # Commit du lot à l'échéance, même si plus aucune ligne n'arrive
+                    self.timer = threading.Timer(self.batch_interval, self.commit)
+                    self.timer.daemon = True
+                    self.timer.start()
+            elif self.pending_bytes >= io.DEFAULT_BUFFER_SIZE:
+                self.write_pending()
+
+    def open_batch(self):
+        """Nouveau lot: le journal repart de la taille validée du CSV"""
+        if self.journal is None:
+            self.journal = open(self.journal_path, 'wb')
+        self.journal.write(f"{self.committed}\n".encode('ascii'))
+        self.batch_open = True
+
+    def write_pending(self):
+        self.file.writelines(self.pending)
+        self.pending = []
+        self.pending_bytes = 0
+
+    def commit(self):
+        """Écrit le lot en cours dans le CSV (avec un fsync sauf en durabilité none)"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if self.file.closed or (not self.pending and self.durability != 'none'):
+                return self.committed
+            started = time.perf_counter()
+            self.write_pending()
+            self.file.flush()
+            if self.durability != 'none':
+                os.fsync(self.file.fileno())
+                self.fsyncs += 1
+            self.committed = self.file.tell()
+            if self.batch_open:
+                # Lot validé: le journal redevient vide
+                self.journal.seek(0)
+                self.journal.truncate()
+                self.batch_open = False
+            self.commits += 1
+            self.commit_time += time.perf_counter() - started
+            return self.committed
+
+    def tell(self):
+        """Taille logique du CSV, lignes en attente comprises (après commit(): taille validée)"""
+        with self.lock:
+            return self.file.tell() + self.pending_bytes
+
+    def close(self):
+        with self.lock:
+            self.commit()
+            self.file.close()
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+                self.journal_path.unlink(missing_ok=True)
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: rows, commits, fsyncs, commit_ms (temps passé à valider)
+        """
+        return {
+            'rows': self.rows,
+            'commits': self.commits,
+            'fsyncs': self.fsyncs,
+            'commit_ms': self.commit_time * 1000,
+        }
@@ -0,0 +1,75 @@
+# ecommerce_scraper/enrichment.py
+from pathlib import Path
+import hashlib
+import json
+import os
+import threading
+
+from ecommerce_scraper.extraction import DETAIL_FIELDS
+
+
+def listing_key(item):
+    """
+    Empreinte d'un produit vu dans le listing (titre, prix, description, avis)
+
+    Si elle n'a pas changé depuis le dernier run, la page produit n'est pas
+    retéléchargée: ses champs sont repris du cache. Les champs sont hachés
+    tels qu'extraits du listing (texte brut, avant la normalisation faite
+    par le pipeline d'export).
+    """
+    content = "|".join(str(item.get(field, "")) for field in
+                       ('title', 'price', 'description', 'reviews', 'rating'))
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class DetailCache:
+    """
+    Champs des pages produit conservés d'un run à l'autre, par lien
+
+    Chaque entrée garde l'empreinte du produit dans le listing au moment du
+    téléchargement: une entrée n'est réutilisée que si le produit n'a pas
+    changé dans la grille.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.entries = self.load()
+        self.dirty = False
+
+    def load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Cache des pages produit illisible ({self.path}): {e}")
+            return {}
+
+    def get(self, item):
+        """
+        Returns:
+            dict ou None: Champs de la page produit si le produit est inchangé
+        """
+        with self.lock:
+            entry = self.entries.get(item.get('link'))
+        if entry and entry['key'] == listing_key(item):
+            return {field: entry['fields'].get(field, "") for field in DETAIL_FIELDS}
+        return None
+
+    def store(self, item, fields):
+        with self.lock:
+            self.entries[item['link']] = {'key': listing_key(item), 'fields': fields}
+            self.dirty = True
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            snapshot = dict(self.entries)
+            self.dirty = False
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
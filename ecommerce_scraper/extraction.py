@@ -0,0 +1,202 @@
+# ecommerce_scraper/extraction.py
+import json
+from urllib.parse import urljoin
+
+CSV_FIELDS = ['page', 'title', 'price', 'description', 'reviews', 'rating', 'link', 'screenshot']
+
+# Extraction de la grille en un seul aller-retour WebDriver; `arguments[0]`
+# (optionnel) saute les produits déjà lus en haut d'un listing qui grossit
+EXTRACT_PRODUCTS_JS = """
+var products = Array.prototype.slice.call(document.querySelectorAll('.thumbnail'), arguments[0] || 0);
+return products.map(function (product) {
+    var title = product.querySelector('.title');
+    var text = function (selector) {
+        var element = product.querySelector(selector);
+        return element ? element.innerText : '';
+    };
+    return {
+        title: title ? title.innerText : '',
+        price: text('.price'),
+        description: text('.description'),
+        reviews: text('.ratings p.review-count'),
+        rating: product.querySelectorAll('.ratings .ws-icon-star').length,
+        link: title ? (title.href || '') : ''
+    };
+});
+"""
+
+
+def clean_price(price_text):
+    """'$1,295.99' -> '1295.99'"""
+    return (price_text or "").replace("$", "").replace(",", "").strip()
+
+
+def clean_reviews(reviews_text):
+    """'12 reviews' -> '12'"""
+    reviews_text = (reviews_text or "").strip()
+    return reviews_text.split()[0] if reviews_text else "0"
+
+
+def build_item(page, title, price_text, description, reviews_text, rating, link, screenshot_path=None):
+    """Construit l'item au format du CSV à partir des textes bruts d'un produit"""
+    return {
+        'page': page,
+        'title': (title or "").strip(),
+        'price': clean_price(price_text),
+        'description': (description or "").strip(),
+        'reviews': clean_reviews(reviews_text),
+        'rating': int(rating or 0),
+        'link': link or "",
+        'screenshot': screenshot_path if screenshot_path else ""
+    }
+
+
+def parse_products_js(products, page, screenshot_path=None):
+    """Normalise le tableau renvoyé par EXTRACT_PRODUCTS_JS en items"""
+    return [
+        build_item(
+            page,
+            product.get('title'),
+            product.get('price'),
+            product.get('description'),
+            product.get('reviews'),
+            product.get('rating'),
+            product.get('link'),
+            screenshot_path,
+        )
+        for product in products or []
+    ]
+
+
+def parse_products_html(selector, page, base_url, screenshot_path=None):
+    """
+    Extrait les produits d'un fragment HTML du listing (sélecteur Scrapy)
+
+    Utilise les mêmes classes que l'extraction Selenium: .thumbnail, .title,
+    .price, .description, .ratings p.review-count, .ratings .ws-icon-star
+    """
+    items = []
+    for product in selector.css(".thumbnail"):
+        href = product.css(".title::attr(href)").get()
+        items.append(build_item(
+            page,
+            " ".join(product.css(".title ::text").getall()),
+            product.css(".price ::text").get(),
+            " ".join(product.css(".description ::text").getall()),
+            product.css(".ratings p.review-count ::text").get(),
+            len(product.css(".ratings .ws-icon-star")),
+            urljoin(base_url, href) if href else "",
+            screenshot_path,
+        ))
+    return items
+
+
+def parse_products_json(data, page, base_url, screenshot_path=None):
+    """Extrait les produits d'une réponse JSON (liste d'objets produit)"""
+    products = data.get('products') or data.get('data') or []
+    items = []
+    for product in products:
+        link = product.get('url') or product.get('link') or ""
+        if not link and product.get('id') is not None:
+            link = f"/test-sites/e-commerce/ajax/product/{product['id']}"
+        items.append(build_item(
+            page,
+            product.get('title'),
+            str(product.get('price', "")),
+            product.get('description'),
+            str(product.get('review_count', product.get('reviews', ""))),
+            product.get('rating', product.get('stars', 0)),
+            urljoin(base_url, link) if link else "",
+            screenshot_path,
+        ))
+    return items
+
+
+def parse_listing_response(response, page, screenshot_path=None):
+    """
+    Extrait les produits d'une page du listing téléchargée par Scrapy
+
+    Le site ajax répond soit avec du JSON (fragment HTML dans 'html' ou
+    liste de produits), soit avec du HTML complet.
+
+    Returns:
+        tuple: (items, nombre de pages annoncé ou None)
+    """
+    content_type = response.headers.get('Content-Type', b'').decode('latin-1')
+    if 'json' in content_type:
+        data = json.loads(response.text)
+        pages = data.get('pages') or data.get('lastPage') or data.get('totalPages')
+        if data.get('html'):
+            selector = response.replace(body=data['html'].encode('utf-8'),
+                                        encoding='utf-8').selector
+            items = parse_products_html(selector, page, response.url, screenshot_path)
+            if not pages and data.get('pagination'):
+                pages = parse_page_count(response.replace(
+                    body=data['pagination'].encode('utf-8'), encoding='utf-8').selector)
+        else:
+            items = parse_products_json(data, page, response.url, screenshot_path)
+        return items, int(pages) if pages else None
+
+    return (parse_products_html(response.selector, page, response.url, screenshot_path),
+            parse_page_count(response.selector))
+
+
+def parse_page_count(selector):
+    """Lit le plus grand numéro de page affiché dans la pagination"""
+    numbers = [
+        int(text.strip())
+        for text in selector.css(".pagination button::text, .pagination a::text").getall()
+        if text.strip().isdigit()
+    ]
+    return max(numbers) if numbers else None
+
+
+# Champs ajoutés par la page produit (enrichissement à partir de la colonne link)
+DETAIL_FIELDS = ['full_title', 'options', 'detail_description', 'detail_reviews', 'detail_rating']
+
+
+def parse_product_detail(selector):
+    """
+    Extrait les champs d'une page produit (titre complet, options, avis)
+
+    Le titre de la grille est tronqué ("Asus VivoBook X4"), celui de la
+    page produit est complet. Les options (swatches de capacité, listes
+    déroulantes de couleur) sont jointes par "|".
+    """
+    card = selector.css(".product-wrapper, .thumbnail") or selector
+    title = card.css(".title::attr(title)").get() or " ".join(card.css(".title ::text").getall())
+    options = card.css(".swatches button::attr(value), .swatches button::text, select option::attr(value)").getall()
+    return {
+        'full_title': title.strip(),
+        'options': "|".join(dict.fromkeys(o.strip() for o in options if o.strip())),
+        'detail_description': " ".join(card.css(".description ::text").getall()).strip(),
+        'detail_reviews': clean_reviews(" ".join(card.css(".review-count ::text").getall())),
+        'detail_rating': len(card.css(".ratings .ws-icon-star")),
+    }
+
+
+def parse_product_page(selector, link, page=""):
+    """
+    Item au format du CSV à partir d'une page produit (crawl direct par identifiant)
+
+    Le titre est le titre complet de la page produit; les champs de détail
+    (DETAIL_FIELDS) sont ajoutés à l'item, hors CSV.
+
+    Returns:
+        dict ou None: None si la page ne contient pas de produit
+    """
+    detail = parse_product_detail(selector)
+    price = selector.css(".price ::text").get()
+    if not detail['full_title'] or price is None:
+        return None
+    item = build_item(
+        page,
+        detail['full_title'],
+        price,
+        detail['detail_description'],
+        detail['detail_reviews'],
+        detail['detail_rating'],
+        link,
+    )
+    item.update(detail)
+    return item
@@ -0,0 +1,87 @@
+# ecommerce_scraper/fingerprints.py
+from pathlib import Path
+import hashlib
+import json
+import os
+import threading
+
+# Empreinte bon marché d'une page: liens, prix et nombre d'avis dans l'ordre
+# (à partir du produit `arguments[0]` sur un listing qui grossit)
+FINGERPRINT_JS = """
+var products = Array.prototype.slice.call(document.querySelectorAll('.thumbnail'), arguments[0] || 0);
+return products.map(function (product) {
+    var title = product.querySelector('.title');
+    var price = product.querySelector('.price');
+    var reviews = product.querySelector('.ratings p.review-count');
+    return [
+        title ? (title.href || title.textContent) : '',
+        price ? price.textContent.trim() : '',
+        reviews ? reviews.textContent.trim() : ''
+    ].join('|');
+}).join('\\n');
+"""
+
+
+def page_fingerprint(driver, offset=0):
+    """Calcule l'empreinte de la grille affichée (un seul execute_script)"""
+    content = driver.execute_script(FINGERPRINT_JS, offset) or ""
+    return hashlib.sha1(content.encode('utf-8')).hexdigest() if content else None
+
+
+class PageFingerprints:
+    """
+    Empreintes par page conservées d'un run à l'autre.
+
+    Pour chaque page on garde l'empreinte, les lignes produites et le temps
+    que la page a coûté (capture + extraction). Une page dont l'empreinte
+    n'a pas changé est recopiée telle quelle depuis ce snapshot.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.previous = self.load()
+        self.current = {}
+        self.summary = {'skipped': [], 'changed': [], 'new': [], 'time_saved': 0.0}
+
+    def load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Empreintes illisibles ({self.path}): {e}")
+            return {}
+
+    def unchanged_rows(self, page, fingerprint):
+        """
+        Returns:
+            list ou None: Lignes du run précédent si la page n'a pas changé
+        """
+        previous = self.previous.get(str(page))
+        if not fingerprint or not previous or previous['fingerprint'] != fingerprint:
+            return None
+
+        with self.lock:
+            self.current[str(page)] = previous
+            self.summary['skipped'].append(page)
+            self.summary['time_saved'] += previous.get('cost', 0.0)
+        return [dict(row, page=page) for row in previous['rows']]
+
+    def record(self, page, fingerprint, rows, cost):
+        """Enregistre l'empreinte et les lignes d'une page réellement scrapée"""
+        with self.lock:
+            key = 'changed' if str(page) in self.previous else 'new'
+            self.summary[key].append(page)
+            if fingerprint:
+                self.current[str(page)] = {'fingerprint': fingerprint, 'rows': rows, 'cost': cost}
+
+    def save(self):
+        """Écrit le snapshot du run (pages non revisitées conservées)"""
+        with self.lock:
+            snapshot = dict(self.previous, **self.current)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,302 @@
+# ecommerce_scraper/history.py
+"""
+Historique des prix et des avis dans une base SQLite locale
+
+Chaque run du pipeline (sink "history") ajoute ses observations au lieu
+d'écraser le CSV précédent:
+
+    runs          un run par crawl et par partition (catégorie/variante,
+                  et extracteur: laptops, laptops_http, laptops_ids)
+    products      un produit par lien (dernier titre, prix, avis, note)
+    observations  append-only: (run, lien, date, page, prix, avis, note, capture)
+
+Les index sur (run, lien), (lien, date) et la date rendent « ce qui a
+changé depuis le run précédent » et l'historique d'un produit immédiats,
+sans relire de CSV:
+
+    python -m ecommerce_scraper.history runs
+    python -m ecommerce_scraper.history changes --partition laptops
+    python -m ecommerce_scraper.history prices https://.../product/31
+"""
+from datetime import datetime
+import argparse
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    spider TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    -- running, finished, ou abandoned (run resté ouvert, remplacé par un
+    -- nouveau run de la même partition)
+    status TEXT NOT NULL DEFAULT 'running',
+    items INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS products (
+    link TEXT PRIMARY KEY,
+    title TEXT,
+    description TEXT,
+    first_seen_run INTEGER NOT NULL,
+    last_seen_run INTEGER NOT NULL,
+    last_price REAL,
+    last_reviews INTEGER,
+    last_rating INTEGER,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    link TEXT NOT NULL,
+    observed_at TEXT NOT NULL,
+    page INTEGER,
+    price REAL,
+    reviews INTEGER,
+    rating INTEGER,
+    screenshot TEXT
+);
+CREATE INDEX IF NOT EXISTS observations_run_link ON observations(run_id, link);
+CREATE INDEX IF NOT EXISTS observations_link_time ON observations(link, observed_at);
+CREATE INDEX IF NOT EXISTS observations_time ON observations(observed_at);
+CREATE INDEX IF NOT EXISTS runs_partition ON runs(partition, id);
+"""
+
+UPSERT_PRODUCT = """
+INSERT INTO products (link, title, description, first_seen_run, last_seen_run,
+                      last_price, last_reviews, last_rating, updated_at)
+VALUES (:link, :title, :description, :run_id, :run_id, :price, :reviews, :rating, :observed_at)
+ON CONFLICT(link) DO UPDATE SET
+    title = excluded.title,
+    description = excluded.description,
+    last_seen_run = excluded.last_seen_run,
+    last_price = excluded.last_price,
+    last_reviews = excluded.last_reviews,
+    last_rating = excluded.last_rating,
+    updated_at = excluded.updated_at
+"""
+
+INSERT_OBSERVATION = """
+INSERT INTO observations (run_id, link, observed_at, page, price, reviews, rating, screenshot)
+VALUES (:run_id, :link, :observed_at, :page, :price, :reviews, :rating, :screenshot)
+"""
+
+# Produits nouveaux, modifiés (prix, avis, note) ou disparus entre deux runs
+CHANGES_SQL = """
+SELECT 'new' AS status, cur.link, NULL AS old_price, cur.price AS new_price,
+       NULL AS old_reviews, cur.reviews AS new_reviews, NULL AS old_rating, cur.rating AS new_rating
+FROM observations cur
+WHERE cur.run_id = :current
+  AND NOT EXISTS (SELECT 1 FROM observations prev WHERE prev.run_id = :previous AND prev.link = cur.link)
+UNION ALL
+SELECT 'changed', cur.link, prev.price, cur.price, prev.reviews, cur.reviews, prev.rating, cur.rating
+FROM observations cur
+JOIN observations prev ON prev.run_id = :previous AND prev.link = cur.link
+WHERE cur.run_id = :current
+  AND (cur.price IS NOT prev.price OR cur.reviews IS NOT prev.reviews OR cur.rating IS NOT prev.rating)
+UNION ALL
+SELECT 'removed', prev.link, prev.price, NULL, prev.reviews, NULL, prev.rating, NULL
+FROM observations prev
+WHERE prev.run_id = :previous
+  AND NOT EXISTS (SELECT 1 FROM observations cur WHERE cur.run_id = :current AND cur.link = prev.link)
+"""
+
+
+def to_float(value):
+    """Prix numérique ('1295.99', '$1,295.99') ou None si illisible"""
+    if isinstance(value, float):
+        return value
+    try:
+        return float(str(value).replace("$", "").replace(",", "").strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def to_int(value):
+    """Entier ('12', '12 reviews', 4) ou None si illisible"""
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).split()[0])
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+# Libellés du statut d'un run (commande runs)
+RUN_STATUS = {'running': "⏳", 'finished': "✅", 'abandoned': "⚠️ abandonné"}
+
+
+class PriceHistory:
+    """Base SQLite de l'historique (partageable entre crawls: WAL + busy timeout)"""
+
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=timeout)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.lock = threading.Lock()
+
+    def start_run(self, spider, partition, resume_page=None):
+        """
+        Ouvre un run, ou reprend le dernier run non terminé de la partition
+        (reprise après checkpoint: observations des pages > resume_page supprimées)
+
+        Les autres runs restés ouverts dans la partition (crawl interrompu
+        puis relancé sans reprise) sont marqués abandoned: ils ne comptent
+        plus jamais comme runs terminés (changes).
+
+        Returns:
+            int: Identifiant du run
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.lock, self.connection:
+            run_id = None
+            if resume_page is not None:
+                row = self.connection.execute(
+                    "SELECT id FROM runs WHERE partition = ? AND status = 'running' ORDER BY id DESC LIMIT 1",
+                    (partition,),
+                ).fetchone()
+                if row:
+                    run_id = row['id']
+                    self.connection.execute(
+                        "DELETE FROM observations WHERE run_id = ? AND page > ?", (run_id, resume_page)
+                    )
+            self.connection.execute(
+                "UPDATE runs SET status = 'abandoned', finished_at = ?, "
+                "items = (SELECT COUNT(*) FROM observations WHERE run_id = runs.id) "
+                "WHERE partition = ? AND status = 'running' AND id IS NOT ?",
+                (now, partition, run_id),
+            )
+            if run_id is not None:
+                return run_id
+            cursor = self.connection.execute(
+                "INSERT INTO runs (spider, partition, started_at) VALUES (?, ?, ?)",
+                (spider, partition, now),
+            )
+            return cursor.lastrowid
+
+    def record(self, run_id, rows):
+        """
+        Enregistre des items du run: une transaction par page (upsert des
+        produits par lien + observations en un seul executemany)
+
+        HistorySink n'appelle record qu'avec des pages complètes: une page
+        n'est jamais validée en plusieurs fois.
+        """
+        observed_at = datetime.now().isoformat(timespec='seconds')
+        pages = {}
+        for row in rows:
+            if not row.get('link'):
+                continue
+            pages.setdefault(to_int(row.get('page')), []).append({
+                'run_id': run_id,
+                'link': row['link'],
+                'title': row.get('full_title') or row.get('title'),
+                'description': row.get('description'),
+                'observed_at': observed_at,
+                'page': to_int(row.get('page')),
+                'price': to_float(row.get('price')),
+                'reviews': to_int(row.get('reviews')),
+                'rating': to_int(row.get('rating')),
+                'screenshot': row.get('screenshot') or None,
+            })
+        with self.lock:
+            for observations in pages.values():
+                with self.connection:
+                    self.connection.executemany(UPSERT_PRODUCT, observations)
+                    self.connection.executemany(INSERT_OBSERVATION, observations)
+
+    def finish_run(self, run_id):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE runs SET status = 'finished', finished_at = ?, "
+                "items = (SELECT COUNT(*) FROM observations WHERE run_id = runs.id) WHERE id = ?",
+                (datetime.now().isoformat(timespec='seconds'), run_id),
+            )
+
+    def runs(self, partition=None, limit=20):
+        query = "SELECT * FROM runs"
+        params = ()
+        if partition:
+            query += " WHERE partition = ?"
+            params = (partition,)
+        query += " ORDER BY id DESC LIMIT ?"
+        return [dict(row) for row in self.connection.execute(query, params + (limit,))]
+
+    def latest_runs(self, partition):
+        """Deux derniers runs terminés de la partition: (courant, précédent)"""
+        rows = self.connection.execute(
+            "SELECT id FROM runs WHERE partition = ? AND status = 'finished' ORDER BY id DESC LIMIT 2",
+            (partition,),
+        ).fetchall()
+        if len(rows) < 2:
+            return None, None
+        return rows[0]['id'], rows[1]['id']
+
+    def changes(self, partition, current=None, previous=None):
+        """
+        Produits nouveaux, modifiés ou disparus entre deux runs (par défaut
+        les deux derniers runs terminés de la partition)
+
+        Returns:
+            list: dicts status, link, old_/new_price, old_/new_reviews, old_/new_rating
+        """
+        if current is None or previous is None:
+            current, previous = self.latest_runs(partition)
+            if current is None:
+                return []
+        return [dict(row) for row in self.connection.execute(
+            CHANGES_SQL, {'current': current, 'previous': previous}
+        )]
+
+    def price_history(self, link):
+        """Observations d'un produit dans l'ordre chronologique"""
+        return [dict(row) for row in self.connection.execute(
+            "SELECT run_id, observed_at, page, price, reviews, rating FROM observations "
+            "WHERE link = ? ORDER BY observed_at, run_id",
+            (link,),
+        )]
+
+    def close(self):
+        self.connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Historique des prix (base SQLite du pipeline)")
+    parser.add_argument("--db", default="price_history.sqlite", help="Base SQLite (HISTORY_DB)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    runs = commands.add_parser("runs", help="Derniers runs enregistrés")
+    runs.add_argument("--partition")
+    changes = commands.add_parser("changes", help="Différences entre les deux derniers runs")
+    changes.add_argument("--partition", default="laptops")
+    prices = commands.add_parser("prices", help="Historique d'un produit")
+    prices.add_argument("link")
+    args = parser.parse_args()
+
+    history = PriceHistory(args.db)
+    try:
+        if args.command == "runs":
+            for run in history.runs(args.partition):
+                print(f"#{run['id']:<4} {run['partition']:<20} {run['started_at']} → "
+                      f"{run['finished_at'] or 'en cours'} {RUN_STATUS[run['status']]} | "
+                      f"{run['items']} items ({run['spider']})")
+        elif args.command == "changes":
+            rows = history.changes(args.partition)
+            if not rows:
+                print(f"ℹ️ Aucune différence (ou moins de deux runs terminés pour {args.partition})")
+            for row in rows:
+                print(f"{row['status']:<8} {row['link']} | prix {row['old_price']} → {row['new_price']} | "
+                      f"avis {row['old_reviews']} → {row['new_reviews']} | note {row['old_rating']} → {row['new_rating']}")
+        else:
+            for row in history.price_history(args.link):
+                print(f"{row['observed_at']} (run #{row['run_id']}): {row['price']} $ | "
+                      f"{row['reviews']} avis | note {row['rating']}")
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# ecommerce_scraper/id_range.py
+
+
+class IdSweep:
+    """
+    Balayage d'identifiants produit dans une direction (croissante ou décroissante).
+
+    Jusqu'à `window` identifiants sont demandés en même temps. Les réponses
+    arrivent dans le désordre, mais les absences (404) sont comptées dans
+    l'ordre des identifiants: le balayage s'arrête après `max_misses`
+    absences consécutives (trou plus grand que ceux du catalogue), ou à la
+    borne `stop` si la plage est connue.
+    """
+
+    def __init__(self, start, step=1, max_misses=10, stop=None, window=8):
+        """
+        Args:
+            start: Premier identifiant demandé
+            step: +1 (vers le haut) ou -1 (vers le bas)
+            max_misses: Absences consécutives qui terminent le balayage
+                (ignoré si `stop` est donné)
+            stop: Dernier identifiant inclus (plage connue), ou None
+            window: Requêtes en vol au maximum
+        """
+        self.step = 1 if step > 0 else -1
+        self.next_id = start
+        self.stop = stop
+        self.max_misses = max(1, int(max_misses))
+        self.window = max(1, int(window))
+        self.in_flight = 0
+        self.results = {}
+        self.checked = start - self.step
+        self.misses = 0
+        self.found = 0
+        self.finished = False
+
+    def in_range(self, product_id):
+        if product_id < 1:
+            return False
+        if self.stop is None:
+            return True
+        return product_id <= self.stop if self.step > 0 else product_id >= self.stop
+
+    def take(self):
+        """
+        Identifiants à demander maintenant (fenêtre non pleine)
+
+        Returns:
+            list: identifiants, vide si la fenêtre est pleine ou le balayage fini
+        """
+        ids = []
+        # Pas plus de `window` identifiants d'avance sur le dernier résultat
+        # continu: une réponse lente ne laisse pas le balayage dépasser la fin
+        while (not self.finished and self.in_flight < self.window and self.in_range(self.next_id)
+               and (self.next_id - self.checked) * self.step <= self.window):
+            ids.append(self.next_id)
+            self.next_id += self.step
+            self.in_flight += 1
+        return ids
+
+    def resolve(self, product_id, found):
+        """Enregistre le résultat d'un identifiant et met à jour le compteur d'absences"""
+        self.in_flight -= 1
+        self.results[product_id] = found
+        if found:
+            self.found += 1
+        while self.checked + self.step in self.results:
+            self.checked += self.step
+            if self.results.pop(self.checked):
+                self.misses = 0
+            else:
+                self.misses += 1
+                if self.stop is None and self.misses >= self.max_misses:
+                    self.finished = True
+        if not self.in_range(self.next_id) and not self.in_flight:
+            self.finished = True
+
+    @property
+    def last_found(self):
+        """Dernier identifiant continu vérifié avant la série d'absences finale"""
+        return self.checked - self.misses * self.step
@@ -1,12 +1,55 @@
-# Define here the models for your scraped items
-#
-# See documentation in:
-# https://docs.scrapy.org/en/latest/topics/items.html
+# ecommerce_scraper/items.py
+"""
+Normalisation des items avant l'export
 
-import scrapy
+Les spiders produisent des dicts au format du CSV (build_item), prix et
+avis en texte: le cache des pages produit, les empreintes de pages et les
+instantanés JSON les gardent tels quels. Le pipeline d'export les type
+une seule fois (normalize_item), avec les règles de conversion de
+history.to_float / to_int, et les sinks reçoivent des nombres.
+"""
+import math
 
+from ecommerce_scraper.history import to_float, to_int
 
-class EcommerceScraperItem(scrapy.Item):
-    # define the fields for your item here like:
-    # name = scrapy.Field()
-    pass
+# Note: nombre d'étoiles affichées
+RATING_RANGE = (0, 5)
+
+
+def format_price(price):
+    """Prix pour une sortie texte (CSV): 299.0 -> '299', 1295.99 -> '1295.99', None -> ''"""
+    if price is None:
+        return ""
+    if isinstance(price, float):
+        return format(price, '.15g')
+    return str(price)
+
+
+def normalize_item(row):
+    """
+    Type les champs numériques d'un item: prix en float, avis et note en int
+
+    Une valeur illisible (prix "N/A", avis "4.7") ou hors bornes (prix
+    négatif ou non fini, avis négatifs, note hors 0..5) devient None et son
+    champ est noté dans `invalid` ("price|rating", vide si tout est lisible).
+
+    Returns:
+        dict: L'item (modifié en place)
+    """
+    price = to_float(row.get('price'))
+    if price is not None and not 0 <= price < math.inf:
+        price = None
+    reviews = to_int(row.get('reviews'))
+    if reviews is not None and reviews < 0:
+        reviews = None
+    rating = to_int(row.get('rating'))
+    low, high = RATING_RANGE
+    if rating is not None and not low <= rating <= high:
+        rating = None
+
+    row['price'], row['reviews'], row['rating'] = price, reviews, rating
+    row['invalid'] = "|".join(
+        field for field, value in (('price', price), ('reviews', reviews), ('rating', rating))
+        if value is None
+    )
+    return row
@@ -3,11 +3,25 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
-from scrapy import signals
+import threading
+import time
+
+from pathlib import Path
+
+from scrapy import Request, signals
+from scrapy.http import HtmlResponse
+from selenium.webdriver.common.by import By
+from twisted.internet.threads import deferToThread
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
 
+from ecommerce_scraper.browser import create_driver
+from ecommerce_scraper.enrichment import DetailCache
+from ecommerce_scraper.extraction import DETAIL_FIELDS, parse_product_detail
+from ecommerce_scraper.rendering import BrowserThreads
+from ecommerce_scraper.waits import WaitPolicy
+
 
 class EcommerceScraperSpiderMiddleware:
     # Not all methods need to be defined. If a method is not defined,
@@ -98,3 +112,200 @@ class EcommerceScraperDownloaderMiddleware:
 
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
+
+
+class SeleniumRenderMiddleware:
+    """
+    Rend dans Chrome les requêtes marquées meta['selenium'] = True.
+
+    Le rendu (driver.get, attente, page_source) se fait dans un pool de
+    threads dédié avec un navigateur par thread: le reactor continue de
+    télécharger les autres requêtes pendant que Chrome travaille. Ces
+    navigateurs sont distincts de celui que le spider utilise pour la
+    pagination.
+
+    Options de la requête:
+        meta['selenium_script']: JavaScript exécuté après le chargement
+        meta['selenium_wait']: Sélecteur CSS à attendre avant de rendre la page
+    """
+
+    def __init__(self, threads=1):
+        self.threads = BrowserThreads(threads, name="selenium-render")
+        self.local = threading.local()
+        self.drivers = []
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        middleware = cls(crawler.settings.getint('SELENIUM_RENDER_THREADS', 1))
+        middleware.stats = crawler.stats
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    async def process_request(self, request, spider):
+        if not request.meta.get('selenium'):
+            return None
+        started = time.perf_counter()
+        url, body = await self.threads.call(self.render, request, spider)
+        self.stats.inc_value("selenium/rendered")
+        self.stats.inc_value("selenium/render_time_ms", int((time.perf_counter() - started) * 1000))
+        return HtmlResponse(url, body=body, encoding='utf-8', request=request)
+
+    def get_driver(self, spider):
+        """Navigateur du thread courant (lancé au premier rendu)"""
+        driver = getattr(self.local, 'driver', None)
+        if driver is None:
+            factory = getattr(spider, 'new_driver', create_driver)
+            driver = self.local.driver = factory()
+            with self.lock:
+                self.drivers.append(driver)
+        return driver
+
+    def render(self, request, spider):
+        """Exécuté dans un thread du pool: charge la page et renvoie son HTML"""
+        driver = self.get_driver(spider)
+        waits = getattr(spider, 'waits', None) or WaitPolicy()
+        driver.get(request.url)
+        waits.until(driver, lambda d: d.execute_script("return document.readyState") == 'complete',
+                    "render_load")
+        if request.meta.get('selenium_wait'):
+            selector = request.meta['selenium_wait']
+            waits.until(driver, lambda d: d.find_elements(By.CSS_SELECTOR, selector), "render_wait")
+        if request.meta.get('selenium_script'):
+            driver.execute_script(request.meta['selenium_script'])
+        return driver.current_url, driver.page_source
+
+    def spider_closed(self, spider):
+        # Arrêt des navigateurs hors du thread du reactor
+        return deferToThread(self.close_drivers)
+
+    def close_drivers(self):
+        """Arrête les threads de rendu puis leurs navigateurs (bloquant)"""
+        self.threads.stop()
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self.drivers = []
+
+
+class DetailEnrichmentMiddleware:
+    """
+    Complète les items du listing avec leur page produit (colonne link).
+
+    Pour chaque item, la page produit est demandée au téléchargeur de
+    Scrapy pendant que la pagination continue; l'item n'est transmis aux
+    pipelines qu'une fois fusionné avec les champs de la page produit
+    (DETAIL_FIELDS). Les pages produit passent par un slot de
+    téléchargement dédié (DOWNLOAD_SLOTS["details"]) dont le délai suit la
+    latence observée, à la manière d'AutoThrottle, sans ralentir le slot
+    du listing. Les produits inchangés depuis le dernier run sont
+    complétés depuis le cache, sans requête.
+    """
+
+    slot = "details"
+
+    def __init__(self, crawler, enabled=True, use_cache=True, target_concurrency=4.0,
+                 min_delay=0.0, max_delay=5.0):
+        self.crawler = crawler
+        self.stats = crawler.stats
+        self.enabled = enabled
+        self.use_cache = use_cache
+        self.target_concurrency = max(0.1, target_concurrency)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.cache = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        middleware = cls(
+            crawler,
+            enabled=settings.getbool('ENRICH_DETAILS', False),
+            use_cache=settings.getbool('ENRICH_CACHE', True),
+            target_concurrency=settings.getfloat('ENRICH_TARGET_CONCURRENCY', 4.0),
+            min_delay=settings.getfloat('ENRICH_MIN_DELAY', 0.0),
+            max_delay=settings.getfloat('ENRICH_MAX_DELAY', 5.0),
+        )
+        crawler.signals.connect(middleware.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def spider_opened(self, spider):
+        if self.enabled and self.use_cache:
+            csv_filename = getattr(spider, 'csv_filename', None)
+            path = Path(csv_filename).with_suffix('.details.json') if csv_filename else Path(f"{spider.name}.details.json")
+            self.cache = DetailCache(path)
+
+    def process_spider_output(self, response, result, spider):
+        for element in result:
+            yield from self.enrich(element)
+
+    async def process_spider_output_async(self, response, result, spider):
+        async for element in result:
+            for output in self.enrich(element):
+                yield output
+
+    def enrich(self, element):
+        """Item du listing -> requête de sa page produit (ou item complété depuis le cache)"""
+        if (not self.enabled or isinstance(element, Request) or not isinstance(element, dict)
+                or not element.get('link') or 'full_title' in element):
+            yield element
+            return
+
+        cached = self.cache.get(element) if self.cache else None
+        if cached is not None:
+            self.stats.inc_value("enrich/cached")
+            yield dict(element, **cached)
+            return
+
+        yield Request(
+            element['link'],
+            callback=self.parse_detail,
+            errback=self.detail_failed,
+            cb_kwargs={'item': element},
+            meta={'download_slot': self.slot, 'autothrottle_dont_adjust_delay': True},
+            priority=10,
+            dont_filter=True,
+        )
+
+    def parse_detail(self, response, item):
+        """Fusionne les champs de la page produit dans l'item du listing"""
+        self.adjust_delay(response)
+        fields = parse_product_detail(response.selector)
+        if self.cache is not None and response.status == 200:
+            self.cache.store(item, fields)
+        self.stats.inc_value("enrich/fetched")
+        yield dict(item, **fields)
+
+    def detail_failed(self, failure):
+        """Page produit en échec: l'item part quand même, sans les champs de détail"""
+        self.stats.inc_value("enrich/failed")
+        item = failure.request.cb_kwargs['item']
+        yield dict(item, **{field: "" for field in DETAIL_FIELDS})
+
+    def adjust_delay(self, response):
+        """
+        Ajuste le délai du slot des pages produit sur la latence observée
+
+        Même règle qu'AutoThrottle: viser `target_concurrency` requêtes en
+        vol (délai = latence / cible), monter tout de suite mais descendre
+        en douceur, et ne jamais accélérer sur une réponse en erreur.
+        """
+        latency = response.meta.get('download_latency')
+        slot = self.crawler.engine.downloader.slots.get(self.slot)
+        if latency is None or slot is None:
+            return
+        target_delay = latency / self.target_concurrency
+        new_delay = max(target_delay, (slot.delay + target_delay) / 2.0)
+        new_delay = min(max(self.min_delay, new_delay), self.max_delay)
+        if response.status != 200 and new_delay <= slot.delay:
+            return
+        slot.delay = new_delay
+        self.stats.set_value("enrich/delay_ms", round(new_delay * 1000, 1))
+        self.stats.max_value("enrich/latency_max_ms", round(latency * 1000, 1))
+
+    def spider_closed(self, spider):
+        if self.cache is not None:
+            self.cache.save()
@@ -0,0 +1,137 @@
+# ecommerce_scraper/pagination.py
+from ecommerce_scraper.extraction import parse_page_count
+
+PAGINATION_BUTTONS = ".pagination button, .pagination a"
+NEXT_LABELS = ("next", ">", "›", "»", "suivant")
+# Bouton "More" de la variante more du site de test
+MORE_BUTTON = ".ecomerce-items-scroll-more"
+
+# Clique sur l'élément `arguments[0]` (sélecteur CSS) dont le texte vaut
+# `arguments[1]` (ou le premier si aucun texte n'est demandé)
+CLICK_BUTTON_JS = """
+var buttons = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < buttons.length; i++) {
+    var button = buttons[i];
+    if (arguments[1] !== null && button.textContent.trim() !== arguments[1]) { continue; }
+    if (button.disabled || button.offsetParent === null || button.classList.contains('disabled')
+            || (button.parentElement && button.parentElement.classList.contains('disabled'))) {
+        return 'disabled';
+    }
+    button.click();
+    return 'clicked';
+}
+return 'missing';
+"""
+
+
+def is_next_label(text):
+    """Vrai pour le libellé d'un bouton "page suivante" (Next, >, ›, »)"""
+    text = text.strip().lower()
+    return text in NEXT_LABELS or text.startswith("next")
+
+
+def split_pages(first_page, last_page, size):
+    """
+    Découpe [first_page, last_page] en `size` plages contiguës
+
+    Returns:
+        list: Une liste de numéros de page par worker (sans plage vide)
+    """
+    pages = list(range(first_page, last_page + 1))
+    size = max(1, min(size, len(pages)))
+    chunk, extra = divmod(len(pages), size)
+
+    ranges = []
+    start = 0
+    for worker_id in range(size):
+        end = start + chunk + (1 if worker_id < extra else 0)
+        ranges.append(pages[start:end])
+        start = end
+    return ranges
+
+
+def _unique_selector(selector, element, candidates):
+    """Premier sélecteur CSS de la liste qui ne désigne que cet élément"""
+    for candidate in candidates:
+        matches = selector.css(candidate)
+        if len(matches) == 1 and matches[0].get() == element.get():
+            return candidate
+    return None
+
+
+class PaginationPlan:
+    """
+    Plan de pagination lu une seule fois dans le widget du listing.
+
+    Contient le nombre total de pages et des sélecteurs CSS précis pour le
+    bouton 'Next >' et les boutons numérotés: plus besoin de parcourir tous
+    les <button> de la page à chaque navigation, ni de cliquer jusqu'à ce
+    que 'Next >' soit désactivé pour découvrir la fin.
+    """
+
+    def __init__(self, total_pages, next_selector=None, page_selector=None):
+        self.total_pages = int(total_pages)
+        self.next_selector = next_selector
+        self.page_selector = page_selector
+
+    @classmethod
+    def from_selector(cls, selector):
+        """
+        Lit le widget de pagination (HTML d'une réponse Scrapy ou du navigateur)
+
+        Returns:
+            PaginationPlan ou None: None si aucune pagination n'est trouvée
+        """
+        total_pages = parse_page_count(selector)
+        if not total_pages:
+            return None
+
+        buttons = selector.css(PAGINATION_BUTTONS)
+        next_selector = None
+        page_selector = None
+        for button in buttons:
+            text = " ".join(button.css("::text").getall())
+            tag = button.xpath("name()").get()
+            classes = (button.attrib.get("class") or "").split()
+            if next_selector is None and is_next_label(text):
+                candidates = [f".pagination {tag}.{name}" for name in classes]
+                candidates += [f".pagination {tag}[rel=next]", f".pagination [aria-label=Next]"]
+                next_selector = _unique_selector(selector, button, candidates)
+            elif page_selector is None and text.strip().isdigit():
+                # Classe commune à tous les boutons numérotés
+                numbered = [b for b in buttons if " ".join(b.css("::text").getall()).strip().isdigit()]
+                for name in classes:
+                    if all(name in (b.attrib.get("class") or "").split() for b in numbered):
+                        page_selector = f".pagination {tag}.{name}"
+                        break
+                else:
+                    page_selector = f".pagination {tag}"
+
+        return cls(total_pages, next_selector, page_selector)
+
+    def pages(self, first_page=1, max_pages=None):
+        """Pages à parcourir, de first_page à la dernière (bornée par max_pages)"""
+        last_page = min(self.total_pages, max_pages) if max_pages else self.total_pages
+        return list(range(first_page, last_page + 1))
+
+    def split(self, size, first_page=1, max_pages=None):
+        """Découpe le plan en plages contiguës pour des workers parallèles"""
+        pages = self.pages(first_page, max_pages)
+        if not pages:
+            return []
+        return split_pages(pages[0], pages[-1], size)
+
+    def copy(self):
+        """Copie indépendante (un plan par worker du pool)"""
+        return PaginationPlan(self.total_pages, self.next_selector, self.page_selector)
+
+    def to_dict(self):
+        return {
+            'total_pages': self.total_pages,
+            'next_selector': self.next_selector,
+            'page_selector': self.page_selector,
+        }
+
+    def __repr__(self):
+        return (f"PaginationPlan({self.total_pages} pages, next={self.next_selector!r}, "
+                f"page={self.page_selector!r})")
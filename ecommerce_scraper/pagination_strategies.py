@@ -0,0 +1,333 @@
+# ecommerce_scraper/pagination_strategies.py
+"""
+Stratégies de pagination d'un listing Selenium
+
+    buttons  boutons numérotés et 'Next >' (grille remplacée en ajax)
+    url      paramètre d'URL ?page=N (pages servies par le serveur)
+    scroll   défilement infini, jusqu'à ce que la grille ne grossisse plus
+    more     bouton "Load more" qui ajoute le lot suivant à la grille
+
+Le spider ne connaît que open() (placer un driver sur une page), advance()
+(passer à la suivante) et `offset` (produits de la grille déjà lus): sur les
+listings qui grossissent, seuls les produits ajoutés depuis l'étape
+précédente sont extraits, sans relire toute la grille à chaque lot.
+"""
+from selenium.webdriver.common.by import By
+import copy
+import threading
+import time
+
+from ecommerce_scraper.pagination import CLICK_BUTTON_JS, MORE_BUTTON, PAGINATION_BUTTONS, is_next_label
+
+SCROLL_TO_BOTTOM_JS = "window.scrollTo(0, document.body.scrollHeight);"
+
+
+class PaginationStrategy:
+    """
+    Base commune: chronométrage des étapes et débit par stratégie
+
+    Les stats (étapes, produits, temps de navigation, produits/s) sont
+    partagées par tous les drivers qui utilisent la stratégie (pool de
+    navigateurs, onglets); chaque worker du pool navigue avec sa propre
+    copie (for_worker) pour le plan et l'offset.
+    """
+    name = None
+    # Une page = une grille distincte: plan de pagination, pool et onglets possibles
+    paginated = True
+
+    def __init__(self, start_url, waits, idle=1.0):
+        """
+        Args:
+            start_url: URL du listing (page 1)
+            waits: WaitPolicy du spider
+            idle: Durée sans nouveau produit qui marque la fin d'un listing
+                qui grossit (s)
+        """
+        self.start_url = start_url
+        self.waits = waits
+        self.idle = idle
+        self.plan = None
+        self.offset = 0
+        self.steps = 0
+        self.products = 0
+        self.navigation_time = 0.0
+        self.started = None
+        self.finished = None
+        self.lock = threading.Lock()
+        # Stratégie qui porte les stats (elle-même, ou l'originale d'une copie)
+        self.shared = self
+
+    def for_worker(self):
+        """
+        Copie pour un worker du pool: plan et offset propres au worker, stats
+        toujours comptées sur la stratégie d'origine (sous son verrou)
+        """
+        worker = copy.copy(self)
+        worker.plan = self.plan.copy() if self.plan else None
+        worker.offset = 0
+        return worker
+
+    def open(self, driver, page_number, prefix=""):
+        """
+        Charge le listing et place le driver sur page_number
+
+        Returns:
+            bool: False si la page n'a pas pu être atteinte
+        """
+        raise NotImplementedError
+
+    def next(self, driver, page_number):
+        """Navigation vers page_number (page suivante); False en fin de listing"""
+        raise NotImplementedError
+
+    def advance(self, driver, page_number):
+        """
+        Passe à la page (ou au lot) suivant et attend son chargement
+
+        Returns:
+            bool: False en fin de pagination
+        """
+        started = time.perf_counter()
+        try:
+            return self.next(driver, page_number)
+        finally:
+            shared = self.shared
+            with shared.lock:
+                shared.steps += 1
+                shared.navigation_time += time.perf_counter() - started
+
+    def record_products(self, count):
+        """Compte les produits extraits d'une étape (pour le débit)"""
+        now = time.perf_counter()
+        shared = self.shared
+        with shared.lock:
+            if shared.started is None:
+                shared.started = now
+            shared.products += count
+            shared.finished = now
+
+    def summary(self):
+        """
+        Returns:
+            dict: steps, products, navigation_avg_ms, products_per_s
+        """
+        with self.lock:
+            elapsed = (self.finished - self.started) if self.started is not None else 0.0
+            return {
+                'steps': self.steps,
+                'products': self.products,
+                'navigation_avg_ms': self.navigation_time / self.steps * 1000 if self.steps else 0.0,
+                'products_per_s': self.products / elapsed if elapsed > 0 else 0.0,
+            }
+
+
+class ButtonPagination(PaginationStrategy):
+    """Boutons numérotés et 'Next >' d'une pagination ajax"""
+    name = 'buttons'
+
+    def open(self, driver, page_number, prefix=""):
+        driver.get(self.start_url)
+        print(f"{prefix}📡 Navigation vers: {self.start_url}")
+        self.waits.wait_for_grid(driver, "initial_load")
+        print(f"{prefix}✅ Page initiale chargée avec succès!")
+
+        if page_number > 1 and not self.goto(page_number, driver):
+            print(f"{prefix}⚠️ Impossible d'atteindre la page {page_number}")
+            return False
+        return True
+
+    def next(self, driver, page_number):
+        previous = self.waits.grid_state(driver)
+        status = self.next_button(driver)
+        if status == 'disabled':
+            return False
+        if status != 'clicked':
+            # Bouton absent ou clic en échec: ce n'est pas la fin du listing,
+            # l'erreur fait relancer la page (crawl_page_range)
+            raise RuntimeError(f"bouton 'Next >' inutilisable ({status})")
+        print(f"   ⏳ Chargement de la page {page_number}...")
+        self.waits.wait_for_grid_change(driver, previous)
+        return True
+
+    def next_button(self, driver):
+        """
+        Clique sur le bouton 'Next >' pour passer à la page suivante
+
+        Utilise le sélecteur précis du plan de pagination (un seul
+        execute_script); sans plan, parcourt une fois les boutons de la
+        pagination à la recherche d'un libellé 'Next'.
+
+        Returns:
+            str: 'clicked', 'disabled' (dernière page atteinte), 'missing'
+            (aucun bouton 'Next') ou 'error' (clic en échec)
+        """
+        try:
+            if self.plan and self.plan.next_selector:
+                status = driver.execute_script(CLICK_BUTTON_JS, self.plan.next_selector, None)
+                if status == 'clicked':
+                    return status
+                if status == 'disabled':
+                    print("   🏁 Bouton désactivé - Dernière page atteinte!")
+                    return status
+
+            print("   🔍 Recherche du bouton 'Next >'...")
+            for button in driver.find_elements(By.CSS_SELECTOR, PAGINATION_BUTTONS):
+                text = button.text.strip()
+                if not is_next_label(text):
+                    continue
+                print(f"      Bouton trouvé: '{text}'")
+
+                if not button.is_enabled() or button.get_attribute("disabled"):
+                    print("   🏁 Bouton désactivé - Dernière page atteinte!")
+                    return 'disabled'
+
+                # Clic JavaScript: pas besoin de scroller jusqu'au bouton
+                driver.execute_script("arguments[0].click();", button)
+                print(f"   ✅ Clic réussi sur le bouton '{text}'!")
+                return 'clicked'
+
+            print("   ⚠️ Aucun bouton 'Next' trouvé")
+            return 'missing'
+
+        except Exception as e:
+            print(f"   ⚠️ Erreur lors du clic: {str(e)[:80]}")
+            return 'error'
+
+    def click_next(self, driver):
+        """Vrai si le clic sur 'Next >' a lancé la navigation (voir next_button)"""
+        return self.next_button(driver) == 'clicked'
+
+    def click_page(self, page_number, driver):
+        """
+        Clique sur le bouton numéroté d'une page s'il est affiché (sans attendre)
+
+        Returns:
+            bool: False si le bouton n'existe pas (ou est désactivé)
+        """
+        selector = self.plan.page_selector if self.plan and self.plan.page_selector else PAGINATION_BUTTONS
+        return driver.execute_script(CLICK_BUTTON_JS, selector, str(page_number)) == 'clicked'
+
+    def goto(self, page_number, driver):
+        """
+        Amène le driver sur une page donnée de la pagination
+
+        Clique directement sur le bouton numéroté s'il est affiché, sinon
+        avance avec le bouton 'Next >' jusqu'à la page voulue.
+        """
+        previous = self.waits.grid_state(driver)
+        if self.click_page(page_number, driver):
+            print(f"   ⏩ Saut direct vers la page {page_number}")
+            self.waits.wait_for_grid_change(driver, previous, "goto_page")
+            return True
+
+        for _ in range(page_number - 1):
+            previous = self.waits.grid_state(driver)
+            if not self.click_next(driver):
+                return False
+            self.waits.wait_for_grid_change(driver, previous, "goto_page")
+        return True
+
+
+class UrlParamPagination(PaginationStrategy):
+    """Pages servies par le serveur: chargement direct de ?page=N"""
+    name = 'url'
+    param = 'page'
+
+    def page_url(self, page_number):
+        if page_number <= 1:
+            return self.start_url
+        separator = '&' if '?' in self.start_url else '?'
+        return f"{self.start_url}{separator}{self.param}={page_number}"
+
+    def open(self, driver, page_number, prefix=""):
+        driver.get(self.page_url(page_number))
+        print(f"{prefix}📡 Navigation vers: {self.page_url(page_number)}")
+        self.waits.wait_for_grid(driver, "initial_load")
+        return True
+
+    def next(self, driver, page_number):
+        driver.get(self.page_url(page_number))
+        self.waits.wait_for_grid(driver, "page_transition")
+        return True
+
+
+class GrowingListing(PaginationStrategy):
+    """
+    Une seule page qui grossit par lots: numéro de page = numéro du lot
+
+    `offset` vaut le nombre de produits présents avant le dernier lot: le
+    spider n'extrait que la fin de la grille. Le listing est terminé quand
+    un chargement ne fait plus grossir la grille pendant `idle` secondes.
+    """
+    paginated = False
+
+    def open(self, driver, page_number, prefix=""):
+        driver.get(self.start_url)
+        print(f"{prefix}📡 Navigation vers: {self.start_url}")
+        self.waits.wait_for_grid(driver, "initial_load")
+        self.offset = 0
+
+        # Reprise: on recharge les lots déjà écrits sans les extraire
+        for batch in range(2, page_number + 1):
+            if not self.next(driver, batch):
+                print(f"{prefix}⚠️ Impossible d'atteindre le lot {page_number}")
+                return False
+        return True
+
+    def next(self, driver, page_number):
+        count = self.waits.grid_state(driver)['count']
+        if not self.trigger(driver):
+            return False
+        if not self.waits.wait_for_more(driver, count, self.name, self.idle):
+            return False
+        self.offset = count
+        return True
+
+    def trigger(self, driver):
+        """Déclenche le chargement du lot suivant; False s'il n'y en a plus"""
+        raise NotImplementedError
+
+
+class InfiniteScrollPagination(GrowingListing):
+    """Défilement infini: le lot suivant se charge en bas de page"""
+    name = 'scroll'
+
+    def trigger(self, driver):
+        driver.execute_script(SCROLL_TO_BOTTOM_JS)
+        return True
+
+
+class LoadMorePagination(GrowingListing):
+    """Bouton "Load more" (masqué ou désactivé après le dernier lot)"""
+    name = 'more'
+    button = MORE_BUTTON
+
+    def trigger(self, driver):
+        return driver.execute_script(CLICK_BUTTON_JS, self.button, None) == 'clicked'
+
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (ButtonPagination, UrlParamPagination, InfiniteScrollPagination, LoadMorePagination)
+}
+
+# Stratégie par défaut de chaque variante du site de test
+VARIANT_STRATEGIES = {
+    'static': 'url',
+    'ajax': 'buttons',
+    'scroll': 'scroll',
+    'more': 'more',
+}
+
+
+def create_strategy(name, start_url, waits, idle=1.0):
+    """
+    Instancie une stratégie par son nom (buttons, url, scroll, more)
+
+    Raises:
+        ValueError: si la stratégie est inconnue
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Stratégie de pagination inconnue: {name} "
+                         f"(attendu: {', '.join(STRATEGIES)})")
+    return STRATEGIES[name](start_url, waits, idle)
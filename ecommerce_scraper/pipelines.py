@@ -6,8 +6,113 @@
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
+from pathlib import Path
+
+from ecommerce_scraper.items import normalize_item
+from ecommerce_scraper.sinks import SINKS, SinkWriter
 
 
 class EcommerceScraperPipeline:
+    """
+    Export des items vers plusieurs sorties à la fois (EXPORT_SINKS)
+
+    Les fichiers portent le nom du CSV du spider avec l'extension du sink
+    (laptops_progressive.csv, .jsonl, .sqlite); les instantanés Parquet/Arrow
+    sont partitionnés par date et catégorie (COLUMNAR_ROOT) et l'historique
+    des prix est une base partagée (HISTORY_DB). Chaque sink a son thread
+    d'écriture: process_item ne fait que mettre la ligne en file, sans
+    bloquer le reactor. Si la file d'un sink est pleine, process_item
+    renvoie un Deferred: Scrapy garde l'item en cours et ralentit le crawl
+    jusqu'à ce que le sink ait rattrapé son retard.
+
+    Le spider peut demander une barrière (barrier()): le Deferred renvoyé
+    est déclenché quand toutes les lignes déjà reçues sont validées par
+    tous les sinks (point de reprise du checkpoint).
+    """
+
+    def __init__(self, sinks=("csv",), batch_size=100, queue_size=10000, commit_interval=1.0, settings=None):
+        unknown = [name for name in sinks if name not in SINKS]
+        if unknown:
+            raise ValueError(f"Sinks inconnus: {', '.join(unknown)} (choix: {', '.join(SINKS)})")
+        self.sink_names = list(dict.fromkeys(sinks))
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.commit_interval = commit_interval
+        self.settings = settings
+        self.writers = []
+        self.stats = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        pipeline = cls(
+            sinks=crawler.settings.getlist('EXPORT_SINKS', ['csv']),
+            batch_size=crawler.settings.getint('EXPORT_BATCH_SIZE', 100),
+            queue_size=crawler.settings.getint('EXPORT_QUEUE_SIZE', 10000),
+            commit_interval=crawler.settings.getfloat('EXPORT_COMMIT_INTERVAL', 1.0),
+            settings=crawler.settings,
+        )
+        pipeline.stats = crawler.stats
+        return pipeline
+
+    def open_spider(self, spider):
+        base = Path(getattr(spider, 'csv_filename', None) or f"{spider.name}.csv")
+        resume_state = getattr(spider, 'resume_state', None)
+        resume_page = resume_state['last_page'] if resume_state else None
+        for name in self.sink_names:
+            sink = SINKS[name](SINKS[name].output_path(base, self.settings), self.settings, spider)
+            writer = SinkWriter(sink, self.batch_size, self.queue_size, self.commit_interval)
+            try:
+                writer.start(resume_page)
+            except Exception as e:
+                # Un sink indisponible (ex: pyarrow absent) n'empêche pas les autres
+                print(f"⚠️ Sink {name} désactivé: {type(e).__name__}: {str(e)[:100]}")
+                continue
+            self.writers.append(writer)
+            print(f"📤 Export {name}: {sink.path}")
+        spider.exporter = self
+
     def process_item(self, item, spider):
+        # Copie typée pour les sinks: l'item du spider garde ses textes
+        row = normalize_item(ItemAdapter(item).asdict())
+        if row['invalid'] and self.stats:
+            # Prix, avis ou note illisibles: comptés par champ
+            for field in row['invalid'].split('|'):
+                self.stats.inc_value(f"items/invalid/{field}")
+        waits = [wait for wait in (writer.put(row) for writer in self.writers) if wait is not None]
+        if hasattr(spider, 'item_exported'):
+            spider.item_exported(row)
+        if waits:
+            from twisted.internet import defer
+
+            # File pleine: l'item est rendu quand les sinks ont repris la ligne
+            return defer.gatherResults(waits).addCallback(lambda _: item)
         return item
+
+    def barrier(self):
+        """
+        Returns:
+            Deferred: déclenché (dans le thread du reactor) quand tous les
+            sinks ont validé les lignes reçues jusqu'ici
+        """
+        from twisted.internet import defer, reactor
+
+        waits = []
+        for writer in self.writers:
+            done = defer.Deferred()
+            writer.barrier(lambda done=done: reactor.callFromThread(done.callback, None))
+            waits.append(done)
+        return defer.gatherResults(waits)
+
+    def close_spider(self, spider):
+        for writer in self.writers:
+            writer.close()
+            stats = writer.stats
+            print(f"📤 Export {writer.sink.name}: {stats['rows']} lignes | écriture {stats['write_s']:.2f} s | "
+                  f"file pleine {stats['blocked_s']:.2f} s | erreurs {stats['errors']}")
+            if self.stats:
+                prefix = f"export/{writer.sink.name}"
+                self.stats.set_value(f"{prefix}/rows", stats['rows'])
+                self.stats.set_value(f"{prefix}/errors", stats['errors'])
+                self.stats.set_value(f"{prefix}/write_s", round(stats['write_s'], 2))
+                self.stats.set_value(f"{prefix}/blocked_s", round(stats['blocked_s'], 2))
+        self.writers = []
@@ -0,0 +1,97 @@
+# ecommerce_scraper/prefetch.py
+from selenium.common.exceptions import TimeoutException
+import time
+
+# Numéro de la page active dans la barre de pagination
+ACTIVE_PAGE_JS = """
+var active = document.querySelector('.pagination .active');
+return active ? active.textContent.trim() : null;
+"""
+
+
+class NextPagePrefetcher:
+    """
+    Préchargement spéculatif de la page N+1 dans un second onglet.
+
+    Deux onglets alternent: dès que le DOM de la page N a été lu dans
+    l'onglet courant, l'autre onglet clique sur le bouton de la page N+1.
+    Le chargement ajax et le rendu de N+1 se font pendant la capture de N,
+    l'écriture CSV et le checkpoint; on bascule ensuite sur l'onglet
+    préchargé au lieu de cliquer et d'attendre.
+    """
+
+    def __init__(self, driver, waits, click_page):
+        """
+        Args:
+            driver: Driver Chrome (une seule session pour les deux onglets)
+            waits: WaitPolicy du spider
+            click_page: click_page(page, driver) clique sur le bouton
+                numéroté sans attendre, False s'il n'existe pas
+        """
+        self.driver = driver
+        self.waits = waits
+        self.click_page = click_page
+        self.handles = [driver.current_window_handle]
+        self.current = 0
+        self.pending = None
+        self.stats = {'prefetched': 0, 'fallbacks': 0, 'past_end': 0, 'overlap_saved': 0.0}
+
+    def open_second_tab(self, open_listing, page_number):
+        """Ouvre l'onglet de préchargement sur la même page que l'onglet courant"""
+        self.driver.switch_to.new_window('tab')
+        self.handles.append(self.driver.current_window_handle)
+        ok = open_listing(self.driver, page_number, "[prefetch] ")
+        self.switch(self.current)
+        return ok
+
+    def switch(self, index):
+        self.driver.switch_to.window(self.handles[index])
+        self.driver.execute_cdp_cmd('Page.bringToFront', {})
+
+    def start(self, page_number):
+        """
+        Lance la navigation vers page_number dans l'autre onglet (non bloquant)
+
+        Returns:
+            bool: False si le bouton de la page n'est pas affiché (la page
+                suivante sera alors chargée sans préchargement)
+        """
+        other = 1 - self.current
+        self.switch(other)
+        previous = self.waits.grid_state(self.driver)
+        if self.click_page(page_number, self.driver):
+            self.pending = {'page': page_number, 'previous': previous, 'started': time.perf_counter()}
+        else:
+            self.pending = None
+            self.stats['fallbacks'] += 1
+        self.switch(self.current)
+        return self.pending is not None
+
+    def finish(self):
+        """
+        Bascule sur l'onglet préchargé et attend la fin de son chargement
+
+        Returns:
+            bool: False si la page préchargée n'existe pas (au-delà de la fin
+                de la pagination: grille inchangée ou autre page active)
+        """
+        pending, self.pending = self.pending, None
+        self.current = 1 - self.current
+        self.switch(self.current)
+
+        resumed = time.perf_counter()
+        try:
+            state = self.waits.wait_for_grid_change(self.driver, pending['previous'], "prefetch")
+        except TimeoutException:
+            self.stats['past_end'] += 1
+            return False
+        if self.driver.execute_script(ACTIVE_PAGE_JS) not in (None, str(pending['page'])):
+            self.stats['past_end'] += 1
+            return False
+
+        # Temps de chargement qui s'est déroulé pendant le traitement de la
+        # page précédente (la grille était prête il y a quiet_ms)
+        ready = time.perf_counter() - state['quiet_ms'] / 1000
+        self.stats['prefetched'] += 1
+        self.stats['overlap_saved'] += max(0.0, min(resumed, ready) - pending['started'])
+        return True
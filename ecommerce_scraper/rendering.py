@@ -0,0 +1,46 @@
+# ecommerce_scraper/rendering.py
+from twisted.internet.threads import deferToThreadPool
+from twisted.python.threadpool import ThreadPool
+from scrapy.utils.defer import maybe_deferred_to_future
+
+
+class BrowserThreads:
+    """
+    Pool de threads dédié au travail WebDriver.
+
+    Les appels Selenium sont bloquants: exécutés dans le callback, ils gèlent
+    le reactor de Scrapy (plus aucune requête, stat ni export pendant le
+    crawl). Ici chaque appel part dans un thread du pool et son résultat
+    revient au reactor via un Deferred (ou un await dans un callback async).
+
+    Avec un seul thread, tous les appels d'un même driver sont sérialisés
+    dans le même thread: un driver n'est jamais utilisé en parallèle.
+    """
+
+    def __init__(self, size=1, name="browser"):
+        self.pool = ThreadPool(minthreads=1, maxthreads=max(1, int(size)), name=name)
+        self.started = False
+
+    def run(self, func, *args, **kwargs):
+        """
+        Exécute func(*args, **kwargs) dans le pool
+
+        Returns:
+            Deferred: Résultat de func, renvoyé dans le thread du reactor
+        """
+        from twisted.internet import reactor
+
+        if not self.started:
+            self.pool.start()
+            self.started = True
+        return deferToThreadPool(reactor, self.pool, func, *args, **kwargs)
+
+    async def call(self, func, *args, **kwargs):
+        """Version awaitable de run() pour les callbacks async"""
+        return await maybe_deferred_to_future(self.run(func, *args, **kwargs))
+
+    def stop(self):
+        """Arrête les threads (les appels en cours se terminent d'abord)"""
+        if self.started:
+            self.pool.stop()
+            self.started = False
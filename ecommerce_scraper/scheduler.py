@@ -0,0 +1,220 @@
+# ecommerce_scraper/scheduler.py
+"""
+Ordonnanceur multi-catégories du catalogue du site de test
+
+Lance un crawl par couple (catégorie, variante) dans un seul processus
+Scrapy, en parallèle dans la limite d'un budget global de navigateurs
+(CATALOG_BROWSER_BUDGET). Les plus grosses catégories partent en premier
+pour que la plus longue ne termine pas seule à la fin. Chaque crawl écrit
+dans sa propre partition (<catégorie>[_<variante>]_progressive.csv, suffixe
+http_progressive pour laptops_http) et les débits par catégorie sont
+résumés dans catalog_stats.json.
+
+Usage:
+    python -m ecommerce_scraper.scheduler
+    python -m ecommerce_scraper.scheduler --variants static ajax --browsers 3
+    python -m ecommerce_scraper.scheduler --spider laptops_http --base-url http://127.0.0.1:8000/test-sites/e-commerce
+"""
+from pathlib import Path
+import argparse
+import json
+import time
+
+from ecommerce_scraper.catalog import CATEGORIES, VARIANTS, estimated_size, partition_name
+
+
+def build_jobs(categories, variants, output_dir='.', workers=1):
+    """
+    Liste des crawls à lancer, la plus grosse catégorie en premier
+
+    Args:
+        categories: Catégories du catalogue (ex: "computers/laptops")
+        variants: Variantes du site (static, ajax, scroll, more)
+        output_dir: Dossier des partitions (sert à estimer les tailles)
+        workers: Navigateurs utilisés par chaque crawl (poids dans le budget)
+
+    Returns:
+        list: dicts category, variant, partition, size, weight
+    """
+    jobs = [
+        {
+            'category': category,
+            'variant': variant,
+            'partition': partition_name(category, variant),
+            'size': estimated_size(category, variant, output_dir),
+            'weight': max(1, int(workers)),
+        }
+        for category in categories
+        for variant in variants
+    ]
+    return sorted(jobs, key=lambda job: job['size'], reverse=True)
+
+
+class CatalogScheduler:
+    """
+    Lance les crawls d'une liste de jobs sans dépasser le budget de navigateurs
+
+    Un job démarre dès que sa part du budget est libre; un job plus lourd
+    que le budget entier tourne seul plutôt que de bloquer la file.
+    """
+
+    def __init__(self, process, jobs, budget, spider, spider_args=None, output_dir='.'):
+        """
+        Args:
+            process: CrawlerProcess (ou CrawlerRunner) partagé par tous les crawls
+            jobs: Jobs triés par priorité (voir build_jobs)
+            budget: Nombre maximal de navigateurs ouverts en même temps
+            spider: Nom ou classe du spider à lancer pour chaque job
+            spider_args: Arguments communs passés aux spiders (max_pages...)
+            output_dir: Dossier des partitions et de catalog_stats.json
+        """
+        self.process = process
+        self.queue = list(jobs)
+        self.budget = max(1, int(budget))
+        self.spider = spider
+        self.spider_args = dict(spider_args or {})
+        self.output_dir = Path(output_dir)
+        self.used = 0
+        self.running = 0
+        self.results = []
+        self.done = None
+
+    def start(self):
+        """
+        Lance les premiers jobs
+
+        Returns:
+            Deferred: déclenché quand tous les crawls sont terminés
+        """
+        from twisted.internet import defer
+
+        self.done = defer.Deferred()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        print(f"🗓️ {len(self.queue)} crawl(s) à lancer, budget: {self.budget} navigateur(s)")
+        self.fill()
+        return self.done
+
+    def fill(self):
+        """Démarre les jobs en attente tant que le budget le permet"""
+        while self.queue:
+            job = self.queue[0]
+            if self.running and self.used + job['weight'] > self.budget:
+                break
+            self.queue.pop(0)
+            self.launch(job)
+        if not self.queue and not self.running and not self.done.called:
+            self.done.callback(self.results)
+
+    def launch(self, job):
+        crawler = self.process.create_crawler(self.spider)
+        self.used += job['weight']
+        self.running += 1
+        started = time.perf_counter()
+        print(f"▶️ {job['partition']}: {job['category']} ({job['variant']}), "
+              f"~{job['size']} produits, {job['weight']} navigateur(s)")
+
+        def finished(result):
+            self.used -= job['weight']
+            self.running -= 1
+            self.results.append(self.job_stats(job, crawler, time.perf_counter() - started, result))
+            self.fill()
+
+        deferred = self.process.crawl(
+            crawler,
+            category=job['category'],
+            variant=job['variant'],
+            output_dir=str(self.output_dir),
+            **self.spider_args,
+        )
+        deferred.addBoth(finished)
+
+    @staticmethod
+    def job_stats(job, crawler, elapsed, result):
+        """Débit d'un crawl terminé, lu dans les stats Scrapy du crawler"""
+        stats = crawler.stats.get_stats() if crawler.stats else {}
+        items = stats.get('item_scraped_count', 0)
+        pages = stats.get('pages/crawled', 0)
+        failure = getattr(result, 'getErrorMessage', None)
+        return {
+            'partition': job['partition'],
+            'category': job['category'],
+            'variant': job['variant'],
+            'items': items,
+            'pages': pages,
+            'elapsed_s': round(elapsed, 2),
+            'items_per_s': round(items / elapsed, 2) if elapsed else 0.0,
+            'pages_per_min': round(pages * 60 / elapsed, 1) if elapsed else 0.0,
+            'finish_reason': stats.get('finish_reason') or ('error' if failure else None),
+            'error': failure() if failure else None,
+        }
+
+    def report(self):
+        """Affiche le tableau des débits et l'écrit dans catalog_stats.json"""
+        print(f"\n{'='*70}")
+        print("📊 DÉBIT PAR CATÉGORIE")
+        print(f"{'partition':<22} {'items':>6} {'pages':>6} {'durée (s)':>10} {'items/s':>8} {'pages/min':>10}")
+        for result in sorted(self.results, key=lambda r: r['partition']):
+            print(f"{result['partition']:<22} {result['items']:>6} {result['pages']:>6} "
+                  f"{result['elapsed_s']:>10.1f} {result['items_per_s']:>8.1f} {result['pages_per_min']:>10.1f}")
+            if result['error']:
+                print(f"   ❌ {result['error'][:100]}")
+        path = self.output_dir / 'catalog_stats.json'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        print(f"💾 Stats: {path}")
+        print(f"{'='*70}\n")
+        return path
+
+
+def main():
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+    from scrapy.utils.reactor import install_reactor
+
+    parser = argparse.ArgumentParser(description="Crawl du catalogue par catégorie et variante")
+    parser.add_argument("--categories", nargs="+", default=list(CATEGORIES), help="Catégories à crawler")
+    parser.add_argument("--variants", nargs="+", default=['ajax'], choices=VARIANTS)
+    parser.add_argument("--spider", default='laptops', help="Spider lancé pour chaque job")
+    parser.add_argument("--browsers", type=int, default=None,
+                        help="Budget global de navigateurs (CATALOG_BROWSER_BUDGET)")
+    parser.add_argument("--workers", type=int, default=1, help="Navigateurs par crawl")
+    parser.add_argument("--base-url", default=None, help="Racine du site (ex: site local de benchmarks)")
+    parser.add_argument("--output-dir", default=None, help="Dossier des partitions (CATALOG_OUTPUT_DIR)")
+    parser.add_argument("--max-pages", type=int, default=None)
+    parser.add_argument("-s", "--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="Setting Scrapy à surcharger")
+    args = parser.parse_args()
+
+    settings = get_project_settings()
+    for override in args.set:
+        name, _, value = override.partition("=")
+        settings.set(name, value, priority='cmdline')
+    output_dir = args.output_dir or settings.get('CATALOG_OUTPUT_DIR', 'catalog_output')
+    budget = args.browsers or settings.getint('CATALOG_BROWSER_BUDGET', 2)
+
+    spider_args = {'workers': args.workers}
+    if args.base_url:
+        spider_args['base_url'] = args.base_url
+    if args.max_pages:
+        spider_args['max_pages'] = args.max_pages
+
+    # Reactor demandé par les settings (asyncio) installé avant tout import
+    # de twisted.internet.reactor, comme le fait `scrapy crawl`
+    install_reactor(settings['TWISTED_REACTOR'], settings['ASYNCIO_EVENT_LOOP'])
+    from twisted.internet import reactor
+
+    process = CrawlerProcess(settings)
+
+    jobs = build_jobs(args.categories, args.variants, output_dir, args.workers)
+    scheduler = CatalogScheduler(process, jobs, budget, args.spider, spider_args, output_dir)
+
+    def stop(_):
+        scheduler.report()
+        reactor.stop()
+
+    reactor.callWhenRunning(lambda: scheduler.start().addBoth(stop))
+    process.start(stop_after_crawl=False)
+
+
+if __name__ == "__main__":
+    main()
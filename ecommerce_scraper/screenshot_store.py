@@ -0,0 +1,173 @@
+# ecommerce_scraper/screenshot_store.py
+"""
+Stockage des captures par tuiles dédupliquées (adressées par contenu)
+
+Chaque capture est découpée en tuiles de taille fixe. Une tuile est
+identifiée par le hash de ses pixels et n'est écrite qu'une seule fois dans
+screenshot_store/tiles/, quel que soit le nombre de pages ou de runs qui la
+contiennent (en-tête, barre latérale, pagination...). Chaque page ne garde
+qu'un petit manifeste JSON qui permet de reconstruire l'image à la demande.
+
+Usage (conversion d'anciens dossiers de captures PNG):
+    python -m ecommerce_scraper.screenshot_store screenshots_20251202_110252 [--remove]
+"""
+from io import BytesIO
+from pathlib import Path
+import argparse
+import hashlib
+import json
+import os
+import threading
+
+MANIFEST_SUFFIX = '.json'
+
+
+class TileStore:
+    """Magasin de tuiles PNG partagé entre les pages et les runs"""
+
+    def __init__(self, root='screenshot_store', tile_size=256):
+        self.root = Path(root)
+        self.tiles_dir = self.root / 'tiles'
+        self.tile_size = int(tile_size)
+        self.tiles_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.stats = {'tiles': 0, 'new_tiles': 0, 'new_bytes': 0}
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(
+            root=settings.get('SCREENSHOT_STORE_DIR', 'screenshot_store'),
+            tile_size=settings.getint('SCREENSHOT_TILE_SIZE', 256),
+        )
+
+    def tile_path(self, digest):
+        return self.tiles_dir / digest[:2] / f"{digest}.png"
+
+    def put(self, image_bytes, manifest_path):
+        """
+        Découpe une image en tuiles, stocke les tuiles inconnues et écrit
+        le manifeste de la page
+
+        Args:
+            image_bytes: Image encodée (PNG, JPEG, WebP)
+            manifest_path: Chemin du manifeste à écrire (.json)
+
+        Returns:
+            int: Nombre d'octets réellement ajoutés au magasin
+        """
+        from PIL import Image
+
+        image = Image.open(BytesIO(image_bytes))
+        image.load()
+        width, height = image.size
+        size = self.tile_size
+
+        tiles = []
+        new_tiles = 0
+        new_bytes = 0
+        for top in range(0, height, size):
+            for left in range(0, width, size):
+                tile = image.crop((left, top, min(left + size, width), min(top + size, height)))
+                digest = hashlib.blake2b(
+                    f"{tile.mode}:{tile.size}".encode() + tile.tobytes(), digest_size=16
+                ).hexdigest()
+                tiles.append([left, top, digest])
+
+                path = self.tile_path(digest)
+                if path.exists():
+                    continue
+                path.parent.mkdir(exist_ok=True)
+                buffer = BytesIO()
+                tile.save(buffer, format='PNG', optimize=True)
+                # Écriture atomique: plusieurs threads peuvent stocker la même tuile
+                tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(buffer.getvalue())
+                os.replace(tmp_path, path)
+                new_tiles += 1
+                new_bytes += buffer.tell()
+
+        manifest = {
+            'store': os.path.relpath(self.root, Path(manifest_path).parent),
+            'width': width,
+            'height': height,
+            'mode': image.mode,
+            'tile_size': size,
+            'tiles': tiles,
+        }
+        manifest_text = json.dumps(manifest, separators=(',', ':'))
+        Path(manifest_path).write_text(manifest_text, encoding='utf-8')
+
+        with self.lock:
+            self.stats['tiles'] += len(tiles)
+            self.stats['new_tiles'] += new_tiles
+            self.stats['new_bytes'] += new_bytes
+        return new_bytes + len(manifest_text)
+
+
+def load_screenshot(path):
+    """
+    Ouvre une capture, qu'il s'agisse d'un fichier image classique ou d'un
+    manifeste de tuiles (reconstruit à la volée)
+
+    Returns:
+        PIL.Image.Image
+    """
+    from PIL import Image
+
+    path = Path(path)
+    if path.suffix != MANIFEST_SUFFIX:
+        return Image.open(path)
+
+    manifest = json.loads(path.read_text(encoding='utf-8'))
+    tiles_dir = (path.parent / manifest['store'] / 'tiles').resolve()
+    image = Image.new(manifest['mode'], (manifest['width'], manifest['height']))
+    for left, top, digest in manifest['tiles']:
+        with Image.open(tiles_dir / digest[:2] / f"{digest}.png") as tile:
+            image.paste(tile, (left, top))
+    return image
+
+
+def import_folder(folder, store, remove=False):
+    """
+    Convertit un dossier de captures PNG en manifestes + tuiles partagées
+
+    Returns:
+        tuple: (octets avant, octets ajoutés au magasin)
+    """
+    before = 0
+    added = 0
+    for image_path in sorted(Path(folder).glob("page_*.png")):
+        data = image_path.read_bytes()
+        before += len(data)
+        added += store.put(data, image_path.with_suffix(MANIFEST_SUFFIX))
+        if remove:
+            image_path.unlink()
+        print(f"   🧩 {image_path.name} -> {image_path.with_suffix(MANIFEST_SUFFIX).name}")
+    return before, added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conversion de captures vers le magasin de tuiles")
+    parser.add_argument("folders", nargs="+", help="Dossiers screenshots_YYYYMMDD_HHMMSS")
+    parser.add_argument("--store", default="screenshot_store")
+    parser.add_argument("--tile-size", type=int, default=256)
+    parser.add_argument("--remove", action="store_true", help="Supprimer les PNG après conversion")
+    args = parser.parse_args()
+
+    store = TileStore(args.store, args.tile_size)
+    total_before = 0
+    total_added = 0
+    for folder in args.folders:
+        print(f"📁 {folder}")
+        before, added = import_folder(folder, store, args.remove)
+        total_before += before
+        total_added += added
+
+    print(f"\n✅ {store.stats['tiles']} tuiles référencées, {store.stats['new_tiles']} uniques ajoutées")
+    if total_before:
+        print(f"💾 {total_before / 1024:.0f} Ko de PNG -> {total_added / 1024:.0f} Ko dans le magasin "
+              f"({total_added / total_before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
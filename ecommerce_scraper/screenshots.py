@@ -0,0 +1,199 @@
+# ecommerce_scraper/screenshots.py
+import base64
+import queue
+import threading
+import time
+
+# Formats acceptés par Page.captureScreenshot -> extension du fichier
+SCREENSHOT_EXTENSIONS = {
+    'png': 'png',
+    'jpeg': 'jpg',
+    'webp': 'webp',
+}
+
+
+def parse_clip(value):
+    """
+    Lit un rectangle de capture "x,y,largeur,hauteur" (pixels CSS)
+
+    Returns:
+        dict ou None: Rectangle au format DevTools
+    """
+    if not value:
+        return None
+    if isinstance(value, dict):
+        return value
+    x, y, width, height = (float(part) for part in str(value).split(','))
+    return {'x': x, 'y': y, 'width': width, 'height': height}
+
+
+def capture_screenshot(driver, image_format='png', quality=None, clip=None, full_page=True,
+                       decode=True):
+    """
+    Capture la page via le protocole DevTools (Page.captureScreenshot)
+
+    En mode page complète, la capture dépasse le viewport
+    (captureBeyondViewport): la fenêtre n'est jamais redimensionnée.
+
+    Args:
+        driver: Driver Chrome
+        image_format: "png", "jpeg" ou "webp"
+        quality: Qualité 0-100 (jpeg/webp uniquement)
+        clip: Rectangle {'x', 'y', 'width', 'height'} à capturer, sinon
+            tout le document (ou le viewport si full_page=False)
+        full_page: Capturer tout le document plutôt que la zone visible
+        decode: Décoder le base64 renvoyé par Chrome (sinon renvoyé tel quel)
+
+    Returns:
+        bytes (ou str base64 si decode=False): Image encodée
+    """
+    if image_format not in SCREENSHOT_EXTENSIONS:
+        raise ValueError(f"Format de capture inconnu: {image_format}")
+
+    params = {'format': image_format}
+    if quality is not None and image_format != 'png':
+        params['quality'] = int(quality)
+
+    if clip is None and full_page:
+        metrics = driver.execute_cdp_cmd('Page.getLayoutMetrics', {})
+        content = metrics.get('cssContentSize') or metrics['contentSize']
+        clip = {'x': 0, 'y': 0, 'width': content['width'], 'height': content['height']}
+
+    if clip is not None:
+        params['clip'] = dict(clip, scale=clip.get('scale', 1))
+        params['captureBeyondViewport'] = True
+
+    result = driver.execute_cdp_cmd('Page.captureScreenshot', params)
+    return base64.b64decode(result['data']) if decode else result['data']
+
+
+def reencode_image(data, image_format, quality=None):
+    """Réencode une image (Pillow est requis uniquement pour ce cas)"""
+    from io import BytesIO
+    from PIL import Image
+
+    output = BytesIO()
+    image = Image.open(BytesIO(data))
+    if image_format == 'jpeg' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    options = {'quality': int(quality)} if quality is not None and image_format != 'png' else {}
+    image.save(output, format=image_format.upper(), **options)
+    return output.getvalue()
+
+
+class ScreenshotWriter:
+    """
+    File d'écriture des captures hors du thread de crawl.
+
+    Le crawl ne fait que récupérer les octets du navigateur; le décodage,
+    l'éventuel réencodage et l'écriture disque sont faits par un petit pool
+    de threads. La file est bornée: quand elle est pleine, submit() bloque
+    (backpressure) au lieu d'accumuler les images en mémoire.
+    """
+
+    def __init__(self, threads=2, queue_size=8, store_format=None, quality=None, tile_store=None):
+        """
+        Args:
+            threads: Nombre de threads d'écriture
+            queue_size: Nombre maximal de captures en attente
+            store_format: Format final sur disque (None = format capturé)
+            quality: Qualité jpeg/webp en cas de réencodage
+            tile_store: TileStore optionnel; chaque capture devient alors un
+                manifeste JSON + des tuiles dédupliquées
+        """
+        self.store_format = store_format
+        self.quality = quality
+        self.tile_store = tile_store
+        self.queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self.lock = threading.Lock()
+        self.stats = {'written': 0, 'failed': 0, 'bytes': 0, 'write_time': 0.0, 'blocked_time': 0.0}
+        self.failed_files = []
+        self.threads = []
+        for index in range(max(1, int(threads))):
+            thread = threading.Thread(target=self._run, name=f"screenshot-writer-{index}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    @classmethod
+    def from_settings(cls, settings):
+        tile_store = None
+        if settings.get('SCREENSHOT_STORE', 'files') == 'tiles':
+            from ecommerce_scraper.screenshot_store import TileStore
+            tile_store = TileStore.from_settings(settings)
+        return cls(
+            threads=settings.getint('SCREENSHOT_WRITER_THREADS', 2),
+            queue_size=settings.getint('SCREENSHOT_QUEUE_SIZE', 8),
+            store_format=settings.get('SCREENSHOT_STORE_FORMAT'),
+            quality=settings.getint('SCREENSHOT_QUALITY', 80),
+            tile_store=tile_store,
+        )
+
+    def extension(self, capture_format):
+        """Extension du fichier final pour un format de capture donné"""
+        if self.tile_store:
+            return 'json'
+        return SCREENSHOT_EXTENSIONS[self.store_format or capture_format]
+
+    def submit(self, data, filepath, capture_format):
+        """
+        Confie une capture à la file d'écriture
+
+        Args:
+            data: Octets de l'image ou chaîne base64 (DevTools)
+            filepath: Chemin final du fichier (extension via extension())
+            capture_format: Format des octets fournis
+
+        Returns:
+            str: Valeur de la colonne screenshot (chemin final du fichier)
+        """
+        started = time.perf_counter()
+        self.queue.put((data, filepath, capture_format))
+        with self.lock:
+            self.stats['blocked_time'] += time.perf_counter() - started
+        return str(filepath)
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                self.queue.task_done()
+                return
+            data, filepath, capture_format = job
+            started = time.perf_counter()
+            try:
+                if isinstance(data, str):
+                    data = base64.b64decode(data)
+                if self.tile_store:
+                    # Seules les tuiles jamais vues sont écrites
+                    written = self.tile_store.put(data, filepath)
+                else:
+                    if self.store_format and self.store_format != capture_format:
+                        data = reencode_image(data, self.store_format, self.quality)
+                    with open(filepath, 'wb') as f:
+                        f.write(data)
+                    written = len(data)
+                with self.lock:
+                    self.stats['written'] += 1
+                    self.stats['bytes'] += written
+                    self.stats['write_time'] += time.perf_counter() - started
+                print(f"   💾 Capture écrite: {filepath.name} ({written / 1024:.1f} Ko)")
+            except Exception as e:
+                with self.lock:
+                    self.stats['failed'] += 1
+                    self.failed_files.append(str(filepath))
+                print(f"   ⚠️ Écriture de la capture {filepath} impossible: {str(e)[:100]}")
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        """Attend que toutes les captures en file soient écrites"""
+        self.queue.join()
+
+    def close(self):
+        """Vide la file puis arrête les threads d'écriture"""
+        self.flush()
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
@@ -26,6 +26,133 @@ ROBOTSTXT_OBEY = False
 CONCURRENT_REQUESTS_PER_DOMAIN = 1
 DOWNLOAD_DELAY = 2
 
+# Nombre de navigateurs Selenium qui se partagent la pagination
+# (surchargeable avec: scrapy crawl laptops -a workers=N)
+BROWSER_POOL_SIZE = 1
+
+# Mode économe en mémoire: un seul navigateur pilote K onglets qui se
+# partagent la pagination (utilisé quand BROWSER_POOL_SIZE = 1)
+# (surchargeable avec: scrapy crawl laptops -a tabs=K)
+BROWSER_TABS = 1
+
+# Pipeline: la page N+1 est demandée dans un second onglet dès que le DOM de
+# la page N est lu (navigation masquée par la capture et l'écriture CSV)
+# (surchargeable avec: scrapy crawl laptops -a prefetch=true)
+PREFETCH_NEXT_PAGE = False
+
+# Extraction Selenium: "js" (un execute_script par page) ou "legacy" (un appel par champ)
+# (surchargeable avec: scrapy crawl laptops -a extraction=legacy)
+SELENIUM_EXTRACTION = "js"
+
+# Attentes événementielles du navigateur (en secondes)
+WAIT_TIMEOUT = 20          # délai maximal d'une attente
+WAIT_POLL_INTERVAL = 0.05  # intervalle entre deux vérifications
+WAIT_QUIET_PERIOD = 0.1    # durée sans mutation DOM avant de valider un changement de grille
+
+# Throttle du navigateur (AutoThrottle ne voit pas le trafic Selenium): la
+# latence des transitions (chargement, page ajax, lot scroll/more) est
+# comparée à la cible; au-dessus, délai entre navigations augmenté et moins
+# de navigateurs du pool au travail, en dessous l'inverse; erreurs = backoff
+BROWSER_THROTTLE_ENABLED = True
+BROWSER_THROTTLE_TARGET_LATENCY = 1.0   # latence visée par transition (s)
+BROWSER_THROTTLE_MIN_DELAY = 0.0        # délai entre navigations (s)
+BROWSER_THROTTLE_MAX_DELAY = 10.0
+BROWSER_THROTTLE_STEP = 0.25            # pas d'augmentation du délai (s)
+BROWSER_THROTTLE_MIN_CONCURRENCY = 1    # navigateurs au travail au minimum
+BROWSER_THROTTLE_PATIENCE = 3           # transitions rapides avant d'en rajouter un
+
+# Stratégie de pagination: "buttons", "url" (?page=N), "scroll" (défilement
+# infini) ou "more" (bouton "Load more"); None = celle de la variante du site
+# (surchargeable avec: scrapy crawl laptops -a pagination=url)
+PAGINATION_STRATEGY = None
+# scroll/more: fin du listing quand la grille ne grossit plus pendant ce délai (s)
+PAGINATION_IDLE_TIMEOUT = 1.0
+
+# Captures d'écran (Page.captureScreenshot via DevTools, sans redimensionner la fenêtre)
+SCREENSHOT_TYPE = "full"     # "full" (document entier) ou "viewport" (zone visible)
+SCREENSHOT_FORMAT = "png"    # "png", "jpeg" ou "webp"
+SCREENSHOT_QUALITY = 80      # qualité jpeg/webp (0-100)
+SCREENSHOT_CLIP = None       # rectangle optionnel "x,y,largeur,hauteur"
+
+# Écriture des captures en arrière-plan (réencodage éventuel avec Pillow)
+SCREENSHOT_WRITER_THREADS = 2
+SCREENSHOT_QUEUE_SIZE = 8        # au-delà, le crawl attend (backpressure)
+SCREENSHOT_STORE_FORMAT = None   # format sur disque si différent de la capture
+
+# "files": une image par page | "tiles": manifeste JSON par page + tuiles
+# dédupliquées partagées entre pages et runs (SCREENSHOT_STORE_DIR)
+SCREENSHOT_STORE = "files"
+SCREENSHOT_STORE_DIR = "screenshot_store"
+SCREENSHOT_TILE_SIZE = 256
+
+# Nombre de relances du navigateur (et de nouvelles tentatives de la page en
+# échec) avant d'abandonner; reprise après crash: scrapy crawl laptops -a resume=true
+CRAWL_PAGE_RETRIES = 2
+
+# Écriture du CSV: "batch" (lots validés par un seul fsync quand CSV_BATCH_ROWS
+# lignes ou CSV_BATCH_INTERVAL secondes sont atteints, journal <csv>.journal
+# rejoué après un crash), "per-row" (fsync par ligne) ou "none" (sans fsync)
+CSV_DURABILITY = "batch"
+CSV_BATCH_ROWS = 50
+CSV_BATCH_INTERVAL = 1.0
+
+# Crawl incrémental: les pages dont l'empreinte (liens, prix, avis) n'a pas
+# changé depuis le dernier run sont reprises sans capture ni extraction
+INCREMENTAL_CRAWL = True
+
+# Profil du navigateur: "lean" (headless, sans services d'arrière-plan, requêtes
+# inutiles bloquées) ou "default" (fenêtre visible et maximisée, tout chargé)
+BROWSER_PROFILE = "lean"
+# Fenêtre masquée (True/False); None: déduit du profil (headless si "lean")
+BROWSER_HEADLESS = None
+# Catégories bloquées (images, fonts, media, analytics) et motifs supplémentaires;
+# images/polices sont débloquées automatiquement le temps d'une capture
+BROWSER_BLOCK = ["images", "fonts", "analytics"]
+BROWSER_BLOCK_PATTERNS = []
+# Liste d'autorisation du run: catégories ou motifs à ne pas bloquer
+# (ex: scrapy crawl laptops -s BROWSER_ALLOW=fonts)
+BROWSER_ALLOW = []
+
+# Démarrage à chaud (runs courts et fréquents):
+# - chemins de Chrome et chromedriver résolus une fois et gardés dans ce fichier
+# - profils persistants (cache HTTP chaud), un sous-dossier par navigateur
+# - le navigateur principal s'attache à un Chrome déjà lancé avec
+#   --remote-debugging-port (ex: "127.0.0.1:9222"), ou à un démon Chrome
+#   lancé au premier run et gardé ensuite
+#   (python -m ecommerce_scraper.browser_daemon start|status|stop)
+BROWSER_PATH_CACHE = ".browser_paths.json"
+BROWSER_PROFILE_DIR = None
+BROWSER_DEBUGGER_ADDRESS = None
+BROWSER_DAEMON = False
+BROWSER_DAEMON_PORT = 9222
+BROWSER_DAEMON_STATE = "browser_daemon.json"
+
+# Ordonnanceur multi-catégories (python -m ecommerce_scraper.scheduler):
+# navigateurs ouverts en même temps pour l'ensemble des crawls, et dossier
+# des partitions CSV (une par catégorie/variante) et de catalog_stats.json
+CATALOG_BROWSER_BUDGET = 2
+CATALOG_OUTPUT_DIR = "catalog_output"
+
+# Enrichissement par les pages produit (colonne link): titre complet, options
+# et avis fusionnés dans les items pendant que la pagination continue; les
+# produits inchangés depuis le dernier run sont repris du cache
+# (<partition>_progressive.details.json) sans requête. Désactivé par défaut:
+# une requête de plus par produit. Le spider Selenium limite le crawl à une
+# requête à la fois (un seul navigateur): relever la limite globale avec
+#   scrapy crawl laptops -s ENRICH_DETAILS=true -s CONCURRENT_REQUESTS=16
+ENRICH_DETAILS = False
+ENRICH_CACHE = True
+# Délai du slot "details" ajusté sur la latence (comme AutoThrottle):
+# requêtes en vol visées et bornes du délai (s)
+ENRICH_TARGET_CONCURRENCY = 4.0
+ENRICH_MIN_DELAY = 0.0
+ENRICH_MAX_DELAY = 5.0
+# Concurrence et délai initial du slot des pages produit (le listing garde
+# CONCURRENT_REQUESTS_PER_DOMAIN et DOWNLOAD_DELAY)
+DOWNLOAD_SLOTS = {
+    "details": {"concurrency": 8, "delay": 0.25},
+}
+
 # Disable cookies (enabled by default)
 #COOKIES_ENABLED = False
 
@@ -40,9 +167,9 @@ DOWNLOAD_DELAY = 2
 
 # Enable or disable spider middlewares
 # See https://docs.scrapy.org/en/latest/topics/spider-middleware.html
-#SPIDER_MIDDLEWARES = {
-#    "ecommerce_scraper.middlewares.EcommerceScraperSpiderMiddleware": 543,
-#}
+SPIDER_MIDDLEWARES = {
+    "ecommerce_scraper.middlewares.DetailEnrichmentMiddleware": 543,
+}
 
 # Enable or disable downloader middlewares
 # See https://docs.scrapy.org/en/latest/topics/downloader-middleware.html
@@ -58,9 +185,27 @@ DOWNLOAD_DELAY = 2
 
 # Configure item pipelines
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
-#ITEM_PIPELINES = {
-#    "ecommerce_scraper.pipelines.EcommerceScraperPipeline": 300,
-#}
+ITEM_PIPELINES = {
+    "ecommerce_scraper.pipelines.EcommerceScraperPipeline": 300,
+}
+
+# Sorties du pipeline, écrites en parallèle (un thread et une file par sink),
+# nommées comme le CSV du spider: "csv", "jsonl", "sqlite", instantanés typés
+# "parquet" / "arrow" (pyarrow, COLUMNAR_ROOT) et "history": historique des
+# prix partagé par tous les runs (HISTORY_DB)
+# (ex: scrapy crawl laptops -s EXPORT_SINKS=csv,jsonl,sqlite)
+EXPORT_SINKS = ["csv", "history"]
+EXPORT_BATCH_SIZE = 100         # lignes au plus par écriture d'un sink
+EXPORT_QUEUE_SIZE = 10000       # lignes en attente avant de ralentir le crawl
+EXPORT_COMMIT_INTERVAL = 1.0    # délai maximal entre deux validations (s)
+# Base de l'historique des prix (python -m ecommerce_scraper.history changes);
+# None = price_history.sqlite à côté du CSV
+HISTORY_DB = None
+# Instantanés Parquet/Arrow: <racine>/run_date=.../category=.../<csv>-HHMMSS.parquet
+# (conversion des CSV existants: python -m ecommerce_scraper.columnar laptops.csv)
+COLUMNAR_ROOT = None             # None = dossier columnar/ à côté du CSV
+COLUMNAR_ROW_GROUP_ROWS = 10000  # lignes tamponnées par row group (mémoire constante)
+COLUMNAR_COMPRESSION = "zstd"    # "zstd", "snappy", "none"...
 
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
@@ -88,12 +233,10 @@ FEED_EXPORT_ENCODING = "utf-8"
 # Désactiver l'obéissance au robots.txt (c'est un site de test, c'est OK)
 ROBOTSTXT_OBEY = False
 
-# Configuration Selenium (obligatoire)
-SELENIUM_DRIVER_NAME = 'chrome'
-SELENIUM_DRIVER_EXECUTABLE_PATH = None  # webdriver-manager gère tout seul
-SELENIUM_DRIVER_ARGUMENTS = ['--headless', '--no-sandbox', '--disable-dev-shm-usage']
+# Rendu Chrome des requêtes meta={'selenium': True}, hors du thread du reactor
+# (un navigateur par thread, distinct de celui de la pagination)
+SELENIUM_RENDER_THREADS = 1
 
-# Activer le middleware (priorité 800)
 DOWNLOADER_MIDDLEWARES = {
-    'scrapy_selenium.SeleniumMiddleware': 800
-}
\ No newline at end of file
+    'ecommerce_scraper.middlewares.SeleniumRenderMiddleware': 800
+}
@@ -0,0 +1,506 @@
+# ecommerce_scraper/sinks.py
+"""
+Sorties du pipeline d'export (EcommerceScraperPipeline)
+
+Chaque sink écrit les items dans un backend: CSV, JSON Lines, SQLite,
+Parquet/Arrow typé (columnar) ou l'historique des prix (history). Le
+pipeline en ouvre plusieurs à la fois (EXPORT_SINKS) et confie chacun à
+un SinkWriter: un thread et une file tamponnée par sink, pour que le
+spider ne touche jamais aux fichiers et qu'un sink lent ne bloque ni le
+crawl ni les autres sinks.
+
+Un sink reçoit des lots de lignes (write), les valide (commit: point de
+reprise durable) et, en cas de reprise, ne garde que les lignes des pages
+déjà terminées (open(resume_page=N)).
+"""
+from collections import deque
+from pathlib import Path
+import csv
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from ecommerce_scraper.columnar import ColumnarWriter, latest_snapshot, read_batches, snapshot_path
+from ecommerce_scraper.csv_writer import DurableCsvWriter
+from ecommerce_scraper.extraction import CSV_FIELDS, DETAIL_FIELDS
+from ecommerce_scraper.history import PriceHistory
+from ecommerce_scraper.items import format_price
+
+# Colonnes des sinks tabulaires (SQLite, Parquet, Arrow): grille + pages produit
+EXPORT_FIELDS = CSV_FIELDS + DETAIL_FIELDS
+
+
+def text_value(value):
+    """Valeur d'une sortie texte (CSV, colonnes TEXT): 299.0 -> '299', None -> None"""
+    if isinstance(value, float):
+        return format_price(value)
+    return None if value is None else str(value)
+
+
+def row_page(row):
+    """Numéro de page d'une ligne (0 si absent ou illisible)"""
+    try:
+        return int(row.get('page') or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class Sink:
+    """Interface commune des sorties du pipeline"""
+    name = None
+    # Extension du fichier, ajoutée au nom du CSV du spider
+    suffix = None
+
+    def __init__(self, path, settings=None, spider=None):
+        """
+        Args:
+            path: Fichier de sortie
+            settings: Settings Scrapy (options propres au sink)
+            spider: Spider exporté (nom, partition)
+        """
+        self.path = Path(path)
+        self.settings = settings
+        self.spider = spider
+
+    @classmethod
+    def output_path(cls, base, settings=None):
+        """Fichier du sink pour le CSV `base` du spider"""
+        return base.with_suffix(cls.suffix)
+
+    def open(self, resume_page=None):
+        """
+        Ouvre la sortie (recréée), ou la rouvre en gardant les pages
+        1..resume_page si le crawl reprend après un checkpoint
+        """
+        raise NotImplementedError
+
+    def write(self, rows):
+        """Écrit un lot de lignes (dicts)"""
+        raise NotImplementedError
+
+    def commit(self):
+        """Rend durable tout ce qui a été écrit"""
+
+    def sync(self):
+        """
+        Barrière du pipeline (point de reprise): tout ce qui a été reçu doit
+        être durable, y compris ce que le sink garde en tampon
+        """
+        self.commit()
+
+    def close(self):
+        self.commit()
+
+
+class CsvSink(Sink):
+    """CSV historique (colonnes CSV_FIELDS), validé par lots (CSV_DURABILITY)"""
+    name = 'csv'
+    suffix = '.csv'
+
+    def open(self, resume_page=None):
+        kept = []
+        if resume_page is not None and self.path.exists():
+            # Rejoue le journal d'un lot non validé avant de relire le CSV
+            DurableCsvWriter(self.path, CSV_FIELDS, append=True).close()
+            with open(self.path, encoding='utf-8', newline='') as f:
+                kept = [row for row in csv.DictReader(f) if row_page(row) <= resume_page]
+        self.writer = DurableCsvWriter(self.path, CSV_FIELDS)
+        if self.settings is not None:
+            self.writer.configure(
+                self.settings.get('CSV_DURABILITY', 'batch'),
+                self.settings.getint('CSV_BATCH_ROWS', 50),
+                self.settings.getfloat('CSV_BATCH_INTERVAL', 1.0),
+            )
+        if kept:
+            self.write(kept)
+            self.commit()
+
+    def write(self, rows):
+        for row in rows:
+            if isinstance(row.get('price'), float):
+                row = dict(row, price=format_price(row['price']))
+            self.writer.writerow(row)
+
+    def commit(self):
+        self.writer.commit()
+
+    def close(self):
+        self.writer.close()
+
+
+class JsonLinesSink(Sink):
+    """Un objet JSON par ligne, item complet (champs des pages produit compris)"""
+    name = 'jsonl'
+    suffix = '.jsonl'
+
+    def open(self, resume_page=None):
+        kept = []
+        if resume_page is not None and self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        # Dernière ligne tronquée par le crash
+                        continue
+                    if row_page(row) <= resume_page:
+                        kept.append(row)
+        self.file = open(self.path, 'w', encoding='utf-8')
+        if kept:
+            self.write(kept)
+            self.commit()
+
+    def write(self, rows):
+        self.file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+    def commit(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.commit()
+        self.file.close()
+
+
+class SqliteSink(Sink):
+    """Table `items` (une ligne par item du run), une transaction par lot"""
+    name = 'sqlite'
+    suffix = '.sqlite'
+
+    def open(self, resume_page=None):
+        # Connexion créée dans le thread du SinkWriter, seul à l'utiliser
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        columns = ", ".join(f'"{field}" TEXT' for field in EXPORT_FIELDS)
+        self.connection.execute(f"CREATE TABLE IF NOT EXISTS items ({columns})")
+        if resume_page is None:
+            self.connection.execute("DELETE FROM items")
+        else:
+            self.connection.execute("DELETE FROM items WHERE CAST(page AS INTEGER) > ?", (resume_page,))
+        self.connection.commit()
+
+    def write(self, rows):
+        placeholders = ", ".join("?" for _ in EXPORT_FIELDS)
+        self.connection.executemany(
+            f"INSERT INTO items VALUES ({placeholders})",
+            [tuple(text_value(row.get(field)) for field in EXPORT_FIELDS) for row in rows],
+        )
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+
+class ParquetSink(Sink):
+    """
+    Instantané typé du run (columnar.ColumnarWriter, colonnes EXPORT_FIELDS)
+
+    Rangé sous COLUMNAR_ROOT/run_date=.../category=<partition>/ et écrit
+    en flux par row groups de COLUMNAR_ROW_GROUP_ROWS lignes: un row group
+    incomplet n'est écrit qu'à la fermeture (commit ne fait rien).
+
+    Nécessite pyarrow (pip install pyarrow). Un fichier Parquet ne se
+    complète pas: à la reprise, le dernier instantané de la partition est
+    réécrit (pages gardées) sous le même nom.
+    """
+    name = 'parquet'
+    suffix = '.parquet'
+    file_format = 'parquet'
+
+    def __init__(self, path, settings=None, spider=None):
+        super().__init__(path, settings, spider)
+        # `path` est la racine du jeu de données; le fichier dépend du spider
+        self.root = self.path
+        spider_name = getattr(spider, 'name', None) or 'export'
+        self.dataset = Path(getattr(spider, 'csv_filename', None) or spider_name).stem
+        self.category = getattr(spider, 'slug', None) or spider_name
+        self.path = snapshot_path(self.root, self.dataset, self.category, file_format=self.file_format)
+
+    @classmethod
+    def output_path(cls, base, settings=None):
+        root = settings.get('COLUMNAR_ROOT') if settings is not None else None
+        return Path(root) if root else base.parent / 'columnar'
+
+    def open(self, resume_page=None):
+        previous = None
+        if resume_page is not None:
+            latest = latest_snapshot(self.root, self.dataset, self.category, self.file_format)
+            if latest is not None:
+                self.path = latest
+                previous = latest.with_name(latest.name + '.resume')
+                latest.replace(previous)
+        self.writer = ColumnarWriter(
+            self.path, EXPORT_FIELDS, self.file_format,
+            self.settings.getint('COLUMNAR_ROW_GROUP_ROWS', 10000) if self.settings is not None else 10000,
+            self.settings.get('COLUMNAR_COMPRESSION', 'zstd') if self.settings is not None else 'zstd',
+        )
+        if previous is not None:
+            try:
+                for rows in read_batches(previous, self.file_format):
+                    self.writer.write_rows(row for row in rows if row_page(row) <= resume_page)
+            except Exception as e:
+                print(f"⚠️ Instantané illisible ({previous.name}), pages non reprises: {str(e)[:80]}")
+            previous.unlink()
+
+    def write(self, rows):
+        self.writer.write_rows(rows)
+
+    def close(self):
+        self.writer.close()
+
+
+class ArrowSink(ParquetSink):
+    """Même instantané en flux Arrow IPC (.arrows), lisible sans décodage"""
+    name = 'arrow'
+    suffix = '.arrows'
+    file_format = 'arrow'
+
+
+class HistorySink(Sink):
+    """
+    Historique des prix (history.PriceHistory): une base partagée par tous
+    les runs et toutes les partitions au lieu d'un fichier écrasé par run
+
+    Les lots du SinkWriter coupent les pages: les lignes sont gardées par
+    page et chaque page est enregistrée en une seule transaction, quand
+    elle est complète: à la barrière qui suit la page (crawl Selenium), ou
+    au commit périodique si elle n'a reçu aucune ligne depuis le précédent
+    (pages HTTP arrivées dans le désordre).
+    """
+    name = 'history'
+    suffix = '.sqlite'
+
+    @classmethod
+    def output_path(cls, base, settings=None):
+        path = settings.get('HISTORY_DB') if settings is not None else None
+        return Path(path) if path else base.parent / 'price_history.sqlite'
+
+    def open(self, resume_page=None):
+        self.history = PriceHistory(self.path)
+        spider_name = getattr(self.spider, 'name', None) or 'unknown'
+        # Une partition par extracteur (history_partition du spider): le
+        # spider HTTP ne se compare pas au crawl Selenium
+        partition = (getattr(self.spider, 'history_partition', None)
+                     or getattr(self.spider, 'slug', None) or spider_name)
+        self.run_id = self.history.start_run(spider_name, partition, resume_page)
+        # page -> lignes pas encore enregistrées; pages reçues depuis le dernier commit
+        self.pages = {}
+        self.touched = set()
+
+    def write(self, rows):
+        for row in rows:
+            page = row.get('page')
+            self.pages.setdefault(page, []).append(row)
+            self.touched.add(page)
+
+    def record_pages(self, pages):
+        for page in pages:
+            self.history.record(self.run_id, self.pages.pop(page))
+
+    def commit(self):
+        # Une page encore alimentée depuis le dernier commit peut être incomplète
+        self.record_pages([page for page in self.pages if page not in self.touched])
+        self.touched = set()
+
+    def sync(self):
+        self.record_pages(list(self.pages))
+        self.touched = set()
+
+    def close(self):
+        self.sync()
+        # Crawl interrompu avec un checkpoint: le run reste ouvert pour la reprise
+        checkpoint = getattr(self.spider, 'checkpoint', None)
+        if checkpoint is None or not checkpoint.path.exists():
+            self.history.finish_run(self.run_id)
+        self.history.close()
+
+
+SINKS = {sink.name: sink for sink in (CsvSink, JsonLinesSink, SqliteSink, ParquetSink, ArrowSink, HistorySink)}
+
+_CLOSE = object()
+
+
+class SinkWriter:
+    """
+    Thread d'écriture d'un sink, alimenté par une file tamponnée
+
+    Les lignes en file sont écrites par lots (tout ce qui attend, jusqu'à
+    `batch_size`), validées toutes les `commit_interval` secondes et à
+    chaque barrière. Une erreur du sink est comptée et affichée, sans
+    arrêter le thread: les autres sinks et le crawl continuent.
+
+    put() et barrier() sont appelés depuis le thread du reactor et ne
+    bloquent jamais: quand la file est pleine, les entrées attendent dans
+    un tampon (dans l'ordre) et put() renvoie un Deferred déclenché quand
+    la file les a toutes reprises (contre-pression sur le pipeline).
+    """
+
+    def __init__(self, sink, batch_size=100, queue_size=10000, commit_interval=1.0, notify=None):
+        """
+        Args:
+            sink: Sink déjà construit (ouvert dans le thread)
+            batch_size: Lignes au plus par appel à sink.write
+            queue_size: Lignes en file au-delà desquelles put() renvoie un
+                Deferred (un sink très en retard ralentit le crawl au lieu
+                de remplir la mémoire)
+            commit_interval: Délai maximal entre deux commits (s)
+            notify: notify(fonction) exécute la fonction dans le thread du
+                reactor (défaut: reactor.callFromThread)
+        """
+        self.sink = sink
+        self.batch_size = max(1, int(batch_size))
+        self.commit_interval = commit_interval
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.notify = notify
+        # Entrées refusées par la file pleine (thread du reactor seulement)
+        self.overflow = deque()
+        self.waiting = None
+        self.blocked_since = None
+        # Levé par le reactor quand le tampon attend de la place
+        self.wake = False
+        self.rows = 0
+        self.errors = 0
+        self.write_time = 0.0
+        self.blocked_time = 0.0
+        self.thread = None
+        self.opened = threading.Event()
+        self.open_error = None
+
+    def start(self, resume_page=None):
+        self.thread = threading.Thread(
+            target=self.run, args=(resume_page,), name=f"sink-{self.sink.name}", daemon=True
+        )
+        self.thread.start()
+        self.opened.wait()
+        if self.open_error:
+            raise self.open_error
+
+    def put(self, row):
+        """
+        Met une ligne en file sans bloquer
+
+        Returns:
+            Deferred ou None: None si la ligne est en file, sinon un Deferred
+            déclenché quand la file a repris toutes les entrées en attente
+        """
+        return self.enqueue(row)
+
+    def barrier(self, callback):
+        """callback() est appelé (dans le thread du sink) quand tout ce qui précède est validé"""
+        self.enqueue(callback)
+
+    def enqueue(self, entry):
+        if not self.overflow:
+            try:
+                self.queue.put_nowait(entry)
+                return None
+            except queue.Full:
+                pass
+        self.overflow.append(entry)
+        if self.waiting is None:
+            from twisted.internet import defer
+
+            self.waiting = defer.Deferred()
+            self.blocked_since = time.perf_counter()
+            self.wake = True
+        return self.waiting
+
+    def drain(self):
+        """Reporte le tampon dans la file (thread du reactor, réveillé par le thread du sink)"""
+        while self.overflow:
+            try:
+                self.queue.put_nowait(self.overflow[0])
+            except queue.Full:
+                self.wake = True
+                return
+            self.overflow.popleft()
+        if self.waiting is not None:
+            self.blocked_time += time.perf_counter() - self.blocked_since
+            waiting, self.waiting = self.waiting, None
+            waiting.callback(None)
+
+    def request_drain(self):
+        """Appelé par le thread du sink après avoir libéré de la place dans la file"""
+        self.wake = False
+        notify = self.notify
+        if notify is None:
+            from twisted.internet import reactor
+
+            notify = reactor.callFromThread
+        notify(self.drain)
+
+    def close(self):
+        if self.thread:
+            # Fin du crawl: le tampon peut attendre le thread du sink
+            while self.overflow:
+                self.queue.put(self.overflow.popleft())
+            self.queue.put(_CLOSE)
+            self.thread.join()
+        if self.waiting is not None:
+            self.blocked_time += time.perf_counter() - self.blocked_since
+            waiting, self.waiting = self.waiting, None
+            waiting.callback(None)
+
+    def run(self, resume_page):
+        try:
+            self.sink.open(resume_page)
+        except Exception as e:
+            self.open_error = e
+            return
+        finally:
+            self.opened.set()
+
+        last_commit = time.perf_counter()
+        while True:
+            try:
+                entry = self.queue.get(timeout=self.commit_interval)
+            except queue.Empty:
+                entry = None
+            batch = []
+            while entry is not None and entry is not _CLOSE and not callable(entry):
+                batch.append(entry)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    entry = self.queue.get_nowait()
+                except queue.Empty:
+                    entry = None
+            if self.wake:
+                # Un lot vient d'être retiré de la file: le tampon peut y entrer
+                self.request_drain()
+            if batch:
+                self.guard(self.sink.write, batch)
+                self.rows += len(batch)
+            if entry is _CLOSE:
+                self.guard(self.sink.close)
+                return
+            if callable(entry):
+                self.guard(self.sink.sync)
+                last_commit = time.perf_counter()
+            elif time.perf_counter() - last_commit >= self.commit_interval:
+                self.guard(self.sink.commit)
+                last_commit = time.perf_counter()
+            if callable(entry):
+                entry()
+
+    def guard(self, method, *args):
+        started = time.perf_counter()
+        try:
+            method(*args)
+        except Exception as e:
+            self.errors += 1
+            print(f"   ⚠️ Sink {self.sink.name}: {type(e).__name__}: {str(e)[:100]}")
+        finally:
+            self.write_time += time.perf_counter() - started
+
+    @property
+    def stats(self):
+        return {
+            'rows': self.rows,
+            'errors': self.errors,
+            'write_s': self.write_time,
+            'blocked_s': self.blocked_time,
+        }
@@ -1,20 +1,72 @@
 # ecommerce_scraper/spiders/laptops.py
 import scrapy
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from twisted.internet import defer, threads
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
-import csv
+import itertools
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
+from ecommerce_scraper.browser import (
+    apply_request_blocking, browser_options_from_settings, close_driver, create_driver,
+    render_patterns, resolve_browser_paths
+)
+from ecommerce_scraper.browser_daemon import BrowserDaemon
+from ecommerce_scraper.browser_pool import BrowserPool
+from ecommerce_scraper.catalog import BASE_URL, listing_url, partition_name
+from ecommerce_scraper.checkpoint import Checkpoint
+from ecommerce_scraper.extraction import (
+    EXTRACT_PRODUCTS_JS, build_item, parse_products_js
+)
+from ecommerce_scraper.fingerprints import PageFingerprints, page_fingerprint
+from ecommerce_scraper.pagination import PaginationPlan
+from ecommerce_scraper.pagination_strategies import VARIANT_STRATEGIES, create_strategy
+from ecommerce_scraper.prefetch import NextPagePrefetcher
+from ecommerce_scraper.rendering import BrowserThreads
+from ecommerce_scraper.tab_pool import TabPool
+from ecommerce_scraper.throttle import BrowserThrottle
+from ecommerce_scraper.screenshots import ScreenshotWriter, capture_screenshot, parse_clip
+from ecommerce_scraper.waits import WaitPolicy
+
+# Plafond utilisé seulement si le widget de pagination est illisible
+DEFAULT_MAX_PAGES = 20
+
+
+def next_page(pages):
+    """
+    Page suivante d'un générateur de crawl (appelé dans le thread navigateur)
+    
+    Returns:
+        tuple: ((page, items), None), ou (None, fin du listing atteinte) une
+        fois le générateur épuisé (sa valeur de retour)
+    """
+    try:
+        return next(pages), None
+    except StopIteration as done:
+        return None, bool(done.value)
+
+
 class LaptopsSpider(scrapy.Spider):
+    """
+    Crawl Selenium d'un listing du site de test (par défaut les laptops ajax)
+
+    Toute catégorie et toute variante du catalogue peuvent être crawlées
+    avec la même logique:
+
+        scrapy crawl laptops -a category=computers/tablets -a variant=static
+    """
     name = 'laptops'
+    category = "computers/laptops"
+    variant = "ajax"
+    start_url = None
+    # Suffixe du CSV de sortie: <partition>_<output_suffix>.csv
+    output_suffix = "progressive"
+    # Crawl page par page repris par checkpoint, pages inchangées sautées
+    # grâce aux empreintes (les variantes HTTP n'en ont pas l'usage)
+    resumable = True
     
     custom_settings = {
         'DOWNLOAD_DELAY': 2,
@@ -25,74 +77,238 @@ class LaptopsSpider(scrapy.Spider):
         'FEEDS': {}
     }
     
-    def __init__(self):
-        print("🚀 Initialisation du spider avec Selenium...")
+    def __init__(self, workers=None, max_pages=None, start_url=None, extraction=None,
+                 resume=False, tabs=None, prefetch=None, category=None, variant=None,
+                 base_url=None, output_dir=None, pagination=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.needs_browser():
+            print("🚀 Initialisation du spider avec Selenium...")
         
-        # ⭐ Créer le dossier pour les captures d'écran
-        self.screenshots_dir = self.create_screenshots_folder()
+        # Nombre de navigateurs en parallèle (argument -a workers=N ou setting BROWSER_POOL_SIZE)
+        self.workers = int(workers) if workers else None
+        # Nombre de pages lu dans la pagination (max_pages = simple plafond)
+        self.max_pages = int(max_pages) if max_pages else None
+        self.plan = None
+        self.last_page = None
+        # Catégorie et variante du site (static, ajax, scroll, more)
+        self.category = category or self.category
+        self.variant = variant or self.variant
+        self.base_url = base_url or BASE_URL
+        self.start_url = start_url or self.start_url or listing_url(
+            self.category, self.variant, self.base_url
+        )
+        self.slug = partition_name(self.category, self.variant)
+        # Partition de l'historique des prix (une par extracteur)
+        self.history_partition = self.slug
+        # Stratégie de pagination (-a pagination=buttons|url|scroll|more,
+        # par défaut celle de la variante), créée dans from_crawler
+        self.pagination_name = pagination
+        self.pagination = None
+        self.output_dir = Path(output_dir or '.')
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.pool = None
         
-        # Initialiser le fichier CSV
-        self.csv_filename = 'laptops_progressive.csv'
-        self.csv_file = None
-        self.csv_writer = None
-        self.init_csv()
+        # Onglets d'un même navigateur (-a tabs=K ou setting BROWSER_TABS)
+        self.tabs = int(tabs) if tabs else None
+        self.tab_pool = None
         
-        # Configuration Chrome
-        chrome_options = Options()
+        # Préchargement de la page suivante dans un second onglet
+        # (-a prefetch=true ou setting PREFETCH_NEXT_PAGE)
+        self.prefetch = None if prefetch is None else str(prefetch).lower() in ('1', 'true', 'yes', 'oui')
+        self.prefetcher = None
         
-        chrome_paths = [
-            r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-            r"C:\Users\MARCOM\AppData\Local\Google\Chrome\Application\chrome.exe",
-        ]
+        # Extraction "js" (un seul execute_script par page) ou "legacy" (par champ)
+        self.extraction = extraction
+        self.extraction_timings = []
         
-        chrome_binary = None
-        for path in chrome_paths:
-            if os.path.exists(path):
-                chrome_binary = path
-                print(f"✅ Chrome trouvé à: {path}")
-                break
+        # Mesures et stats Scrapy écrites depuis les workers du pool
+        self.state_lock = threading.Lock()
         
-        if chrome_binary:
-            chrome_options.binary_location = chrome_binary
-        else:
-            print("⚠️ Chrome non trouvé aux emplacements standards")
-            print("💡 Veuillez installer Chrome ou spécifier le chemin manuellement")
+        # Attentes événementielles (remplacées par la config WAIT_* dans from_crawler)
+        self.waits = WaitPolicy()
+        # Régulation du navigateur sur la latence mesurée (BROWSER_THROTTLE_*)
+        self.throttle = BrowserThrottle()
         
-        # chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Point de reprise (-a resume=true repart après la dernière page terminée)
+        self.csv_filename = str(self.output_dir / f"{self.slug}_{self.output_suffix}.csv")
+        self.checkpoint = None
+        self.resume_state = None
+        if self.resumable:
+            self.checkpoint = Checkpoint(Path(self.csv_filename).with_suffix('.checkpoint.json'))
+            if str(resume).lower() in ('1', 'true', 'yes', 'oui'):
+                self.resume_state = self.checkpoint.load()
+                if self.resume_state is None:
+                    print("ℹ️ Aucun checkpoint trouvé: démarrage depuis la page 1")
+        self.page_retries = 2
+        self.reached_end = False
         
-        chromedriver_path = r"C:\chromedriver\chromedriver.exe"
+        # Empreintes par page pour ne retraiter que les pages modifiées
+        self.fingerprints = None
+        if self.resumable:
+            self.fingerprints = PageFingerprints(Path(self.csv_filename).with_suffix('.fingerprints.json'))
+        self.incremental = True
         
-        try:
-            self.driver = webdriver.Chrome(
-                service=Service(chromedriver_path),
-                options=chrome_options
-            )
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.wait = WebDriverWait(self.driver, 20)
-            print("✅ Driver Chrome initialisé avec succès!")
-        except Exception as e:
-            print(f"❌ Erreur lors de l'initialisation du driver: {e}")
-            print("\n💡 SOLUTION:")
-            print("   1. Vérifiez votre version de Chrome: chrome://version/")
-            print("   2. Téléchargez ChromeDriver: https://googlechromelabs.github.io/chrome-for-testing/")
-            print(f"   3. Placez chromedriver.exe à: {chromedriver_path}")
-            raise
+        # ⭐ Dossier des captures d'écran, seulement si le navigateur sert
+        # (réutilisé en cas de reprise)
+        self.screenshots_dir = None
+        if self.resume_state and Path(self.resume_state.get('screenshots_dir', '')).is_dir():
+            self.screenshots_dir = Path(self.resume_state['screenshots_dir'])
+        elif self.needs_browser():
+            self.screenshots_dir = self.create_screenshots_folder()
+        self.screenshot_type = "full"
+        self.screenshot_format = "png"
+        self.screenshot_quality = None
+        self.screenshot_clip = None
+        self.screenshot_stats = []
+        self.screenshot_writer = None
+        
+        # Les sorties (CSV, JSONL...) sont écrites par EcommerceScraperPipeline;
+        # le checkpoint d'une page attend que ses items y soient validés
+        self.exporter = None
+        self.exported_counts = {}
+        self.page_progress = {}
+        self.check_resume_output()
+        self.checkpointed_page = self.resume_state['last_page'] if self.resume_state else 0
+        self.finished = False
+        
+        # Configuration Chrome (profil et blocage réseau lus dans from_crawler)
+        self.driver = None
+        self.browser_options = {}
+        # Démarrage à chaud: Chrome déjà lancé (BROWSER_DEBUGGER_ADDRESS ou
+        # démon BROWSER_DAEMON) et profils persistants (BROWSER_PROFILE_DIR)
+        self.debugger_address = None
+        self.daemon = None
+        self.profile_dir = None
+        self.path_cache = None
+        self.profile_slots = itertools.count()
+        self.startup_timings = []
+        # Tout le travail WebDriver passe par ce thread: le reactor reste libre
+        self.browser_threads = None
+        if self.needs_browser():
+            self.browser_threads = BrowserThreads(name=f"{self.slug}-browser")
+    
+    def needs_browser(self):
+        """Le spider Selenium a toujours besoin du navigateur"""
+        return True
+    
+    def start_browser(self):
+        """
+        Lance le navigateur principal (une seule fois), attaché au Chrome chaud
+        s'il y en a un
+
+        Bloquant: appelé dans le thread navigateur (browser_threads)
+        """
+        if self.driver is None:
+            if self.daemon and not self.debugger_address:
+                try:
+                    self.resolve_paths()
+                    self.debugger_address = self.daemon.ensure_running(
+                        self.browser_options.get('chrome_binary'),
+                        self.browser_options['profile'], self.browser_options['headless'],
+                    )
+                except Exception as e:
+                    print(f"⚠️ Démon Chrome indisponible: {str(e)[:100]}")
+            self.driver = self.new_driver(attach=True)
+        return self.driver
+    
+    def new_driver(self, attach=False):
+        """
+        Lance un navigateur avec le profil configuré (BROWSER_PROFILE, BROWSER_BLOCK...)
+        
+        Args:
+            attach: S'attacher au Chrome de debugger_address (navigateur
+                principal seulement: un Chrome attaché ne se partage pas)
+        """
+        self.resolve_paths()
+        options = dict(self.browser_options)
+        if attach and self.debugger_address:
+            try:
+                driver = create_driver(**options, debugger_address=self.debugger_address)
+                self.record_startup(driver)
+                return driver
+            except Exception as e:
+                print(f"⚠️ Chrome chaud injoignable ({self.debugger_address}): {str(e)[:100]}")
+                print("   ↪️ Lancement d'un nouveau navigateur")
+        if self.profile_dir:
+            # Un dossier par navigateur: Chrome verrouille son profil
+            options['profile_dir'] = Path(self.profile_dir) / f"{self.slug}-{next(self.profile_slots)}"
+        driver = create_driver(**options)
+        self.record_startup(driver)
+        return driver
+    
+    def resolve_paths(self):
+        """Chemins de Chrome et chromedriver lus une fois (cache BROWSER_PATH_CACHE)"""
+        if self.path_cache and 'chrome_binary' not in self.browser_options:
+            paths = resolve_browser_paths(self.path_cache)
+            self.browser_options['chrome_binary'] = paths['chrome_binary']
+            if paths['chromedriver_path']:
+                self.browser_options['chromedriver_path'] = paths['chromedriver_path']
+    
+    def record_startup(self, driver):
+        """Temps de démarrage d'un navigateur (affiché et publié dans les stats Scrapy)"""
+        elapsed = getattr(driver, 'startup_time', None)
+        if elapsed is None:
+            return
+        mode = getattr(driver, 'startup_mode', 'cold')
+        print(f"⚡ Démarrage du navigateur ({mode}): {elapsed * 1000:.0f} ms")
+        # Les navigateurs du pool démarrent en parallèle
+        with self.state_lock:
+            self.startup_timings.append((mode, elapsed))
+            if getattr(self, 'crawler', None):
+                stats = self.crawler.stats
+                stats.inc_value("browser/launches")
+                stats.inc_value(f"browser/startup_{mode}")
+                if len(self.startup_timings) == 1:
+                    stats.set_value("browser/startup_ms", round(elapsed * 1000, 1))
+                stats.set_value("browser/startup_total_ms",
+                                round(sum(timing for _, timing in self.startup_timings) * 1000, 1))
+    
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        if spider.workers is None:
+            spider.workers = crawler.settings.getint('BROWSER_POOL_SIZE', 1)
+        if spider.tabs is None:
+            spider.tabs = crawler.settings.getint('BROWSER_TABS', 1)
+        if spider.prefetch is None:
+            spider.prefetch = crawler.settings.getbool('PREFETCH_NEXT_PAGE', False)
+        if spider.extraction is None:
+            spider.extraction = crawler.settings.get('SELENIUM_EXTRACTION', 'js')
+        spider.waits = WaitPolicy.from_settings(crawler.settings)
+        spider.throttle = BrowserThrottle.from_settings(crawler.settings, max_concurrency=spider.workers)
+        if crawler.settings.getbool('BROWSER_THROTTLE_ENABLED', True):
+            spider.waits.listeners.append(spider.throttle.on_wait)
+        if spider.pagination_name is None:
+            spider.pagination_name = (crawler.settings.get('PAGINATION_STRATEGY')
+                                      or VARIANT_STRATEGIES[spider.variant])
+        spider.pagination = create_strategy(
+            spider.pagination_name, spider.start_url, spider.waits,
+            idle=crawler.settings.getfloat('PAGINATION_IDLE_TIMEOUT', 1.0),
+        )
+        spider.screenshot_type = crawler.settings.get('SCREENSHOT_TYPE', 'full')
+        spider.screenshot_format = crawler.settings.get('SCREENSHOT_FORMAT', 'png')
+        spider.screenshot_quality = crawler.settings.getint('SCREENSHOT_QUALITY', 80)
+        spider.screenshot_clip = parse_clip(crawler.settings.get('SCREENSHOT_CLIP'))
+        if spider.needs_browser():
+            spider.screenshot_writer = ScreenshotWriter.from_settings(crawler.settings)
+        spider.page_retries = crawler.settings.getint('CRAWL_PAGE_RETRIES', 2)
+        spider.incremental = crawler.settings.getbool('INCREMENTAL_CRAWL', True)
+        spider.browser_options = browser_options_from_settings(crawler.settings)
+        spider.profile_dir = crawler.settings.get('BROWSER_PROFILE_DIR')
+        spider.path_cache = crawler.settings.get('BROWSER_PATH_CACHE')
+        spider.debugger_address = crawler.settings.get('BROWSER_DEBUGGER_ADDRESS')
+        if (spider.needs_browser() and not spider.debugger_address
+                and crawler.settings.getbool('BROWSER_DAEMON', False)):
+            # Démon lancé avec le navigateur, hors du thread du reactor
+            spider.daemon = BrowserDaemon.from_settings(crawler.settings)
+        return spider
     
     def create_screenshots_folder(self):
         """Crée un dossier pour stocker les captures d'écran"""
         # Format: screenshots_YYYYMMDD_HHMMSS
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         folder_name = f"screenshots_{timestamp}"
-        folder_path = Path(folder_name)
+        folder_path = self.output_dir / folder_name
         
         try:
             folder_path.mkdir(exist_ok=True)
@@ -105,224 +321,547 @@ class LaptopsSpider(scrapy.Spider):
             fallback.mkdir(exist_ok=True)
             return fallback
     
-    def take_screenshot(self, page_number, screenshot_type="full"):
+    def take_screenshot(self, page_number, screenshot_type=None, driver=None, worker_id=None):
         """
         Prend une capture d'écran de la page
         
         Args:
             page_number: Numéro de la page
             screenshot_type: "full" pour page complète, "viewport" pour zone visible
+                (par défaut le setting SCREENSHOT_TYPE)
+            driver: Driver à utiliser (par défaut celui du spider)
+            worker_id: Identifiant du worker du pool (ajouté au nom du fichier)
         """
+        driver = driver or self.driver
+        screenshot_type = screenshot_type or self.screenshot_type
         try:
-            # Scroller en haut de la page pour une capture complète
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(0.5)
+            started = time.perf_counter()
             
-            # Nom du fichier
-            filename = f"page_{page_number:02d}_laptops.png"
+            # Nom du fichier (un suffixe par worker quand le pool est actif)
+            extension = self.screenshot_writer.extension(self.screenshot_format)
+            if worker_id is None:
+                filename = f"page_{page_number:02d}_{self.slug}.{extension}"
+            else:
+                filename = f"page_{page_number:02d}_w{worker_id}_{self.slug}.{extension}"
             filepath = self.screenshots_dir / filename
             
+            # Profil allégé: images et polices sont débloquées le temps de la
+            # capture pour obtenir le rendu complet de la page
+            blocked = self.browser_options.get('blocked_patterns')
+            if blocked:
+                apply_request_blocking(driver, render_patterns(blocked))
+                self.waits.wait_for_images(driver)
+            
+            # Le crawl ne récupère que les octets bruts (base64): décodage,
+            # réencodage et écriture disque sont faits par screenshot_writer
             if screenshot_type == "full":
-                # Capturer la page entière (hauteur totale)
-                original_size = self.driver.get_window_size()
-                required_width = self.driver.execute_script('return document.body.scrollWidth')
-                required_height = self.driver.execute_script('return document.body.scrollHeight')
-                
-                # Redimensionner la fenêtre pour capturer tout le contenu
-                self.driver.set_window_size(required_width, required_height)
-                time.sleep(0.3)
-                
-                # Prendre la capture
-                self.driver.save_screenshot(str(filepath))
-                
-                # Restaurer la taille originale
-                self.driver.set_window_size(original_size['width'], original_size['height'])
-                time.sleep(0.3)
+                # ⭐ Page complète via DevTools: aucun redimensionnement de la fenêtre
+                data = capture_screenshot(
+                    driver, self.screenshot_format, self.screenshot_quality,
+                    self.screenshot_clip, decode=False
+                )
+                capture_format = self.screenshot_format
             else:
-                # Capture simple de la zone visible
-                self.driver.save_screenshot(str(filepath))
+                # Capture simple de la zone visible (en haut de la page)
+                driver.execute_script("window.scrollTo(0, 0);")
+                self.waits.wait_for_paint(driver, "screenshot_scroll")
+                data = driver.get_screenshot_as_base64()
+                capture_format = 'png'
+            
+            if blocked:
+                apply_request_blocking(driver, blocked)
             
-            file_size = filepath.stat().st_size / 1024  # Taille en Ko
-            print(f"   📸 Capture page {page_number} sauvegardée: {filename} ({file_size:.1f} Ko)")
+            elapsed = time.perf_counter() - started
+            with self.state_lock:
+                self.screenshot_stats.append(elapsed)
+            print(f"   📸 Capture page {page_number} envoyée en écriture: {filename} "
+                  f"({elapsed * 1000:.0f} ms)")
             
-            return str(filepath)
+            return self.screenshot_writer.submit(data, filepath, capture_format)
             
         except Exception as e:
             print(f"   ⚠️ Erreur lors de la capture page {page_number}: {str(e)[:100]}")
             return None
     
-    def init_csv(self):
-        """Initialise le fichier CSV avec les en-têtes"""
-        try:
-            if os.path.exists(self.csv_filename):
-                os.remove(self.csv_filename)
-                print(f"🗑️ Ancien fichier {self.csv_filename} supprimé")
-            
-            self.csv_file = open(self.csv_filename, 'w', newline='', encoding='utf-8')
-            self.csv_writer = csv.DictWriter(
-                self.csv_file,
-                fieldnames=['page', 'title', 'price', 'description', 'reviews', 'rating', 'link', 'screenshot']
-            )
-            self.csv_writer.writeheader()
-            self.csv_file.flush()
-            print(f"✅ Fichier CSV initialisé: {self.csv_filename}\n")
-        except Exception as e:
-            print(f"❌ Erreur lors de l'initialisation du CSV: {e}")
-            raise
+    def check_resume_output(self):
+        """La reprise a besoin du CSV du run interrompu (réécrit par le pipeline)"""
+        if self.resume_state and not os.path.exists(self.csv_filename):
+            print(f"⚠️ {self.csv_filename} introuvable: reprise impossible, démarrage depuis la page 1")
+            self.resume_state = None
     
-    def write_to_csv(self, item):
-        """Écrit un item dans le CSV immédiatement"""
-        try:
-            self.csv_writer.writerow(item)
-            self.csv_file.flush()
-            os.fsync(self.csv_file.fileno())
-        except Exception as e:
-            print(f"❌ Erreur lors de l'écriture dans le CSV: {e}")
+    def item_exported(self, item):
+        """Appelé par le pipeline pour chaque item reçu (compte les items par page)"""
+        page = item.get('page')
+        self.exported_counts[page] = self.exported_counts.get(page, 0) + 1
+        self.save_exported_pages()
+    
+    def page_done(self, page, count, total_items):
+        """La page a produit tous ses items: checkpoint dès qu'ils sont tous exportés"""
+        self.page_progress[page] = (count, total_items)
+        self.save_exported_pages()
+    
+    def save_exported_pages(self):
+        """
+        Checkpoint des pages terminées dont tous les items ont atteint le
+        pipeline, une fois validés par tous les sinks (barrière)
+        """
+        while self.page_progress:
+            page = min(self.page_progress)
+            count, total_items = self.page_progress[page]
+            if self.exporter and self.exported_counts.get(page, 0) < count:
+                return
+            del self.page_progress[page]
+            self.exported_counts.pop(page, None)
+            done = self.exporter.barrier() if self.exporter else defer.succeed(None)
+            done.addCallback(lambda _, page=page, total_items=total_items: self.save_checkpoint(page, total_items))
+    
+    def save_checkpoint(self, page, total_items):
+        # Crawl terminé entre-temps: le checkpoint a déjà été supprimé
+        if self.finished or page <= self.checkpointed_page:
+            return
+        self.checkpointed_page = page
+        self.checkpoint.save(
+            page, total_items,
+            screenshots_dir=str(self.screenshots_dir),
+            start_url=self.start_url,
+        )
     
     def start_requests(self):
         """Point d'entrée du spider"""
-        url = "https://webscraper.io/test-sites/e-commerce/ajax/computers/laptops"
+        url = self.start_url
         print(f"\n{'='*70}")
         print(f"🔄 DÉBUT DU SCRAPING MULTI-PAGES")
         print(f"💾 Écriture progressive dans: {self.csv_filename}")
         print(f"📸 Captures d'écran dans: {self.screenshots_dir}")
+        print(f"🧭 Stratégie de pagination: {self.pagination.name}")
+        if self.resume_state:
+            print(f"♻️ Reprise à la page {self.resume_state['last_page'] + 1}")
+        if self.workers > 1:
+            print(f"🧩 Navigateurs en parallèle: {self.workers}")
+        elif self.tabs > 1:
+            print(f"🗂️ Onglets en parallèle dans un navigateur: {self.tabs}")
+        elif self.prefetch:
+            print(f"⏭️ Préchargement de la page suivante dans un second onglet")
         print(f"{'='*70}\n")
         yield scrapy.Request(url, callback=self.parse_all_pages, dont_filter=True)
     
-    def parse_all_pages(self, response):
-        """Scrape toutes les pages en utilisant Selenium"""
-        current_page = 1
-        max_pages = 20
-        total_items = 0
+    def plan_pagination(self, response):
+        """
+        Lit le widget de pagination une seule fois (HTML déjà téléchargé par
+        Scrapy) et fixe la dernière page du crawl
+        """
+        self.plan = PaginationPlan.from_selector(response.selector)
+        if self.plan:
+            self.last_page = self.plan.pages(1, self.max_pages)[-1]
+            print(f"🧭 Pagination: {self.plan.total_pages} pages, crawl jusqu'à la page {self.last_page}")
+            if getattr(self, 'crawler', None):
+                self.crawler.stats.set_value("pagination/total_pages", self.plan.total_pages)
+        else:
+            self.last_page = self.max_pages or DEFAULT_MAX_PAGES
+            print(f"⚠️ Pagination illisible: crawl jusqu'à la page {self.last_page} "
+                  f"ou jusqu'à la désactivation de 'Next >'")
+        return self.plan
+    
+    async def parse_all_pages(self, response):
+        """
+        Scrape toutes les pages en utilisant Selenium
         
-        # Charger la première page
-        self.driver.get(response.url)
-        print(f"📡 Navigation vers: {response.url}")
+        Chaque page est scrapée dans le thread navigateur (browser_threads):
+        pendant ce temps Scrapy continue de planifier et télécharger les
+        autres requêtes. Les items et le checkpoint sont traités ici, dans
+        le thread du reactor, dès qu'une page est prête.
+        """
+        # Chrome démarre dans le thread navigateur: le reactor reste libre
+        # pendant le lancement
+        await self.browser_threads.call(self.start_browser)
+        first_page = self.resume_state['last_page'] + 1 if self.resume_state else 1
+        current_page = first_page - 1
+        total_items = self.resume_state['items'] if self.resume_state else 0
+        self.reached_end = False
+        if self.pagination.paginated:
+            self.plan_pagination(response)
+            self.pagination.plan = self.plan
+        else:
+            # Une seule page qui grossit: pas de pagination à planifier, la
+            # fin est détectée quand la grille ne grossit plus
+            self.last_page = self.max_pages
         
+        if not self.pagination.paginated:
+            last = itertools.count(first_page) if self.last_page is None else range(first_page, self.last_page + 1)
+            pages = self.crawl_page_range(self.driver, last)
+        elif first_page > self.last_page:
+            print(f"ℹ️ Rien à reprendre: la page {self.last_page} était déjà terminée")
+            self.reached_end = True
+            pages = iter(())
+        elif self.workers > 1:
+            # ⭐ Pagination répartie sur plusieurs navigateurs
+            self.pool = BrowserPool(self.workers, self.new_driver, drivers=[self.driver])
+            pages = self.pool.imap_ordered(first_page, self.last_page, self.crawl_page_range)
+        elif self.tabs > 1 and self.pagination.name == 'buttons':
+            # ⭐ Pagination répartie sur plusieurs onglets d'un seul navigateur
+            self.tab_pool = TabPool(self.driver, self.tabs, self.waits)
+            pages = self.tab_pool.imap_ordered(
+                first_page, self.last_page, self.open_listing, self.scrape_page, self.pagination.next_button
+            )
+        elif self.prefetch and self.pagination.name == 'buttons':
+            pages = self.crawl_page_range_prefetch(self.driver, range(first_page, self.last_page + 1))
+        else:
+            pages = self.crawl_page_range(self.driver, range(first_page, self.last_page + 1))
+        
+        # reached_end n'est écrit qu'ici (thread du reactor): chaque générateur
+        # de pages renvoie en fin de parcours si le listing est terminé
+        while True:
+            result, end = await self.browser_threads.call(next_page, pages)
+            if result is None:
+                self.reached_end = self.reached_end or end
+                break
+            page, items = result
+            if page != current_page + 1:
+                # Page manquante (worker en échec): on s'arrête pour que la
+                # reprise reparte de la dernière page continue
+                print(f"   ⚠️ Page {current_page + 1} manquante - arrêt pour reprise ultérieure")
+                self.reached_end = False
+                break
+            current_page = page
+            if getattr(self, 'crawler', None):
+                self.crawler.stats.inc_value("pages/crawled")
+            
+            for item in items:
+                # Écrit par le pipeline d'export (EXPORT_SINKS)
+                total_items += 1
+                yield item
+            
+            # ⭐ Point de reprise: dès que les items de la page sont exportés
+            self.page_done(current_page, len(items), total_items)
+            print(f"   ✅ Page {current_page} scrapée: {len(items)} items | Total: {total_items}")
+        
+        self.fingerprints.save()
+        if self.reached_end:
+            self.finished = True
+            self.checkpoint.clear()
+        else:
+            print(f"\n💡 Crawl interrompu après la page {current_page}: "
+                  f"relancez avec -a resume=true pour reprendre")
+        
+        print(f"\n{'='*70}")
+        print(f"🎉 SCRAPING TERMINÉ!")
+        print(f"📄 Nombre de pages parcourues: {current_page}")
+        print(f"💾 Total d'items écrits: {total_items}")
+        if self.extraction_timings:
+            average = sum(self.extraction_timings) / len(self.extraction_timings)
+            print(f"⏱️ Extraction moyenne par page ({self.extraction}): {average * 1000:.0f} ms")
+        self.report_wait_stats()
+        # Vide la file d'écriture des captures: bloquant
+        await self.browser_threads.call(self.report_screenshot_stats)
+        self.report_incremental_stats()
+        self.report_prefetch_stats()
+        self.report_pagination_stats()
+        self.report_throttle_stats()
+        print(f"📁 Fichier CSV: {self.csv_filename}")
+        print(f"📸 Captures d'écran: {self.screenshots_dir.absolute()}")
+        print(f"{'='*70}\n")
+    
+    def crawl_page_range(self, driver, pages, worker_id=None):
+        """
+        Parcourt une plage de pages contiguë avec un driver
+        
+        La navigation passe par la stratégie de pagination (boutons, URL,
+        défilement, "Load more"); sur un listing qui grossit, seuls les
+        produits ajoutés depuis l'étape précédente sont extraits.
+        
+        Si le navigateur plante, il est relancé et la page en échec est
+        retentée (CRAWL_PAGE_RETRIES fois) au lieu d'abandonner le crawl.
+        
+        Chaque étape (lecture d'une page, navigation) prend un créneau du
+        throttle: quand le site ralentit, moins de navigateurs du pool
+        travaillent en même temps et un délai précède chaque navigation.
+        
+        Args:
+            driver: Driver Selenium à utiliser
+            pages: Numéros de pages à scraper (contigus, croissants; itérable
+                sans fin possible pour un listing qui grossit)
+            worker_id: Identifiant du worker du pool (None en mode simple)
+            
+        Yields:
+            tuple: (numéro de page, liste des items de la page)
+        
+        Returns:
+            bool: True si le listing se termine à la dernière page produite
+            (valeur de fin du générateur, lue par le pool ou parse_all_pages)
+        """
+        pages = iter(pages)
+        prefix = "" if worker_id is None else f"[W{worker_id}] "
+        # Un worker du pool navigue avec sa propre copie du plan de pagination
+        pagination = self.pagination if worker_id is None else self.pagination.for_worker()
+        current_page = next(pages, None)
+        if current_page is None:
+            return
+        
+        # Charger la première page de la plage
         try:
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "thumbnail")))
-            print("✅ Page initiale chargée avec succès!")
-            time.sleep(3)
+            with self.throttle.slot():
+                if not pagination.open(driver, current_page, prefix):
+                    return
         except TimeoutException:
-            print("❌ Timeout: impossible de charger la page")
+            print(f"{prefix}❌ Timeout: impossible de charger la page")
             return
         
-        # Boucle de scraping multi-pages
-        while current_page <= max_pages:
+        retries = 0
+        reached_end = False
+        while True:
             try:
-                print(f"\n📄 PAGE {current_page}")
+                print(f"\n{prefix}📄 PAGE {current_page}")
                 print("-" * 70)
                 
-                self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "thumbnail")))
-                time.sleep(2)
-                
-                # ⭐ PRENDRE LA CAPTURE D'ÉCRAN DE LA PAGE
-                screenshot_path = self.take_screenshot(current_page, screenshot_type="full")
+                with self.throttle.slot():
+                    self.waits.wait_for_grid(driver)
+                    items = self.scrape_page(current_page, driver, worker_id, offset=pagination.offset)
+                if not items:
+                    break
                 
-                products = self.driver.find_elements(By.CLASS_NAME, "thumbnail")
-                print(f"   🔍 {len(products)} ordinateurs trouvés")
+                yield current_page, items
+                retries = 0
                 
-                if len(products) == 0:
-                    print("   ⚠️ Aucun produit - Arrêt du scraping")
+                # Navigation vers la page suivante
+                if current_page == self.last_page:
+                    reached_end = True
+                following = next(pages, None)
+                if following is None:
                     break
                 
-                # Scraper chaque produit
-                for idx, product in enumerate(products, 1):
-                    try:
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", 
-                            product
-                        )
-                        time.sleep(0.15)
-                        
-                        # Extraction des données
-                        title = product.find_element(By.CLASS_NAME, "title").text.strip()
-                        price_text = product.find_element(By.CLASS_NAME, "price").text
-                        price = price_text.replace("$", "").replace(",", "").strip()
-                        
-                        try:
-                            description = product.find_element(By.CLASS_NAME, "description").text.strip()
-                        except NoSuchElementException:
-                            description = ""
-                        
-                        try:
-                            reviews_text = product.find_element(By.CSS_SELECTOR, ".ratings p.review-count").text.strip()
-                            reviews = reviews_text.split()[0] if reviews_text else "0"
-                        except NoSuchElementException:
-                            reviews = "0"
-                        
-                        rating = self.extract_rating(product)
-                        
-                        try:
-                            link = product.find_element(By.CLASS_NAME, "title").get_attribute("href")
-                        except NoSuchElementException:
-                            link = ""
-                        
-                        # Créer l'item avec le chemin de la capture d'écran
-                        item = {
-                            'page': current_page,
-                            'title': title,
-                            'price': price,
-                            'description': description,
-                            'reviews': reviews,
-                            'rating': rating,
-                            'link': link,
-                            'screenshot': screenshot_path if screenshot_path else ""
-                        }
-                        
-                        # Écrire immédiatement dans le CSV
-                        self.write_to_csv(item)
-                        total_items += 1
-                        
-                        # Afficher un indicateur de progression
-                        if idx % 3 == 0 or idx == len(products):
-                            print(f"   💾 [{idx}/{len(products)}] items écrits dans le CSV")
-                        
-                        yield item
-                        
-                    except Exception as e:
-                        print(f"   ⚠️ Erreur produit #{idx}: {str(e)[:50]}")
-                        continue
+                print(f"\n   {prefix}🔄 Navigation vers page {following}...")
+                previous_page, current_page = current_page, following
+                self.throttle.pause()
+                with self.throttle.slot():
+                    advanced = pagination.advance(driver, current_page)
+                if not advanced:
+                    print(f"\n   ℹ️ Fin de la pagination à la page {previous_page}")
+                    reached_end = True
+                    break
+                print(f"   ✅ Page {current_page} chargée!")
+                    
+            except Exception as e:
+                print(f"   ❌ {prefix}Erreur critique sur page {current_page}: {str(e)[:100]}")
+                self.throttle.record_error()
+                if retries >= self.page_retries:
+                    print(f"   🛑 {prefix}Abandon après {retries} relance(s) du navigateur")
+                    break
                 
-                print(f"   ✅ Page {current_page} scrapée: {len(products)} items | Total: {total_items}")
+                # ⭐ Relancer le navigateur et reprendre à la page en échec
+                retries += 1
+                print(f"   🔁 {prefix}Relance du navigateur ({retries}/{self.page_retries})...")
+                try:
+                    driver = self.restart_driver(driver, worker_id)
+                    self.throttle.pause()
+                    with self.throttle.slot():
+                        if not pagination.open(driver, current_page, prefix):
+                            break
+                except Exception as restart_error:
+                    print(f"   ❌ {prefix}Relance impossible: {str(restart_error)[:100]}")
+                    break
+        return reached_end
+    
+    def crawl_page_range_prefetch(self, driver, pages):
+        """
+        Variante pipelinée de crawl_page_range (un seul navigateur)
+        
+        Dès que le DOM de la page N est lu, la page N+1 est demandée dans un
+        second onglet; la capture de N, l'écriture CSV et le checkpoint se
+        font pendant son chargement. En cas d'erreur, le crawl s'arrête et
+        reprend ensuite depuis le checkpoint (-a resume=true).
+        
+        Yields:
+            tuple: (numéro de page, liste des items de la page)
+        
+        Returns:
+            bool: True si le listing se termine à la dernière page produite
+        """
+        pages = list(pages)
+        if not pages:
+            return
+        
+        try:
+            if not self.open_listing(driver, pages[0]):
+                return
+            self.prefetcher = NextPagePrefetcher(driver, self.waits, self.pagination.click_page)
+            self.prefetcher.open_second_tab(self.open_listing, pages[0])
+        except TimeoutException:
+            print("❌ Timeout: impossible de charger la page")
+            return
+        
+        for index, current_page in enumerate(pages):
+            try:
+                print(f"\n📄 PAGE {current_page}")
+                print("-" * 70)
                 
-                # Navigation vers la page suivante
-                if current_page < max_pages:
-                    print(f"\n   🔄 Navigation vers page {current_page + 1}...")
-                    
-                    if not self.click_next_button():
-                        print(f"\n   ℹ️ Fin de la pagination à la page {current_page}")
-                        break
-                    
-                    current_page += 1
-                    print(f"   ⏳ Chargement de la page {current_page}...")
-                    time.sleep(4)
-                    
-                    self.driver.execute_script("window.scrollTo(0, 0);")
-                    time.sleep(0.5)
-                    self.driver.execute_script("window.scrollTo(0, 800);")
-                    time.sleep(1)
-                    
-                    try:
-                        self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "thumbnail")))
-                        print(f"   ✅ Page {current_page} chargée!")
-                    except TimeoutException:
-                        print("   ⚠️ Timeout - Nouveaux produits non chargés")
-                        break
+                if index == 0:
+                    self.waits.wait_for_grid(driver)
+                elif self.prefetcher.pending:
+                    # ⭐ La page a été préchargée dans l'autre onglet
+                    if not self.prefetcher.finish():
+                        print(f"\n   ℹ️ Page {current_page} préchargée hors pagination: "
+                              f"fin à la page {pages[index - 1]}")
+                        return True
+                    print(f"   ⏭️ Page {current_page} déjà chargée (préchargement)")
                 else:
-                    break
-                    
+                    # Bouton numéroté absent: navigation classique
+                    self.throttle.pause()
+                    previous = self.waits.grid_state(driver)
+                    status = self.pagination.next_button(driver)
+                    if status == 'disabled':
+                        print(f"\n   ℹ️ Fin de la pagination à la page {pages[index - 1]}")
+                        return True
+                    if status != 'clicked':
+                        print(f"   ⚠️ 'Next >' {status} après la page {pages[index - 1]}: arrêt pour reprise ultérieure")
+                        return False
+                    self.waits.wait_for_grid_change(driver, previous)
+                
+                on_snapshot = None
+                if index + 1 < len(pages):
+                    on_snapshot = lambda: self.prefetcher.start(pages[index + 1])
+                items = self.scrape_page(current_page, driver, on_snapshot=on_snapshot)
+                if not items:
+                    return
+                
+                yield current_page, items
+            
             except Exception as e:
                 print(f"   ❌ Erreur critique sur page {current_page}: {str(e)[:100]}")
-                break
+                self.throttle.record_error()
+                return False
+        return pages[-1] == self.last_page
+    
+    def open_listing(self, driver, page_number, prefix=""):
+        """Charge le listing puis se place sur la page demandée (stratégie de pagination)"""
+        return self.pagination.open(driver, page_number, prefix)
+    
+    def restart_driver(self, driver, worker_id=None):
+        """Remplace un driver planté par un nouveau navigateur"""
+        try:
+            close_driver(driver)
+        except Exception:
+            pass
         
-        print(f"\n{'='*70}")
-        print(f"🎉 SCRAPING TERMINÉ!")
-        print(f"📄 Nombre de pages parcourues: {current_page}")
-        print(f"💾 Total d'items écrits: {total_items}")
-        print(f"📁 Fichier CSV: {self.csv_filename}")
-        print(f"📸 Captures d'écran: {self.screenshots_dir.absolute()}")
-        print(f"{'='*70}\n")
+        new_driver = self.new_driver()
+        if self.pool and worker_id is not None:
+            self.pool.drivers[worker_id] = new_driver
+        else:
+            self.driver = new_driver
+        
+        if getattr(self, 'crawler', None):
+            with self.state_lock:
+                self.crawler.stats.inc_value("browser/restarts")
+        return new_driver
+    
+    def scrape_page(self, current_page, driver=None, worker_id=None, on_snapshot=None, offset=0):
+        """
+        Extrait tous les produits de la page affichée
+        
+        Args:
+            on_snapshot: Fonction appelée dès que le DOM de la page a été lu
+                (avant la capture), ex: lancer le préchargement de la suivante
+            offset: Nombre de produits déjà traités en haut de la grille
+                (variantes scroll/more: seuls les produits ajoutés sont gardés)
+        
+        Returns:
+            list: Items de la page (vide si aucun produit)
+        """
+        driver = driver or self.driver
+        page_started = time.perf_counter()
+        
+        # Empreinte de la page: si rien n'a changé depuis le dernier run, on
+        # reprend les lignes du snapshot sans capture ni extraction
+        fingerprint = page_fingerprint(driver, offset)
+        if self.incremental:
+            previous_rows = self.fingerprints.unchanged_rows(current_page, fingerprint)
+            if previous_rows:
+                print(f"   ♻️ Page {current_page} inchangée depuis le dernier run: "
+                      f"{len(previous_rows)} lignes reprises")
+                if on_snapshot:
+                    on_snapshot()
+                self.pagination.record_products(len(previous_rows))
+                return previous_rows
+        
+        started = time.perf_counter()
+        if self.extraction == 'legacy':
+            items = self.extract_products_legacy(current_page, driver, None, offset)
+        else:
+            items = parse_products_js(driver.execute_script(EXTRACT_PRODUCTS_JS, offset), current_page)
+        elapsed = time.perf_counter() - started
+        with self.state_lock:
+            self.extraction_timings.append(elapsed)
+        
+        print(f"   🔍 {len(items)} produits trouvés")
+        print(f"   ⏱️ Extraction ({self.extraction}): {elapsed * 1000:.0f} ms")
+        
+        if len(items) == 0:
+            print("   ⚠️ Aucun produit - Arrêt du scraping")
+            return items
+        
+        if on_snapshot:
+            on_snapshot()
+        
+        # ⭐ PRENDRE LA CAPTURE D'ÉCRAN DE LA PAGE
+        screenshot_path = self.take_screenshot(current_page, driver=driver, worker_id=worker_id)
+        for item in items:
+            item['screenshot'] = screenshot_path or ""
+        
+        self.fingerprints.record(
+            current_page, fingerprint, items, time.perf_counter() - page_started
+        )
+        self.pagination.record_products(len(items))
+        
+        return items
+    
+    def extract_products_legacy(self, current_page, driver, screenshot_path, offset=0):
+        """Ancienne extraction: un appel WebDriver par champ et par produit"""
+        products = driver.execute_script(
+            "return Array.prototype.slice.call(document.querySelectorAll('.thumbnail'), arguments[0]);",
+            offset
+        )
+        items = []
+        
+        # Scraper chaque produit
+        for idx, product in enumerate(products, 1):
+            try:
+                driver.execute_script(
+                    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", 
+                    product
+                )
+                time.sleep(0.15)
+                
+                # Extraction des données
+                title = product.find_element(By.CLASS_NAME, "title").text
+                price_text = product.find_element(By.CLASS_NAME, "price").text
+                
+                try:
+                    description = product.find_element(By.CLASS_NAME, "description").text
+                except NoSuchElementException:
+                    description = ""
+                
+                try:
+                    reviews_text = product.find_element(By.CSS_SELECTOR, ".ratings p.review-count").text
+                except NoSuchElementException:
+                    reviews_text = ""
+                
+                rating = self.extract_rating(product)
+                
+                try:
+                    link = product.find_element(By.CLASS_NAME, "title").get_attribute("href")
+                except NoSuchElementException:
+                    link = ""
+                
+                # Créer l'item avec le chemin de la capture d'écran
+                items.append(build_item(
+                    current_page, title, price_text, description,
+                    reviews_text, rating, link, screenshot_path
+                ))
+                
+            except Exception as e:
+                print(f"   ⚠️ Erreur produit #{idx}: {str(e)[:50]}")
+                continue
+        
+        return items
     
     def extract_rating(self, product):
         """Extrait le nombre d'étoiles (rating) d'un produit"""
@@ -335,47 +874,143 @@ class LaptopsSpider(scrapy.Spider):
             pass
         return 0
     
-    def click_next_button(self):
-        """Clique sur le bouton 'Next >' pour passer à la page suivante"""
-        try:
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1.5)
-            
-            print("   🔍 Recherche du bouton 'Next >'...")
-            
-            all_buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            
-            for button in all_buttons:
-                text = button.text.strip()
-                
-                if "next" in text.lower() or text == ">" or ">" in text:
-                    print(f"      Bouton trouvé: '{text}'")
-                    
-                    if not button.is_enabled() or button.get_attribute("disabled"):
-                        print("   🏁 Bouton désactivé - Dernière page atteinte!")
-                        return False
-                    
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                    time.sleep(0.5)
-                    self.driver.execute_script("arguments[0].click();", button)
-                    print(f"   ✅ Clic réussi sur le bouton '{text}'!")
-                    return True
-            
-            print("   ⚠️ Aucun bouton 'Next' trouvé")
-            
-        except Exception as e:
-            print(f"   ⚠️ Erreur lors du clic: {str(e)[:80]}")
+    def report_wait_stats(self):
+        """Affiche le temps passé par type d'attente et le publie dans les stats Scrapy"""
+        summary = self.waits.summary()
+        if not summary:
+            return
+        
+        print("⏱️ Attentes:")
+        stats = self.crawler.stats if getattr(self, 'crawler', None) else None
+        for name, values in sorted(summary.items()):
+            print(f"   {name:<20} x{values['count']:<4} moy {values['avg_ms']:>7.0f} ms | "
+                  f"max {values['max_ms']:>7.0f} ms | timeouts {values['timeouts']}")
+            if stats:
+                stats.set_value(f"waits/{name}/count", values['count'])
+                stats.set_value(f"waits/{name}/avg_ms", round(values['avg_ms'], 1))
+                stats.set_value(f"waits/{name}/max_ms", round(values['max_ms'], 1))
+                stats.set_value(f"waits/{name}/timeouts", values['timeouts'])
+    
+    def report_incremental_stats(self):
+        """Résumé du crawl incrémental: pages reprises, modifiées, temps gagné"""
+        summary = self.fingerprints.summary
+        print(f"♻️ Pages inchangées (reprises): {len(summary['skipped'])} {sorted(summary['skipped'])}")
+        print(f"🔄 Pages modifiées: {len(summary['changed'])} {sorted(summary['changed'])}")
+        if summary['new']:
+            print(f"🆕 Nouvelles pages: {len(summary['new'])}")
+        print(f"⏱️ Temps gagné (estimé): {summary['time_saved']:.1f} s")
+        
+        if getattr(self, 'crawler', None):
+            self.crawler.stats.set_value("incremental/pages_skipped", len(summary['skipped']))
+            self.crawler.stats.set_value("incremental/pages_changed", len(summary['changed']))
+            self.crawler.stats.set_value("incremental/pages_new", len(summary['new']))
+            self.crawler.stats.set_value("incremental/time_saved_s", round(summary['time_saved'], 1))
+    
+    def report_prefetch_stats(self):
+        """Pages préchargées et temps de chargement masqué par le pipeline"""
+        if not self.prefetcher:
+            return
+        
+        stats = self.prefetcher.stats
+        print(f"⏭️ Préchargement: {stats['prefetched']} page(s) | sans bouton: {stats['fallbacks']} | "
+              f"hors pagination: {stats['past_end']} | temps gagné: {stats['overlap_saved']:.1f} s")
+        
+        if getattr(self, 'crawler', None):
+            self.crawler.stats.set_value("prefetch/pages", stats['prefetched'])
+            self.crawler.stats.set_value("prefetch/fallbacks", stats['fallbacks'])
+            self.crawler.stats.set_value("prefetch/past_end", stats['past_end'])
+            self.crawler.stats.set_value("prefetch/overlap_saved_s", round(stats['overlap_saved'], 2))
+    
+    def report_pagination_stats(self):
+        """Débit de la stratégie de pagination (affiché et publié dans les stats Scrapy)"""
+        if not self.pagination:
+            return
+        summary = self.pagination.summary()
+        print(f"🧭 Pagination ({self.pagination.name}): {summary['steps']} étape(s), "
+              f"{summary['navigation_avg_ms']:.0f} ms/étape, {summary['products_per_s']:.1f} produits/s")
+        if getattr(self, 'crawler', None):
+            prefix = f"pagination/{self.pagination.name}"
+            self.crawler.stats.set_value(f"{prefix}/steps", summary['steps'])
+            self.crawler.stats.set_value(f"{prefix}/products", summary['products'])
+            self.crawler.stats.set_value(f"{prefix}/navigation_avg_ms", round(summary['navigation_avg_ms'], 1))
+            self.crawler.stats.set_value(f"{prefix}/products_per_s", round(summary['products_per_s'], 2))
+    
+    def report_throttle_stats(self):
+        """Décisions du throttle navigateur (affichées et publiées dans les stats Scrapy)"""
+        summary = self.throttle.summary()
+        if not summary['samples'] and not summary['errors']:
+            return
+        print(f"🚦 Throttle: latence moy {summary['latency_avg_ms']:.0f} ms (lissée "
+              f"{summary['latency_ewma_ms']:.0f} ms) | délai {summary['delay_ms']:.0f} ms "
+              f"(max {summary['max_delay_ms']:.0f}) | navigateurs {summary['concurrency']}"
+              f"/{self.throttle.max_concurrency} (min {summary['min_concurrency']})")
+        print(f"   ralentissements: {summary['slowdowns']} | backoffs: {summary['backoffs']} | "
+              f"accélérations: {summary['speedups']} | en pause: {summary['paused_s']:.1f} s | "
+              f"attente de créneau: {summary['slot_wait_s']:.1f} s")
+        if getattr(self, 'crawler', None):
+            for key, value in summary.items():
+                self.crawler.stats.set_value(
+                    f"throttle/{key}", round(value, 2) if isinstance(value, float) else value
+                )
+    
+    def report_screenshot_stats(self):
+        """Affiche le temps de capture et la taille moyenne des fichiers"""
+        if not self.screenshot_stats:
+            return
         
-        return False
+        # Les tailles ne sont connues qu'une fois la file d'écriture vidée
+        self.screenshot_writer.flush()
+        writer_stats = self.screenshot_writer.stats
+        
+        count = len(self.screenshot_stats)
+        average_ms = sum(self.screenshot_stats) / count * 1000
+        total_kb = writer_stats['bytes'] / 1024
+        written = max(writer_stats['written'], 1)
+        print(f"📸 Captures ({self.screenshot_type}, {self.screenshot_format}): {count} | "
+              f"moy {average_ms:.0f} ms | {total_kb / written:.1f} Ko/page | total {total_kb:.0f} Ko")
+        print(f"   💾 Écriture en arrière-plan: {writer_stats['write_time']:.1f} s | "
+              f"attente file pleine: {writer_stats['blocked_time']:.1f} s | échecs: {writer_stats['failed']}")
+        for failed in self.screenshot_writer.failed_files:
+            print(f"   ⚠️ Capture manquante: {failed}")
+        
+        if getattr(self, 'crawler', None):
+            self.crawler.stats.set_value("screenshots/count", count)
+            self.crawler.stats.set_value("screenshots/avg_ms", round(average_ms, 1))
+            self.crawler.stats.set_value("screenshots/total_kb", round(total_kb, 1))
+            self.crawler.stats.set_value("screenshots/write_failures", writer_stats['failed'])
+            self.crawler.stats.set_value("screenshots/queue_blocked_s", round(writer_stats['blocked_time'], 2))
     
     def closed(self, reason):
-        """Fermeture propre du driver Selenium et du fichier CSV"""
-        print("\n⏳ Fermeture du navigateur...")
-        self.driver.quit()
-        print("✅ Navigateur fermé")
-        
-        if self.csv_file:
-            self.csv_file.close()
-            print(f"✅ Fichier CSV fermé: {self.csv_filename}")
+        """
+        Fermeture propre du driver Selenium (les sorties sont fermées par le pipeline)
+
+        Returns:
+            Deferred: arrêt des navigateurs et des threads, hors du reactor
+        """
+        return threads.deferToThread(self.shutdown)
+    
+    def shutdown(self):
+        """Ferme onglets, navigateurs et file des captures (bloquant)"""
+        if self.tab_pool:
+            # Onglets supplémentaires fermés avant le navigateur qui les porte
+            self.tab_pool.close()
+        
+        if self.pool:
+            # Le pool possède aussi le driver principal
+            print("\n⏳ Fermeture des navigateurs...")
+            self.pool.close()
+            print("✅ Navigateurs fermés")
+        elif self.driver:
+            print("\n⏳ Fermeture du navigateur...")
+            close_driver(self.driver)
+            print("✅ Navigateur fermé")
+        
+        if self.screenshot_writer:
+            # Vider la file d'écriture des captures avant de terminer
+            self.screenshot_writer.close()
+            print("✅ Captures d'écran écrites sur le disque")
+        
+        if self.browser_threads:
+            self.browser_threads.stop()
         
         print("✅ Spider terminé avec succès!")
\ No newline at end of file
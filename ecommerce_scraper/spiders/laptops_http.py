@@ -0,0 +1,115 @@
+# ecommerce_scraper/spiders/laptops_http.py
+import scrapy
+
+from ecommerce_scraper.extraction import parse_listing_response
+from ecommerce_scraper.spiders.laptops import DEFAULT_MAX_PAGES, LaptopsSpider
+
+
+class LaptopsHttpSpider(LaptopsSpider):
+    """
+    Variante sans navigateur du spider laptops
+
+    Les fragments paginés du site ajax sont demandés directement au
+    téléchargeur asynchrone de Scrapy (X-Requested-With: XMLHttpRequest),
+    en parallèle. Chrome n'est lancé que si les captures sont demandées:
+
+        scrapy crawl laptops_http
+        scrapy crawl laptops_http -a screenshots=true
+
+    Sortie: <partition>_http_progressive.csv (laptops_http_progressive.csv).
+    """
+    name = 'laptops_http'
+    # CSV distinct de celui du spider Selenium: son checkpoint et ses
+    # empreintes (<csv>.checkpoint.json...) ne sont jamais touchés ici
+    output_suffix = "http_progressive"
+    # Les pages arrivent dans le désordre: pas de reprise par checkpoint,
+    # un crawl HTTP complet ne coûte que quelques secondes
+    resumable = False
+
+    custom_settings = {
+        'DOWNLOAD_DELAY': 0,
+        'CONCURRENT_REQUESTS': 16,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+        'HTTPCACHE_ENABLED': False,
+        'FEED_EXPORT_ENCODING': 'utf-8',
+        'FEEDS': {}
+    }
+
+    def __init__(self, screenshots=False, *args, **kwargs):
+        self.screenshots = str(screenshots).lower() in ('1', 'true', 'yes', 'oui')
+        self.total_items = 0
+        kwargs.pop('resume', None)
+        super().__init__(*args, **kwargs)
+        # Historique des prix séparé de celui du crawl Selenium (HistorySink)
+        self.history_partition = f"{self.slug}_http"
+
+    def needs_browser(self):
+        """Chrome n'est utile que pour les captures d'écran"""
+        return self.screenshots
+
+    def page_request(self, page):
+        """Requête du fragment ajax d'une page du listing"""
+        return scrapy.Request(
+            f"{self.start_url}?page={page}",
+            headers={'X-Requested-With': 'XMLHttpRequest'},
+            callback=self.parse_page,
+            cb_kwargs={'page': page},
+            dont_filter=True,
+        )
+
+    def start_requests(self):
+        """Point d'entrée: la page 1 annonce le nombre total de pages"""
+        print(f"\n{'='*70}")
+        print(f"⚡ DÉBUT DU SCRAPING HTTP (sans navigateur)")
+        print(f"💾 Écriture progressive dans: {self.csv_filename}")
+        if self.screenshots:
+            print(f"📸 Captures d'écran dans: {self.screenshots_dir}")
+        print(f"{'='*70}\n")
+        yield self.page_request(1)
+
+    async def parse_page(self, response, page):
+        """Extrait les produits d'un fragment et planifie les pages suivantes"""
+        screenshot_path = None
+        if self.screenshots:
+            # Capture dans le thread navigateur: les autres pages continuent
+            # d'être téléchargées et parsées pendant ce temps
+            screenshot_path = await self.browser_threads.call(self.screenshot_page, page)
+        items, pages = parse_listing_response(response, page, screenshot_path)
+        print(f"   🔍 Page {page}: {len(items)} ordinateurs trouvés")
+        self.crawler.stats.inc_value("pages/crawled")
+
+        if page == 1:
+            if pages:
+                last_page = min(pages, self.max_pages) if self.max_pages else pages
+            else:
+                last_page = self.max_pages or DEFAULT_MAX_PAGES
+            print(f"   🧭 {last_page} page(s) à télécharger en parallèle")
+            for next_page in range(2, last_page + 1):
+                yield self.page_request(next_page)
+
+        for item in items:
+            self.total_items += 1
+            yield item
+
+        print(f"   ✅ Page {page} scrapée: {len(items)} items | Total: {self.total_items}")
+
+    def screenshot_page(self, page):
+        """Affiche la page dans Chrome le temps de la capture"""
+        try:
+            self.start_browser()
+            if not self.open_listing(self.driver, page):
+                return None
+            return self.take_screenshot(page)
+        except Exception as e:
+            print(f"   ⚠️ Capture impossible pour la page {page}: {str(e)[:80]}")
+            return None
+
+    def closed(self, reason):
+        print(f"\n🎉 SCRAPING HTTP TERMINÉ: {self.total_items} items écrits dans {self.csv_filename}")
+        self.report_wait_stats()
+        return super().closed(reason)
+
+    def shutdown(self):
+        # Les tailles des captures ne sont connues qu'une fois la file vidée
+        self.report_screenshot_stats()
+        super().shutdown()
@@ -0,0 +1,132 @@
+# ecommerce_scraper/spiders/laptops_ids.py
+import scrapy
+
+from ecommerce_scraper.catalog import product_id, product_url
+from ecommerce_scraper.extraction import parse_listing_response, parse_product_page
+from ecommerce_scraper.id_range import IdSweep
+from ecommerce_scraper.spiders.laptops_http import LaptopsHttpSpider
+
+
+class LaptopsIdsSpider(LaptopsHttpSpider):
+    """
+    Crawl direct des pages produit par identifiant, sans pagination
+
+    Les liens produit suivent .../ajax/product/<id> avec des identifiants
+    entiers denses. La plage est donnée (-a first_id / last_id) ou
+    découverte à partir des liens de la première page du listing: on
+    balaie alors vers le haut et vers le bas jusqu'à `misses` absences
+    consécutives. Les lignes ont les colonnes de laptops_progressive.csv
+    (page vide, titre complet de la page produit).
+
+        scrapy crawl laptops_ids
+        scrapy crawl laptops_ids -a first_id=31 -a last_id=147
+        scrapy crawl laptops_ids -a misses=20
+    """
+    name = 'laptops_ids'
+    output_suffix = "ids_progressive"
+
+    custom_settings = {
+        'DOWNLOAD_DELAY': 0,
+        'CONCURRENT_REQUESTS': 32,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+        'HTTPCACHE_ENABLED': False,
+        'FEED_EXPORT_ENCODING': 'utf-8',
+        'FEEDS': {}
+    }
+
+    def __init__(self, first_id=None, last_id=None, misses=10, *args, **kwargs):
+        self.first_id = int(first_id) if first_id else None
+        self.last_id = int(last_id) if last_id else None
+        self.max_misses = int(misses)
+        self.sweeps = []
+        self.product_prefix = None
+        super().__init__(*args, **kwargs)
+        self.history_partition = f"{self.slug}_ids"
+
+    def needs_browser(self):
+        """Pages produit téléchargées en HTTP: pas de navigateur"""
+        return False
+
+    def start_requests(self):
+        print(f"\n{'='*70}")
+        print(f"🔢 CRAWL DIRECT PAR IDENTIFIANT (sans pagination)")
+        print(f"💾 Écriture progressive dans: {self.csv_filename}")
+        print(f"{'='*70}\n")
+        if self.first_id:
+            self.start_sweeps([IdSweep(self.first_id, 1, self.max_misses, self.last_id, self.window())])
+            yield from self.next_requests()
+        else:
+            yield scrapy.Request(
+                f"{self.start_url}?page=1",
+                headers={'X-Requested-With': 'XMLHttpRequest'},
+                callback=self.discover,
+                dont_filter=True,
+            )
+
+    def window(self):
+        """Requêtes en vol par balayage (concurrence par domaine)"""
+        return self.crawler.settings.getint('CONCURRENT_REQUESTS_PER_DOMAIN', 16)
+
+    def discover(self, response):
+        """Plage de départ lue dans les liens de la première page du listing"""
+        items, _ = parse_listing_response(response, 1)
+        ids = [product_id(item['link']) for item in items]
+        ids = [found for found in ids if found is not None]
+        if not ids:
+            print("❌ Aucun lien produit dans le listing: indiquez -a first_id=N")
+            return
+        self.product_prefix = items[0]['link'].rstrip('/').rsplit('/', 1)[0]
+        start = min(ids)
+        print(f"🧭 Identifiants vus sur la page 1: {min(ids)} → {max(ids)}, "
+              f"balayage dans les deux sens (arrêt après {self.max_misses} absences)")
+        self.start_sweeps([
+            IdSweep(start, 1, self.max_misses, self.last_id, self.window()),
+            IdSweep(start - 1, -1, self.max_misses, self.first_id, self.window()),
+        ])
+        yield from self.next_requests()
+
+    def start_sweeps(self, sweeps):
+        self.sweeps = sweeps
+
+    def url_for(self, product):
+        if self.product_prefix:
+            return f"{self.product_prefix}/{product}"
+        return product_url(product, self.variant, self.base_url)
+
+    def next_requests(self):
+        """Complète la fenêtre de chaque balayage"""
+        for sweep in self.sweeps:
+            for product in sweep.take():
+                self.crawler.stats.inc_value("ids/requested")
+                yield scrapy.Request(
+                    self.url_for(product),
+                    callback=self.parse_product,
+                    errback=self.product_failed,
+                    cb_kwargs={'product': product, 'sweep': sweep},
+                    meta={'handle_httpstatus_list': [404, 410]},
+                    dont_filter=True,
+                )
+
+    def parse_product(self, response, product, sweep):
+        item = parse_product_page(response.selector, response.url) if response.status == 200 else None
+        sweep.resolve(product, item is not None)
+        if item is None:
+            self.crawler.stats.inc_value("ids/missing")
+        else:
+            self.crawler.stats.inc_value("ids/found")
+            self.total_items += 1
+            yield item
+        yield from self.next_requests()
+
+    def product_failed(self, failure):
+        """Erreur réseau: compté comme absence pour ne pas bloquer le balayage"""
+        kwargs = failure.request.cb_kwargs
+        kwargs['sweep'].resolve(kwargs['product'], False)
+        self.crawler.stats.inc_value("ids/errors")
+        yield from self.next_requests()
+
+    def closed(self, reason):
+        for sweep in self.sweeps:
+            direction = "↑" if sweep.step > 0 else "↓"
+            print(f"   {direction} {sweep.found} produit(s), dernier identifiant continu: {sweep.last_found}")
+        return super().closed(reason)
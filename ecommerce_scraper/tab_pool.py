@@ -0,0 +1,190 @@
+# ecommerce_scraper/tab_pool.py
+import time
+
+from ecommerce_scraper.pagination import split_pages
+
+
+class Tab:
+    """État d'un onglet: sa plage de pages et la transition ajax en cours"""
+
+    def __init__(self, tab_id, handle, pages):
+        self.id = tab_id
+        self.handle = handle
+        self.pages = pages
+        self.index = 0
+        self.previous = None
+        self.started = 0.0
+        self.done = False
+
+    @property
+    def page(self):
+        return self.pages[self.index]
+
+
+class TabPool:
+    """
+    K onglets d'une seule session Chrome qui se partagent la pagination.
+
+    Un seul processus navigateur au lieu de K: la mémoire reste proche de
+    celle d'un crawl simple. Une session WebDriver n'exécute qu'une commande
+    à la fois, mais les chargements ajax, eux, avancent en parallèle: on
+    clique sur 'Next >' dans un onglet puis on passe à l'onglet suivant pour
+    l'extraire pendant que le premier attend sa grille.
+    """
+
+    def __init__(self, driver, size, waits):
+        """
+        Args:
+            driver: Driver Chrome (session unique partagée par les onglets)
+            size: Nombre d'onglets
+            waits: WaitPolicy utilisée pour détecter les changements de grille
+        """
+        self.driver = driver
+        self.size = max(1, int(size))
+        self.waits = waits
+        self.handles = []
+        self.end_of_pagination = False
+
+    def open(self):
+        """Ouvre les onglets manquants (le premier est la fenêtre courante)"""
+        if not self.handles:
+            self.handles = [self.driver.current_window_handle]
+        while len(self.handles) < self.size:
+            self.driver.switch_to.new_window('tab')
+            self.handles.append(self.driver.current_window_handle)
+        print(f"🗂️ {len(self.handles)} onglet(s) dans un seul navigateur")
+        return self.handles
+
+    def switch(self, tab):
+        """Passe sur l'onglet et l'affiche (rendu et captures à jour)"""
+        if self.driver.current_window_handle != tab.handle:
+            self.driver.switch_to.window(tab.handle)
+            self.driver.execute_cdp_cmd('Page.bringToFront', {})
+
+    def imap_ordered(self, first_page, last_page, open_listing, scrape_page, next_button):
+        """
+        Parcourt les pages en entrelaçant les onglets et renvoie les
+        résultats dans l'ordre des pages.
+
+        Args:
+            open_listing: open_listing(driver, page, prefix) place l'onglet
+                courant sur une page (bloquant, une fois par onglet)
+            scrape_page: scrape_page(page, driver, tab_id) renvoie les items
+            next_button: next_button(driver) lance la navigation ajax suivante
+                et renvoie 'clicked', 'disabled' (dernière page), 'missing'
+                ou 'error'
+
+        Yields:
+            tuple: (page, items) dans l'ordre croissant des pages
+
+        Returns:
+            bool: True si le listing se termine à la dernière page produite
+            (dernière page demandée, ou 'Next >' désactivé dans l'onglet de
+            la dernière plage)
+        """
+        self.open()
+        ranges = split_pages(first_page, last_page, len(self.handles))
+        tabs = [Tab(tab_id, self.handles[tab_id], pages) for tab_id, pages in enumerate(ranges)]
+        owner = {page: tab.id for tab in tabs for page in tab.pages}
+
+        print(f"🧩 Répartition des pages sur {len(tabs)} onglet(s):")
+        for tab in tabs:
+            print(f"   Onglet {tab.id}: pages {tab.pages[0]} → {tab.pages[-1]}")
+            self.switch(tab)
+            try:
+                if not open_listing(self.driver, tab.page, f"[T{tab.id}] "):
+                    tab.done = True
+            except Exception as e:
+                print(f"   ❌ [T{tab.id}] Chargement impossible: {str(e)[:100]}")
+                tab.done = True
+
+        pending = {}
+        next_page = first_page
+        merged = None
+        skipped = False
+        while next_page <= last_page:
+            if next_page in pending:
+                yield next_page, pending.pop(next_page)
+                merged = next_page
+                next_page += 1
+                continue
+            if tabs[owner[next_page]].done:
+                # Onglet arrêté avant cette page: page manquante, sauf après
+                # la fin du listing ('Next >' désactivé dans la dernière plage)
+                if not (self.end_of_pagination and owner[next_page] == tabs[-1].id):
+                    skipped = True
+                next_page += 1
+                continue
+
+            progressed = False
+            for tab in tabs:
+                if tab.done:
+                    continue
+                try:
+                    self.switch(tab)
+                    if tab.previous is not None:
+                        # Transition ajax en cours: on passe à un autre onglet
+                        # tant que la nouvelle grille n'est pas là
+                        elapsed = time.perf_counter() - tab.started
+                        state = self.waits.grid_state(self.driver)
+                        if not self.waits.grid_changed(state, tab.previous):
+                            if elapsed > self.waits.timeout:
+                                self.waits.record("tab_transition", elapsed, timed_out=True)
+                                print(f"   ❌ [T{tab.id}] Timeout sur la page {tab.page}")
+                                tab.done = True
+                            continue
+                        self.waits.record("tab_transition", elapsed)
+                        tab.previous = None
+                    else:
+                        self.waits.wait_for_grid(self.driver)
+
+                    progressed = True
+                    items = scrape_page(tab.page, self.driver, tab.id)
+                    if not items:
+                        tab.done = True
+                        continue
+                    pending[tab.page] = items
+
+                    if tab.index + 1 == len(tab.pages):
+                        tab.done = True
+                        continue
+                    previous = self.waits.grid_state(self.driver)
+                    status = next_button(self.driver)
+                    if status != 'clicked':
+                        # Seul un bouton désactivé dans l'onglet de la dernière
+                        # plage termine le listing; ailleurs c'est une page
+                        # manquante, reprise au prochain crawl
+                        if status == 'disabled' and tab is tabs[-1]:
+                            self.end_of_pagination = True
+                        else:
+                            print(f"   ⚠️ [T{tab.id}] 'Next >' {status} après la page {tab.page}: onglet arrêté")
+                        tab.done = True
+                        continue
+                    tab.index += 1
+                    tab.previous = previous
+                    tab.started = time.perf_counter()
+                except Exception as e:
+                    print(f"   ❌ [T{tab.id}] Erreur critique sur page {tab.page}: {str(e)[:100]}")
+                    tab.done = True
+
+            if not progressed:
+                time.sleep(self.waits.poll_interval)
+
+        if merged is None or skipped:
+            return False
+        return merged == last_page or (self.end_of_pagination and merged == tabs[-1].page)
+
+    def close(self):
+        """Ferme les onglets supplémentaires (la session reste ouverte)"""
+        for handle in self.handles[1:]:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                pass
+        if self.handles:
+            try:
+                self.driver.switch_to.window(self.handles[0])
+            except Exception:
+                pass
+        self.handles = []
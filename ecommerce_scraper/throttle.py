@@ -0,0 +1,186 @@
+# ecommerce_scraper/throttle.py
+from contextlib import contextmanager
+import threading
+import time
+
+# Attentes (WaitPolicy) qui mesurent la latence du site: chargement initial,
+# changement de page ajax, lot ajouté par défilement ou "Load more"
+LATENCY_WAITS = (
+    'initial_load', 'page_transition', 'goto_page', 'tab_transition',
+    'prefetch', 'scroll', 'more',
+)
+
+
+class BrowserThrottle:
+    """
+    Régulation du chemin Selenium sur la latence mesurée (AutoThrottle ne
+    voit pas le trafic du navigateur)
+
+    Chaque attente de LATENCY_WAITS donne un échantillon de latence, lissé
+    (moyenne mobile exponentielle) et comparé à `target`:
+
+    - plus lent que la cible: délai entre actions augmenté d'un pas, et un
+      navigateur de moins au travail si la latence dépasse 2x la cible;
+    - erreur ou timeout: délai doublé et un navigateur de moins (backoff);
+    - plus rapide: délai réduit de 25 %, et un navigateur de plus après
+      `patience` échantillons rapides consécutifs.
+
+    Les navigateurs du pool prennent un créneau (slot()) pour chaque étape:
+    au plus `concurrency` travaillent en même temps, les autres attendent.
+    Les décisions sont comptées pour les stats Scrapy (summary()).
+    """
+
+    def __init__(self, target=1.0, min_delay=0.0, max_delay=10.0, step=0.25,
+                 max_concurrency=1, min_concurrency=1, patience=3, smoothing=0.3):
+        """
+        Args:
+            target: Latence visée par transition (s)
+            min_delay: Délai minimal entre deux actions de navigation (s)
+            max_delay: Délai maximal (s)
+            step: Pas d'augmentation du délai quand le site ralentit (s)
+            max_concurrency: Navigateurs au travail au maximum (taille du pool)
+            min_concurrency: Navigateurs au travail au minimum
+            patience: Échantillons rapides consécutifs avant d'ajouter un navigateur
+            smoothing: Poids d'un nouvel échantillon dans la moyenne lissée
+        """
+        self.target = target
+        self.min_delay = min_delay
+        self.max_delay = max(max_delay, min_delay)
+        self.step = step
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = max(1, min(int(min_concurrency), self.max_concurrency))
+        self.patience = max(1, int(patience))
+        self.smoothing = smoothing
+
+        self.delay = min_delay
+        self.concurrency = self.max_concurrency
+        self.latency = None
+        self.fast_streak = 0
+        self.active = 0
+        self.condition = threading.Condition()
+
+        self.samples = 0
+        self.latency_total = 0.0
+        self.decisions = {'slowdowns': 0, 'backoffs': 0, 'speedups': 0,
+                          'workers_removed': 0, 'workers_added': 0}
+        self.errors = 0
+        self.paused_time = 0.0
+        self.slot_wait_time = 0.0
+        self.lowest_concurrency = self.concurrency
+        self.highest_delay = self.delay
+
+    @classmethod
+    def from_settings(cls, settings, max_concurrency=1):
+        return cls(
+            target=settings.getfloat('BROWSER_THROTTLE_TARGET_LATENCY', 1.0),
+            min_delay=settings.getfloat('BROWSER_THROTTLE_MIN_DELAY', 0.0),
+            max_delay=settings.getfloat('BROWSER_THROTTLE_MAX_DELAY', 10.0),
+            step=settings.getfloat('BROWSER_THROTTLE_STEP', 0.25),
+            max_concurrency=max_concurrency,
+            min_concurrency=settings.getint('BROWSER_THROTTLE_MIN_CONCURRENCY', 1),
+            patience=settings.getint('BROWSER_THROTTLE_PATIENCE', 3),
+        )
+
+    def on_wait(self, name, elapsed, timed_out=False):
+        """Écouteur de WaitPolicy.record: seules les attentes de LATENCY_WAITS comptent"""
+        if name not in LATENCY_WAITS:
+            return
+        if timed_out:
+            self.record_error()
+        else:
+            self.record_latency(elapsed)
+
+    def record_latency(self, elapsed):
+        """Ajoute un échantillon de latence et ajuste délai et concurrence"""
+        with self.condition:
+            self.samples += 1
+            self.latency_total += elapsed
+            if self.latency is None:
+                self.latency = elapsed
+            else:
+                self.latency += self.smoothing * (elapsed - self.latency)
+
+            if self.latency > self.target:
+                self.fast_streak = 0
+                self.decisions['slowdowns'] += 1
+                self.set_delay(self.delay + self.step)
+                if self.latency > 2 * self.target:
+                    self.set_concurrency(self.concurrency - 1)
+            else:
+                self.fast_streak += 1
+                if self.delay > self.min_delay:
+                    self.decisions['speedups'] += 1
+                    self.set_delay(self.delay * 0.75)
+                if self.fast_streak >= self.patience:
+                    self.fast_streak = 0
+                    self.set_concurrency(self.concurrency + 1)
+
+    def record_error(self):
+        """Erreur ou timeout du navigateur: backoff immédiat"""
+        with self.condition:
+            self.errors += 1
+            self.fast_streak = 0
+            self.decisions['backoffs'] += 1
+            self.set_delay(max(self.delay * 2, self.step))
+            self.set_concurrency(self.concurrency - 1)
+
+    def set_delay(self, delay):
+        delay = min(self.max_delay, max(self.min_delay, delay))
+        # Sous 1 ms, le délai est nul (pas de sleep inutile)
+        self.delay = delay if delay >= 0.001 else 0.0
+        self.highest_delay = max(self.highest_delay, self.delay)
+
+    def set_concurrency(self, concurrency):
+        concurrency = min(self.max_concurrency, max(self.min_concurrency, concurrency))
+        if concurrency < self.concurrency:
+            self.decisions['workers_removed'] += 1
+        elif concurrency > self.concurrency:
+            self.decisions['workers_added'] += 1
+            self.condition.notify_all()
+        self.concurrency = concurrency
+        self.lowest_concurrency = min(self.lowest_concurrency, concurrency)
+
+    def pause(self):
+        """Délai courant avant une action de navigation (clic, défilement, URL)"""
+        delay = self.delay
+        if delay > 0:
+            time.sleep(delay)
+            with self.condition:
+                self.paused_time += delay
+
+    @contextmanager
+    def slot(self):
+        """Créneau de travail d'un navigateur: attend tant que `concurrency` sont occupés"""
+        started = time.perf_counter()
+        with self.condition:
+            while self.active >= self.concurrency:
+                self.condition.wait()
+            self.active += 1
+            self.slot_wait_time += time.perf_counter() - started
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.active -= 1
+                self.condition.notify_all()
+
+    def summary(self):
+        """
+        Returns:
+            dict: latences (moyenne, lissée), délai et concurrence finaux,
+            extrêmes atteints, décisions, erreurs et temps d'attente
+        """
+        with self.condition:
+            return {
+                'samples': self.samples,
+                'latency_avg_ms': self.latency_total / self.samples * 1000 if self.samples else 0.0,
+                'latency_ewma_ms': (self.latency or 0.0) * 1000,
+                'delay_ms': self.delay * 1000,
+                'max_delay_ms': self.highest_delay * 1000,
+                'concurrency': self.concurrency,
+                'min_concurrency': self.lowest_concurrency,
+                'errors': self.errors,
+                'paused_s': self.paused_time,
+                'slot_wait_s': self.slot_wait_time,
+                **self.decisions,
+            }
@@ -0,0 +1,216 @@
+# ecommerce_scraper/waits.py
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+import threading
+import time
+
+# Installe (une fois par document) un compteur de requêtes XHR/fetch en cours
+# et un MutationObserver, puis renvoie l'état de la grille de produits
+GRID_STATE_JS = """
+if (!window.__waitHooks) {
+    var hooks = window.__waitHooks = {pending: 0, mutations: 0, lastMutation: performance.now()};
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        hooks.pending++;
+        this.addEventListener('loadend', function () { hooks.pending--; });
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            hooks.pending++;
+            return originalFetch.apply(this, arguments).finally(function () { hooks.pending--; });
+        };
+    }
+    new MutationObserver(function () {
+        hooks.mutations++;
+        hooks.lastMutation = performance.now();
+    }).observe(document.body, {childList: true, subtree: true});
+}
+var hooks = window.__waitHooks;
+var first = document.querySelector('.thumbnail .title');
+return {
+    ready: document.readyState === 'complete',
+    count: document.querySelectorAll('.thumbnail').length,
+    first: first ? (first.href || first.textContent) : '',
+    pending: hooks.pending,
+    mutations: hooks.mutations,
+    quiet_ms: performance.now() - hooks.lastMutation
+};
+"""
+
+# Attend deux frames d'animation: le layout et le rendu sont à jour
+NEXT_PAINT_JS = """
+var done = arguments[arguments.length - 1];
+requestAnimationFrame(function () { requestAnimationFrame(function () { done(true); }); });
+"""
+
+# Recharge les images bloquées et indique si toutes sont décodées
+IMAGES_STATE_JS = """
+var images = Array.from(document.images);
+if (arguments[0]) {
+    images.forEach(function (img) {
+        if (img.src && (!img.complete || img.naturalWidth === 0)) { img.src = img.src; }
+    });
+}
+return images.every(function (img) { return img.complete; });
+"""
+
+
+class WaitPolicy:
+    """
+    Attentes événementielles qui remplacent les time.sleep fixes.
+
+    Chaque attente rend la main dès que sa condition est vraie (grille
+    présente, grille remplacée et réseau au repos, rendu effectué) et son
+    temps est enregistré sous un nom pour les statistiques de fin de crawl.
+    """
+
+    def __init__(self, timeout=20, poll_interval=0.05, quiet_period=0.1):
+        """
+        Args:
+            timeout: Délai maximal d'une attente (s)
+            poll_interval: Intervalle entre deux vérifications (s)
+            quiet_period: Durée sans mutation DOM exigée avant de valider
+                un changement de grille (s)
+        """
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.quiet_period = quiet_period
+        self.timings = {}
+        self.timeouts = {}
+        self.lock = threading.Lock()
+        # Fonctions listener(name, elapsed, timed_out) appelées à chaque
+        # attente chronométrée (ex: BrowserThrottle.on_wait)
+        self.listeners = []
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(
+            timeout=settings.getfloat('WAIT_TIMEOUT', 20),
+            poll_interval=settings.getfloat('WAIT_POLL_INTERVAL', 0.05),
+            quiet_period=settings.getfloat('WAIT_QUIET_PERIOD', 0.1),
+        )
+
+    def record(self, name, elapsed, timed_out=False):
+        with self.lock:
+            self.timings.setdefault(name, []).append(elapsed)
+            if timed_out:
+                self.timeouts[name] = self.timeouts.get(name, 0) + 1
+        for listener in self.listeners:
+            listener(name, elapsed, timed_out)
+
+    def until(self, driver, condition, name, timeout=None):
+        """
+        Attend que condition(driver) soit vraie et chronomètre l'attente
+
+        Raises:
+            TimeoutException: si la condition reste fausse après le délai
+        """
+        started = time.perf_counter()
+        try:
+            result = WebDriverWait(
+                driver, timeout or self.timeout, poll_frequency=self.poll_interval
+            ).until(condition)
+        except TimeoutException:
+            self.record(name, time.perf_counter() - started, timed_out=True)
+            raise
+        self.record(name, time.perf_counter() - started)
+        return result
+
+    def grid_state(self, driver):
+        """État courant de la grille (nombre, premier lien, réseau, mutations)"""
+        return driver.execute_script(GRID_STATE_JS)
+
+    def wait_for_grid(self, driver, name="grid_ready"):
+        """Attend que la grille soit chargée et que le réseau soit au repos"""
+        def grid_ready(driver):
+            state = self.grid_state(driver)
+            if state['ready'] and state['count'] > 0 and state['pending'] == 0:
+                return state
+            return False
+
+        return self.until(driver, grid_ready, name)
+
+    def wait_for_grid_change(self, driver, previous, name="page_transition"):
+        """
+        Attend que la grille ait été remplacée après une navigation ajax
+
+        Args:
+            previous: État renvoyé par grid_state() avant le clic
+        """
+        def grid_changed(driver):
+            state = self.grid_state(driver)
+            return state if self.grid_changed(state, previous) else False
+
+        return self.until(driver, grid_changed, name)
+
+    def grid_changed(self, state, previous):
+        """Vrai si la grille `state` a remplacé `previous` et que la page est au repos"""
+        return (state['count'] > 0
+                and state['first'] != previous['first']
+                and state['pending'] == 0
+                and state['quiet_ms'] >= self.quiet_period * 1000)
+
+    def wait_for_more(self, driver, previous_count, name="load_more", idle=1.0):
+        """
+        Attend que des produits s'ajoutent à la grille (défilement, "More")
+
+        Args:
+            previous_count: Nombre de produits avant le chargement
+            idle: Durée sans requête ni mutation au bout de laquelle on
+                considère qu'il n'y a plus rien à charger (s)
+
+        La sortie sur inactivité dure au moins `idle`: elle est enregistrée
+        sous "<name>_idle" pour ne pas compter comme une latence du site
+        (BrowserThrottle ne suit que `name`).
+
+        Returns:
+            bool: True si la grille a grossi, False si le listing est terminé
+        """
+        started = time.perf_counter()
+
+        def grown_or_idle(driver):
+            state = self.grid_state(driver)
+            if state['pending'] or state['quiet_ms'] < self.quiet_period * 1000:
+                return False
+            if state['count'] > previous_count:
+                return 'grown'
+            if time.perf_counter() - started >= idle and state['quiet_ms'] >= idle * 1000:
+                return 'idle'
+            return False
+
+        try:
+            result = WebDriverWait(
+                driver, self.timeout, poll_frequency=self.poll_interval
+            ).until(grown_or_idle)
+        except TimeoutException:
+            self.record(name, time.perf_counter() - started, timed_out=True)
+            raise
+        self.record(name if result == 'grown' else f"{name}_idle", time.perf_counter() - started)
+        return result == 'grown'
+
+    def wait_for_paint(self, driver, name="paint"):
+        """Attend que le navigateur ait appliqué le dernier scroll/redimensionnement"""
+        started = time.perf_counter()
+        driver.set_script_timeout(self.timeout)
+        driver.execute_async_script(NEXT_PAINT_JS)
+        self.record(name, time.perf_counter() - started)
+
+    def wait_for_images(self, driver, name="images_loaded"):
+        """Recharge les images bloquées puis attend qu'elles soient toutes chargées"""
+        driver.execute_script(IMAGES_STATE_JS, True)
+        return self.until(driver, lambda driver: driver.execute_script(IMAGES_STATE_JS, False), name)
+
+    def summary(self):
+        """Statistiques par type d'attente: nombre, moyenne, max, timeouts"""
+        with self.lock:
+            return {
+                name: {
+                    'count': len(values),
+                    'avg_ms': sum(values) / len(values) * 1000,
+                    'max_ms': max(values) * 1000,
+                    'timeouts': self.timeouts.get(name, 0),
+                }
+                for name, values in self.timings.items()
+            }
@@ -0,0 +1,7 @@
+# tests/conftest.py
+"""Tests unitaires (pytest), lancés depuis la racine du dépôt: python -m pytest -q"""
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
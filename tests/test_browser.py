@@ -0,0 +1,83 @@
+# tests/test_browser.py
+import json
+
+from ecommerce_scraper import browser
+from ecommerce_scraper.browser import close_driver, resolve_browser_paths
+from ecommerce_scraper.spiders import laptops
+from ecommerce_scraper.spiders.laptops import LaptopsSpider
+
+
+class FakeService:
+    def __init__(self):
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeDriver:
+    def __init__(self, debugger_address=None):
+        self.attached = debugger_address is not None
+        self.startup_mode = 'attached' if self.attached else 'cold'
+        self.startup_time = 0.01
+        self.service = FakeService()
+        self.quitted = False
+
+    def quit(self):
+        self.quitted = True
+
+
+def cached_paths(tmp_path):
+    chrome = tmp_path / "chrome"
+    chromedriver = tmp_path / "chromedriver"
+    chrome.write_text("")
+    chromedriver.write_text("")
+    cache = tmp_path / ".browser_paths.json"
+    cache.write_text(json.dumps({'chrome_binary': str(chrome), 'chromedriver_path': str(chromedriver)}))
+    return cache, str(chrome), str(chromedriver)
+
+
+def no_lookup():
+    raise AssertionError("chemins recherchés malgré le cache")
+
+
+def test_cached_paths_skip_the_lookup(tmp_path, monkeypatch):
+    cache, chrome, chromedriver = cached_paths(tmp_path)
+    monkeypatch.setattr(browser, 'find_chrome_binary', no_lookup)
+
+    assert resolve_browser_paths(cache) == {'chrome_binary': chrome, 'chromedriver_path': chromedriver}
+
+
+def test_warm_start_attaches_once_with_cached_paths(tmp_path, monkeypatch):
+    cache, chrome, chromedriver = cached_paths(tmp_path)
+    monkeypatch.setattr(browser, 'find_chrome_binary', no_lookup)
+    launches = []
+
+    def create_driver(**options):
+        launches.append(options)
+        return FakeDriver(options.get('debugger_address'))
+
+    monkeypatch.setattr(laptops, 'create_driver', create_driver)
+    spider = LaptopsSpider(output_dir=str(tmp_path))
+    spider.browser_options = {'profile': 'lean', 'headless': True, 'blocked_patterns': []}
+    spider.path_cache = str(cache)
+    spider.debugger_address = "127.0.0.1:9222"
+
+    driver = spider.start_browser()
+
+    assert spider.start_browser() is driver
+    assert len(launches) == 1
+    assert launches[0]['debugger_address'] == "127.0.0.1:9222"
+    assert launches[0]['chrome_binary'] == chrome
+    assert launches[0]['chromedriver_path'] == chromedriver
+    assert [mode for mode, _ in spider.startup_timings] == ['attached']
+
+
+def test_attached_driver_leaves_chrome_running():
+    attached, launched = FakeDriver("127.0.0.1:9222"), FakeDriver()
+
+    close_driver(attached)
+    close_driver(launched)
+
+    assert attached.service.stopped and not attached.quitted
+    assert launched.quitted
@@ -0,0 +1,80 @@
+# tests/test_browser_pool.py
+import threading
+
+from ecommerce_scraper.browser_pool import BrowserPool
+from ecommerce_scraper.spiders.laptops import next_page
+
+
+class FakeDriver:
+    """Driver factice: enregistre sa fermeture"""
+
+    def __init__(self, name, closed):
+        self.name = name
+        self.closed = closed
+
+    def quit(self):
+        self.closed.append(self.name)
+
+
+def crawl_range(driver, pages, worker_id):
+    """Plage complète; le listing se termine à la page 6"""
+    for page in pages:
+        yield page, [{'page': page, 'worker': worker_id}]
+    return pages[-1] == 6
+
+
+def drain(pages):
+    produced = []
+    while True:
+        result, end = next_page(pages)
+        if result is None:
+            return produced, end
+        produced.append(result[0])
+
+
+def test_pages_merged_in_order_with_end_of_listing():
+    pool = BrowserPool(2, None, drivers=['driver-0', 'driver-1'])
+
+    produced, end = drain(pool.imap_ordered(1, 6, crawl_range))
+
+    assert produced == [1, 2, 3, 4, 5, 6]
+    assert end
+
+
+def test_failed_worker_is_not_the_end_of_listing():
+    def failing_range(driver, pages, worker_id):
+        for page in pages:
+            if page == 5:
+                raise RuntimeError("navigateur planté")
+            yield page, []
+        return True
+
+    pool = BrowserPool(2, None, drivers=['driver-0', 'driver-1'])
+
+    produced, end = drain(pool.imap_ordered(1, 6, failing_range))
+
+    assert produced == [1, 2, 3, 4]
+    assert not end
+
+
+def test_abandoned_generator_leaves_the_join_to_close():
+    release = threading.Event()
+    closed = []
+
+    def slow_range(driver, pages, worker_id):
+        for page in pages:
+            yield page, []
+            release.wait(5)
+
+    pool = BrowserPool(2, None, drivers=[FakeDriver('driver-0', closed), FakeDriver('driver-1', closed)])
+    pages = pool.imap_ordered(1, 6, slow_range)
+    assert next(pages)[0] == 1
+    # Fermeture du générateur (consommateur arrêté sur une page manquante):
+    # les workers encore occupés ne sont pas attendus ici
+    pages.close()
+    assert any(thread.is_alive() for thread in pool.threads)
+
+    release.set()
+    pool.close()
+    assert pool.threads == []
+    assert closed == ['driver-0', 'driver-1']
@@ -0,0 +1,87 @@
+# tests/test_csv_writer.py
+import csv
+
+import pytest
+
+from ecommerce_scraper.csv_writer import DurableCsvWriter
+
+FIELDS = ['page', 'title', 'price']
+
+
+def rows(count, start=0):
+    return [{'page': index // 6 + 1, 'title': f"Laptop {index}", 'price': f"{100 + index}.99"}
+            for index in range(start, start + count)]
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def crash(writer):
+    """Simule un crash: rien n'est fermé ni validé, seul le journal est sur disque"""
+    writer.file.flush()
+
+
+def test_batch_commit_writes_header_and_rows(tmp_path):
+    path = tmp_path / "out.csv"
+    writer = DurableCsvWriter(path, FIELDS, batch_rows=4, batch_interval=0)
+    for row in rows(10):
+        writer.writerow(row)
+    writer.close()
+
+    assert [row['title'] for row in read_rows(path)] == [f"Laptop {index}" for index in range(10)]
+    # 10 lignes par lots de 4: deux lots pleins + le reste à la fermeture
+    assert writer.stats['commits'] == 3
+    assert not writer.journal_path.exists()
+
+
+def test_recover_replays_uncommitted_batch(tmp_path):
+    path = tmp_path / "out.csv"
+    writer = DurableCsvWriter(path, FIELDS, batch_rows=4, batch_interval=0)
+    for row in rows(10):
+        writer.writerow(row)
+    crash(writer)
+    # Seuls les deux lots validés sont dans le CSV, les 2 lignes suivantes au journal
+    assert len(read_rows(path)) == 8
+    assert writer.journal_path.exists()
+
+    reopened = DurableCsvWriter(path, FIELDS, append=True, batch_rows=4, batch_interval=0)
+    for row in rows(2, start=10):
+        reopened.writerow(row)
+    reopened.close()
+
+    assert [row['title'] for row in read_rows(path)] == [f"Laptop {index}" for index in range(12)]
+    assert not reopened.journal_path.exists()
+
+
+def test_recover_truncates_torn_write(tmp_path):
+    path = tmp_path / "out.csv"
+    writer = DurableCsvWriter(path, FIELDS, batch_rows=4, batch_interval=0)
+    for row in rows(6):
+        writer.writerow(row)
+    crash(writer)
+    # Écriture interrompue après le dernier commit: fin de ligne à moitié écrite
+    with open(path, 'ab') as f:
+        f.write(b'2,Laptop 4,10')
+
+    DurableCsvWriter(path, FIELDS, append=True).close()
+
+    assert [row['title'] for row in read_rows(path)] == [f"Laptop {index}" for index in range(6)]
+
+
+def test_recover_after_clean_commit_keeps_rows_once(tmp_path):
+    path = tmp_path / "out.csv"
+    writer = DurableCsvWriter(path, FIELDS, batch_rows=4, batch_interval=0)
+    for row in rows(8):
+        writer.writerow(row)
+    crash(writer)
+    # Lot validé: le journal est vide, rien à rejouer
+    DurableCsvWriter(path, FIELDS, append=True).close()
+
+    assert len(read_rows(path)) == 8
+
+
+def test_unknown_durability_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match='sometimes'):
+        DurableCsvWriter(tmp_path / "out.csv", FIELDS, durability='sometimes')
@@ -0,0 +1,50 @@
+# tests/test_history.py
+from ecommerce_scraper.history import PriceHistory
+from ecommerce_scraper.spiders.laptops import LaptopsSpider
+from ecommerce_scraper.spiders.laptops_http import LaptopsHttpSpider
+
+
+def observations(*prices):
+    return [{'page': 1, 'link': f"/product/{index}", 'title': f"Laptop {index}", 'price': price,
+             'reviews': 1, 'rating': 5} for index, price in enumerate(prices)]
+
+
+def test_interrupted_run_is_abandoned_by_the_next_run(tmp_path):
+    history = PriceHistory(tmp_path / "history.sqlite")
+    first = history.start_run('laptops', 'laptops')
+    history.record(first, observations(100.0, 200.0))
+    history.finish_run(first)
+    # Crawl interrompu, relancé sans reprise
+    interrupted = history.start_run('laptops', 'laptops')
+    history.record(interrupted, observations(100.0))
+    latest = history.start_run('laptops', 'laptops')
+    history.record(latest, observations(150.0, 200.0))
+    history.finish_run(latest)
+
+    statuses = {run['id']: run['status'] for run in history.runs()}
+    assert statuses == {first: 'finished', interrupted: 'abandoned', latest: 'finished'}
+    assert history.latest_runs('laptops') == (latest, first)
+    assert [row['status'] for row in history.changes('laptops')] == ['changed']
+    history.close()
+
+
+def test_resume_reuses_the_open_run(tmp_path):
+    history = PriceHistory(tmp_path / "history.sqlite")
+    run_id = history.start_run('laptops', 'laptops')
+    history.record(run_id, observations(100.0) + [dict(observations(1.0)[0], page=2, link="/product/9")])
+
+    assert history.start_run('laptops', 'laptops', resume_page=1) == run_id
+    # Observations des pages après le checkpoint supprimées
+    assert [row['page'] for row in history.price_history("/product/9")] == []
+    assert history.runs()[0]['status'] == 'running'
+    history.close()
+
+
+def test_http_spider_has_its_own_history_partition(tmp_path):
+    selenium = LaptopsSpider(output_dir=str(tmp_path))
+    http = LaptopsHttpSpider(output_dir=str(tmp_path))
+    static = LaptopsHttpSpider(output_dir=str(tmp_path), variant='static')
+
+    assert selenium.history_partition == "laptops"
+    assert http.history_partition == "laptops_http"
+    assert static.history_partition == "laptops_static_http"
@@ -0,0 +1,84 @@
+# tests/test_id_range.py
+from ecommerce_scraper.id_range import IdSweep
+
+
+def run_sweep(sweep, existing, order=list):
+    """
+    Fait tourner un balayage: `order` choisit l'ordre d'arrivée des réponses
+    de chaque vague (list: dans l'ordre, reversed: à l'envers)
+
+    Returns:
+        list: Identifiants demandés, dans l'ordre des demandes
+    """
+    requested = []
+    while not sweep.finished:
+        wave = sweep.take()
+        assert wave, "balayage bloqué: fenêtre vide sans être terminé"
+        requested += wave
+        for product_id in order(wave):
+            sweep.resolve(product_id, product_id in existing)
+    return requested
+
+
+def test_stops_after_max_misses_upwards():
+    existing = set(range(10, 31))
+    sweep = IdSweep(10, step=1, max_misses=5, window=4)
+    requested = run_sweep(sweep, existing)
+
+    assert sweep.found == 21
+    assert sweep.last_found == 30
+    # Au plus `window` identifiants demandés au-delà de la série d'absences
+    assert max(requested) <= 30 + 5 + 4
+
+
+def test_gap_shorter_than_window_does_not_stop_sweep():
+    # Trou de 4 identifiants (31..34) avec max_misses=5: le balayage continue
+    existing = set(range(10, 31)) | set(range(35, 41))
+    sweep = IdSweep(10, step=1, max_misses=5, window=8)
+    run_sweep(sweep, existing)
+
+    assert sweep.found == 27
+    assert sweep.last_found == 40
+
+
+def test_misses_are_counted_in_id_order_not_arrival_order():
+    # Réponses à l'envers: les absences de fin de vague arrivent avant le
+    # produit trouvé qui les précède, sans terminer le balayage
+    existing = set(range(1, 13)) | {20}
+    sweep = IdSweep(1, step=1, max_misses=7, window=8)
+    run_sweep(sweep, existing, order=reversed)
+
+    assert sweep.found == 13
+    assert sweep.last_found == 20
+
+
+def test_window_caps_requests_ahead_of_checked_results():
+    sweep = IdSweep(1, step=1, max_misses=3, window=4)
+    first = sweep.take()
+    assert first == [1, 2, 3, 4]
+    # Fenêtre pleine tant qu'aucune réponse n'est arrivée
+    assert sweep.take() == []
+    # Une réponse hors ordre (4) ne fait pas avancer la fenêtre: 1 manque encore
+    sweep.resolve(4, True)
+    assert sweep.take() == []
+    sweep.resolve(1, True)
+    assert sweep.take() == [5]
+
+
+def test_known_range_ignores_misses():
+    existing = {5, 6, 15}
+    sweep = IdSweep(5, step=1, max_misses=2, stop=15, window=3)
+    requested = run_sweep(sweep, existing)
+
+    assert requested == list(range(5, 16))
+    assert sweep.found == 3
+
+
+def test_downward_sweep_stops_at_first_id():
+    existing = set(range(1, 8))
+    sweep = IdSweep(7, step=-1, max_misses=3, window=4)
+    requested = run_sweep(sweep, existing)
+
+    assert min(requested) == 1
+    assert sweep.found == 7
+    assert sweep.last_found == 1
@@ -0,0 +1,62 @@
+# tests/test_items.py
+import math
+
+from ecommerce_scraper.enrichment import listing_key
+from ecommerce_scraper.extraction import build_item
+from ecommerce_scraper.items import format_price, normalize_item
+from ecommerce_scraper.pipelines import EcommerceScraperPipeline
+
+
+def product(price="$1,295.99", reviews="12 reviews", rating=4):
+    return build_item(1, "Laptop", price, "desc", reviews, rating, "/product/1")
+
+
+def test_normalize_item_types_numeric_fields():
+    row = normalize_item(product())
+
+    assert row['price'] == 1295.99
+    assert row['reviews'] == 12
+    assert row['rating'] == 4
+    assert row['invalid'] == ""
+
+
+def test_normalize_item_flags_unreadable_values():
+    row = normalize_item(product(price="N/A", reviews="many"))
+
+    assert row['price'] is None and row['reviews'] is None
+    assert row['rating'] == 4
+    assert row['invalid'] == "price|reviews"
+
+
+def test_normalize_item_rejects_out_of_range_values():
+    assert normalize_item(dict(product(), rating=9))['invalid'] == "rating"
+    assert normalize_item(dict(product(), price="-3"))['invalid'] == "price"
+    assert normalize_item(dict(product(), price=math.inf))['invalid'] == "price"
+    # Un nombre d'avis décimal n'est pas tronqué
+    row = normalize_item(dict(product(), reviews="4.7"))
+    assert row['reviews'] is None and row['invalid'] == "reviews"
+
+
+def test_normalize_item_accepts_typed_rows():
+    row = normalize_item(normalize_item(product(price="$10.50", reviews="3 reviews")))
+    assert row['price'] == 10.5 and row['reviews'] == 3 and row['invalid'] == ""
+
+
+def test_pipeline_types_a_copy_and_keeps_listing_key():
+    item = product(price="$299")
+    key = listing_key(item)
+    rows = []
+    pipeline = EcommerceScraperPipeline(sinks=())
+    pipeline.writers = [type("Writer", (), {'put': lambda self, row: rows.append(row)})()]
+
+    pipeline.process_item(item, spider=None)
+
+    assert rows[0]['price'] == 299.0
+    # L'item du spider garde ses textes: le cache des pages produit reste valable
+    assert item['price'] == "299" and listing_key(item) == key
+
+
+def test_format_price_matches_csv_text():
+    assert format_price(299.0) == "299"
+    assert format_price(1295.99) == "1295.99"
+    assert format_price(None) == ""
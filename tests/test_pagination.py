@@ -0,0 +1,84 @@
+# tests/test_pagination.py
+from scrapy.selector import Selector
+
+from ecommerce_scraper.pagination import PaginationPlan
+from ecommerce_scraper.pagination_strategies import create_strategy
+from ecommerce_scraper.waits import WaitPolicy
+
+PAGINATION_HTML = """
+<ul class="pagination">
+  <button class="btn page-link prev" disabled>&lt; Prev</button>
+  <button class="btn page-link">1</button>
+  <button class="btn page-link">2</button>
+  <button class="btn page-link">20</button>
+  <button class="btn page-link next">Next &gt;</button>
+</ul>
+"""
+
+
+def test_plan_reads_total_pages_and_selectors():
+    plan = PaginationPlan.from_selector(Selector(text=PAGINATION_HTML))
+
+    assert plan.total_pages == 20
+    assert plan.next_selector == ".pagination button.next"
+    assert plan.page_selector == ".pagination button.btn"
+
+
+def test_plan_without_pagination_is_none():
+    assert PaginationPlan.from_selector(Selector(text="<div>no pages</div>")) is None
+
+
+def test_plan_pages_and_split():
+    plan = PaginationPlan(20)
+
+    assert plan.pages(18) == [18, 19, 20]
+    assert plan.pages(1, max_pages=3) == [1, 2, 3]
+    ranges = plan.split(3, max_pages=10)
+    assert ranges == [[1, 2, 3, 4], [5, 6, 7], [8, 9, 10]]
+
+
+def test_plan_copy_is_independent():
+    plan = PaginationPlan(20, ".pagination button.next", ".pagination button.btn")
+    copy = plan.copy()
+    copy.total_pages = 3
+
+    assert copy.to_dict() != plan.to_dict()
+    assert plan.total_pages == 20
+
+
+def test_worker_strategy_has_own_plan_and_shared_stats():
+    strategy = create_strategy('buttons', "http://localhost/ajax", WaitPolicy())
+    strategy.plan = PaginationPlan(20, ".pagination button.next")
+    worker = strategy.for_worker()
+    worker.next = lambda driver, page_number: True
+
+    assert worker.plan is not strategy.plan
+    assert worker.plan.to_dict() == strategy.plan.to_dict()
+    worker.advance(None, 2)
+    worker.record_products(6)
+    strategy.record_products(6)
+    summary = strategy.summary()
+    assert summary['steps'] == 1
+    assert summary['products'] == 12
+
+
+class GrowingGrid:
+    """Faux driver: la grille passe par les états donnés puis reste sur le dernier"""
+
+    def __init__(self, *counts):
+        self.counts = list(counts)
+
+    def execute_script(self, script, *args):
+        count = self.counts.pop(0) if len(self.counts) > 1 else self.counts[0]
+        return {'ready': True, 'count': count, 'first': 'a', 'pending': 0,
+                'mutations': 0, 'quiet_ms': 5000}
+
+
+def test_wait_for_more_keeps_idle_tail_out_of_latency_samples():
+    waits = WaitPolicy(timeout=5, poll_interval=0.01, quiet_period=0)
+    samples = []
+    waits.listeners.append(lambda name, elapsed, timed_out: samples.append(name))
+
+    assert waits.wait_for_more(GrowingGrid(6, 12), 6, name="scroll", idle=0.05)
+    assert not waits.wait_for_more(GrowingGrid(12), 12, name="scroll", idle=0.05)
+    assert samples == ["scroll", "scroll_idle"]
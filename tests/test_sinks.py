@@ -0,0 +1,132 @@
+# tests/test_sinks.py
+import threading
+import time
+
+from ecommerce_scraper.history import PriceHistory
+from ecommerce_scraper.sinks import HistorySink, SinkWriter
+
+
+class MemorySink:
+    """Sink de test: garde les lignes et l'ordre des appels"""
+    name = 'memory'
+    path = 'memory'
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.rows = []
+        self.committed = 0
+        self.events = []
+
+    def open(self, resume_page=None):
+        self.events.append('open')
+
+    def write(self, rows):
+        time.sleep(self.delay)
+        self.rows += rows
+
+    def commit(self):
+        self.committed = len(self.rows)
+        self.events.append('commit')
+
+    def sync(self):
+        self.commit()
+
+    def close(self):
+        self.events.append('close')
+
+
+class ManualReactor:
+    """notify() du SinkWriter: les drains sont exécutés quand le test le décide"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def notify(self, function):
+        with self.lock:
+            self.calls.append(function)
+
+    def run_pending(self):
+        with self.lock:
+            calls, self.calls = self.calls, []
+        for function in calls:
+            function()
+
+
+def row(index, page=1):
+    return {'page': page, 'link': f"/product/{index}", 'title': f"Laptop {index}",
+            'price': 100.0 + index, 'reviews': 1, 'rating': 5}
+
+
+def test_barrier_fires_after_previous_rows_are_committed():
+    sink = MemorySink()
+    writer = SinkWriter(sink, batch_size=3, commit_interval=10)
+    writer.start()
+    reached = threading.Event()
+    seen = []
+    for index in range(7):
+        writer.put(row(index))
+    writer.barrier(lambda: (seen.append(sink.committed), reached.set()))
+    writer.put(row(7))
+
+    assert reached.wait(5)
+    writer.close()
+    # Toutes les lignes reçues avant la barrière étaient validées, pas la suivante
+    assert seen == [7]
+    assert len(sink.rows) == 8 and sink.events[-1] == 'close'
+
+
+def test_full_queue_returns_deferred_instead_of_blocking():
+    sink = MemorySink(delay=0.005)
+    reactor = ManualReactor()
+    writer = SinkWriter(sink, batch_size=2, queue_size=3, commit_interval=0.05, notify=reactor.notify)
+    writer.start()
+
+    started = time.perf_counter()
+    waits = [writer.put(row(index)) for index in range(30)]
+    assert time.perf_counter() - started < 0.5
+    assert waits[0] is None
+    pending = [wait for wait in waits if wait is not None]
+    assert pending
+
+    fired = []
+    pending[-1].addCallback(fired.append)
+    deadline = time.time() + 5
+    while writer.overflow and time.time() < deadline:
+        reactor.run_pending()
+        time.sleep(0.01)
+    writer.close()
+
+    assert fired == [None]
+    assert [item['link'] for item in sink.rows] == [f"/product/{index}" for index in range(30)]
+
+
+def test_history_records_each_page_once(tmp_path, monkeypatch):
+    recorded = []
+    record = PriceHistory.record
+
+    def spy(self, run_id, rows):
+        recorded.append(sorted({item['page'] for item in rows}) + [len(rows)])
+        return record(self, run_id, rows)
+
+    monkeypatch.setattr(PriceHistory, 'record', spy)
+    sink = HistorySink(tmp_path / "history.sqlite")
+    sink.open()
+    # Lots du SinkWriter à cheval sur deux pages
+    sink.write([row(index, page=1) for index in range(4)])
+    sink.commit()
+    sink.write([row(index, page=1) for index in range(4, 6)] + [row(index, page=2) for index in range(6, 8)])
+    sink.commit()
+    assert recorded == []
+    # Page 1 complète (plus rien reçu depuis le commit précédent)
+    sink.write([row(index, page=2) for index in range(8, 12)])
+    sink.commit()
+    assert recorded == [[1, 6]]
+    # Barrière: la page 2 est enregistrée
+    sink.sync()
+    sink.close()
+
+    assert recorded == [[1, 6], [2, 6]]
+    history = PriceHistory(tmp_path / "history.sqlite")
+    assert history.runs()[0]['items'] == 12
+    history.close()
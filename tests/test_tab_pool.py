@@ -0,0 +1,145 @@
+# tests/test_tab_pool.py
+import asyncio
+
+from scrapy.http import HtmlResponse
+
+from ecommerce_scraper.pagination_strategies import create_strategy
+from ecommerce_scraper.spiders.laptops import LaptopsSpider, next_page
+from ecommerce_scraper.tab_pool import TabPool
+
+PAGINATION_HTML = """
+<ul class="pagination">
+  <button class="btn page-link">1</button>
+  <button class="btn page-link">6</button>
+  <button class="btn page-link next">Next &gt;</button>
+</ul>
+"""
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, kind):
+        self.driver.handles += 1
+        self.driver.current_window_handle = f"tab-{self.driver.handles}"
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Session Chrome factice: seuls les onglets sont simulés"""
+
+    def __init__(self):
+        self.handles = 1
+        self.current_window_handle = "tab-1"
+        self.switch_to = FakeSwitch(self)
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+
+class FakeWaits:
+    """Grilles toujours prêtes: chaque transition ajax est immédiate"""
+    timeout = 5
+    poll_interval = 0
+
+    def grid_state(self, driver):
+        return {}
+
+    def grid_changed(self, state, previous):
+        return True
+
+    def wait_for_grid(self, driver, name="grid_ready"):
+        return {}
+
+    def record(self, name, elapsed, timed_out=False):
+        pass
+
+    def summary(self):
+        return {}
+
+
+def next_button_failing(after_pages, status):
+    """next_button qui renvoie `status` juste après l'une des pages données"""
+    def next_button(driver):
+        return status if driver.page in after_pages else 'clicked'
+    return next_button
+
+
+def scrape_page(page, driver, tab_id=None, **kwargs):
+    driver.page = page
+    return [{'page': page, 'title': f"Laptop {page}"}]
+
+
+def crawl(pool, first_page, last_page, next_button):
+    """Pages produites par le pool et valeur de fin du générateur"""
+    pages = pool.imap_ordered(first_page, last_page, lambda *args: True, scrape_page, next_button)
+    produced = []
+    while True:
+        result, end = next_page(pages)
+        if result is None:
+            return produced, end
+        produced.append(result[0])
+
+
+def test_next_failure_in_middle_tab_is_a_gap_not_the_end():
+    pool = TabPool(FakeDriver(), 2, FakeWaits())
+
+    produced, end = crawl(pool, 1, 6, next_button_failing({1}, 'error'))
+
+    assert produced == [1, 4, 5, 6]
+    assert not end
+    assert not pool.end_of_pagination
+
+
+def test_disabled_next_in_middle_tab_is_not_the_end():
+    pool = TabPool(FakeDriver(), 2, FakeWaits())
+
+    produced, end = crawl(pool, 1, 6, next_button_failing({2}, 'disabled'))
+
+    assert produced == [1, 2, 4, 5, 6]
+    assert not end
+    assert not pool.end_of_pagination
+
+
+def test_disabled_next_in_last_tab_ends_the_listing():
+    pool = TabPool(FakeDriver(), 2, FakeWaits())
+
+    produced, end = crawl(pool, 1, 6, next_button_failing({5}, 'disabled'))
+
+    assert produced == [1, 2, 3, 4, 5]
+    assert end
+    assert pool.end_of_pagination
+
+
+class InlineThreads:
+    """Remplace BrowserThreads: appels exécutés directement"""
+
+    async def call(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def stop(self):
+        pass
+
+
+def test_spider_keeps_checkpoint_after_next_failure_mid_range(tmp_path):
+    spider = LaptopsSpider(output_dir=str(tmp_path), tabs=2, workers=1, prefetch=False, extraction='js')
+    spider.driver = FakeDriver()
+    spider.browser_threads = InlineThreads()
+    spider.waits = FakeWaits()
+    spider.pagination = create_strategy('buttons', spider.start_url, spider.waits)
+    spider.pagination.next_button = next_button_failing({1}, 'missing')
+    spider.open_listing = lambda driver, page, prefix="": True
+    spider.scrape_page = scrape_page
+    response = HtmlResponse(spider.start_url, body=PAGINATION_HTML, encoding='utf-8')
+
+    async def collect():
+        return [item async for item in spider.parse_all_pages(response)]
+
+    items = asyncio.run(collect())
+
+    assert [item['page'] for item in items] == [1]
+    assert not spider.reached_end
+    assert spider.checkpoint.load()['last_page'] == 1